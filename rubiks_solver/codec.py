@@ -0,0 +1,248 @@
+import struct
+
+from rubiks_solver.cube import Cube, SOLVED_COLORS, FACE_OFFSET
+
+# Face order of the standard facelet string (each face row by row, as laid out in `Cube.faces`)
+FACELET_ORDER = ("U", "R", "F", "D", "L", "B")
+# Facelet string letter of every color
+FACE_OF_COLOR = {color: face for face, color in SOLVED_COLORS.items()}
+
+# Corner and edge slots: stickers (face, facelet 1-9) clockwise, starting on the U/D face
+# (edges: on the U/D face, or on F/B for the middle layer)
+CORNER_SLOTS = (
+    (("U", 9), ("R", 1), ("F", 3)), (("U", 7), ("F", 1), ("L", 3)),
+    (("U", 1), ("L", 1), ("B", 3)), (("U", 3), ("B", 1), ("R", 3)),
+    (("D", 3), ("F", 9), ("R", 7)), (("D", 1), ("L", 9), ("F", 7)),
+    (("D", 7), ("B", 9), ("L", 7)), (("D", 9), ("R", 9), ("B", 7)),
+)
+EDGE_SLOTS = (
+    (("U", 6), ("R", 2)), (("U", 8), ("F", 2)), (("U", 4), ("L", 2)), (("U", 2), ("B", 2)),
+    (("D", 6), ("R", 8)), (("D", 2), ("F", 8)), (("D", 4), ("L", 8)), (("D", 8), ("B", 8)),
+    (("F", 6), ("R", 4)), (("F", 4), ("L", 6)), (("B", 6), ("L", 4)), (("B", 4), ("R", 6)),
+)
+# Bytes of a packed state: one per corner (cubie * 3 + twist), one per edge (cubie * 2 + flip)
+STATE_SIZE = len(CORNER_SLOTS) + len(EDGE_SLOTS)
+MAGIC = b"RCST"
+# number of states
+_HEADER = struct.Struct("<I")
+
+
+def _slot_indices(slots: tuple) -> tuple[tuple[int, ...], ...]:
+    """Flat sticker indices (`STICKERS` order) of every slot."""
+    return tuple(tuple(FACE_OFFSET[face] + n - 1 for face, n in slot) for slot in slots)
+
+
+def _slot_colors(slots: tuple) -> tuple[tuple[str, ...], ...]:
+    """Colors of the cubie solved in every slot."""
+    return tuple(tuple(SOLVED_COLORS[face] for face, _ in slot) for slot in slots)
+
+
+_CORNER_INDICES = _slot_indices(CORNER_SLOTS)
+_EDGE_INDICES = _slot_indices(EDGE_SLOTS)
+_FACELET_INDICES = tuple(FACE_OFFSET[face] + i for face in FACELET_ORDER for i in range(9))
+_CENTER_INDICES = {face: FACE_OFFSET[face] + 4 for face in SOLVED_COLORS}
+
+
+def _codes(slots: tuple) -> dict[tuple[str, ...], int]:
+    """
+    Code of every (cubie, orientation) by the colors seen in a slot's stickers: the cubie
+    rotated by `orientation` steps, so its first color lies on sticker `orientation`.
+    """
+    codes = {}
+    size = len(slots[0])
+    for cubie, colors in enumerate(_slot_colors(slots)):
+        for orientation in range(size):
+            seen = colors[-orientation:] + colors[:-orientation] if orientation else colors
+            codes[seen] = cubie * size + orientation
+    return codes
+
+
+_CORNER_CODES = _codes(CORNER_SLOTS)
+_EDGE_CODES = _codes(EDGE_SLOTS)
+# Code -> colors seen in the slot (inverse of the tables above)
+_CORNER_COLORS = {code: colors for colors, code in _CORNER_CODES.items()}
+_EDGE_COLORS = {code: colors for colors, code in _EDGE_CODES.items()}
+_SOLVED_CENTERS = [(index, SOLVED_COLORS[face]) for face, index in _CENTER_INDICES.items()]
+# Decoded cubes start as copies of this one (cheaper than `Cube()`)
+_BLANK = Cube()
+
+
+# ----------- Facelet strings -----------
+
+def to_facelets(cube) -> str:
+    """
+    Standard 54-character facelet string: faces U, R, F, D, L, B, each row by row, every
+    sticker written as the face its color belongs to in the solved cube (e.g. "UUUUUUUUURRR...").
+    """
+    stickers = cube.to_list()
+    return "".join(FACE_OF_COLOR[stickers[i]] for i in _FACELET_INDICES)
+
+
+def from_facelets(facelets: str, validate: bool = True) -> Cube:
+    """
+    Build a cube from a facelet string (see `to_facelets`).
+
+    Raises:
+        ValueError: If the string is malformed, or (with `validate`) the state is not solvable.
+    """
+    if len(facelets) != 54:
+        raise ValueError(f"A facelet string has 54 characters, got {len(facelets)}")
+    stickers = [None] * 54
+    for index, face in zip(_FACELET_INDICES, facelets):
+        if face not in SOLVED_COLORS:
+            raise ValueError(f"Unknown face letter in facelet string: {face}")
+        stickers[index] = SOLVED_COLORS[face]
+    cube = _BLANK.copy()
+    cube._load(stickers)
+    if validate:
+        validate_state(cube)
+    return cube
+
+
+# ----------- Cubie encoding and solvability -----------
+
+def _cubie_codes(stickers: list[str]) -> tuple[list[int], list[int]]:
+    """Corner and edge codes of an oriented state, raising ValueError for impossible cubies."""
+    try:
+        corners = [_CORNER_CODES[tuple(stickers[i] for i in slot)] for slot in _CORNER_INDICES]
+        edges = [_EDGE_CODES[tuple(stickers[i] for i in slot)] for slot in _EDGE_INDICES]
+    except KeyError as error:
+        raise ValueError(f"Impossible cubie colors: {error.args[0]}") from None
+    return corners, edges
+
+
+def _oriented_stickers(cube) -> list[str]:
+    """Stickers of `cube` rotated so its centers match the solved cube."""
+    if cube.faces["U"][1][1] != SOLVED_COLORS["U"] or cube.faces["F"][1][1] != SOLVED_COLORS["F"]:
+        cube = cube.copy()
+        cube.normalize_orientation()
+    stickers = cube.to_list()
+    if any(stickers[index] != color for index, color in _SOLVED_CENTERS):
+        raise ValueError("Centers do not follow the solved color scheme")
+    return stickers
+
+
+def _parity(permutation: list[int]) -> int:
+    """Parity (0 even, 1 odd) of a permutation, counted by its cycles."""
+    seen = [False] * len(permutation)
+    parity = 0
+    for start in range(len(permutation)):
+        length = 0
+        i = start
+        while not seen[i]:
+            seen[i] = True
+            i = permutation[i]
+            length += 1
+        if length:
+            parity ^= (length - 1) & 1
+    return parity
+
+
+def validate_state(cube):
+    """
+    Check that `cube` can be solved with face turns.
+
+    Every corner and edge must appear exactly once, the corner twists must sum to a
+    multiple of 3, the edge flips must sum to an even number, and corner and edge
+    permutations must have the same parity.
+
+    Raises:
+        ValueError: Describing the first failed check.
+    """
+    corners, edges = _cubie_codes(_oriented_stickers(cube))
+    corner_cubies = [code // 3 for code in corners]
+    edge_cubies = [code // 2 for code in edges]
+    if len(set(corner_cubies)) != len(corners) or len(set(edge_cubies)) != len(edges):
+        raise ValueError("A corner or edge appears more than once")
+    if sum(code % 3 for code in corners) % 3:
+        raise ValueError("Corner twists do not sum to a multiple of 3 (twisted corner)")
+    if sum(code % 2 for code in edges) % 2:
+        raise ValueError("Edge flips do not sum to an even number (flipped edge)")
+    if _parity(corner_cubies) != _parity(edge_cubies):
+        raise ValueError("Corner and edge permutation parities differ (swapped pieces)")
+
+
+def is_solvable(cube) -> bool:
+    """True if `cube` passes `validate_state`."""
+    try:
+        validate_state(cube)
+    except ValueError:
+        return False
+    return True
+
+
+def pack(cube) -> bytes:
+    """
+    Encode the state in `STATE_SIZE` (20) bytes: per corner slot its cubie and twist, per
+    edge slot its cubie and flip.
+
+    The cube is rotated to the solved orientation first, so the code identifies the state up
+    to whole-cube rotations (the same code for every orientation of a cube).
+    """
+    corners, edges = _cubie_codes(_oriented_stickers(cube))
+    return bytes(corners + edges)
+
+
+def unpack(data) -> Cube:
+    """Decode a state packed by `pack` (in the solved orientation)."""
+    cube = _BLANK.copy()
+    cube._load(_unpacked_stickers(data))
+    return cube
+
+
+def _unpacked_stickers(data) -> list[str]:
+    """Flat stickers (`STICKERS` order) of a packed state."""
+    if len(data) != STATE_SIZE:
+        raise ValueError(f"A packed state has {STATE_SIZE} bytes, got {len(data)}")
+    stickers = [None] * 54
+    for index, color in _SOLVED_CENTERS:
+        stickers[index] = color
+    try:
+        for slot, code in zip(_CORNER_INDICES, data[:8]):
+            for i, color in zip(slot, _CORNER_COLORS[code]):
+                stickers[i] = color
+        for slot, code in zip(_EDGE_INDICES, data[8:]):
+            for i, color in zip(slot, _EDGE_COLORS[code]):
+                stickers[i] = color
+    except KeyError as error:
+        raise ValueError(f"Invalid cubie code: {error.args[0]}") from None
+    return stickers
+
+
+# ----------- Bulk encoding -----------
+
+def pack_many(cubes) -> bytes:
+    """Pack many cubes into one buffer of `STATE_SIZE` bytes per cube."""
+    return b"".join(pack(cube) for cube in cubes)
+
+
+def unpack_many(buffer) -> list[Cube]:
+    """Decode every state of a buffer written by `pack_many` (bytes, bytearray or memoryview)."""
+    view = memoryview(buffer)
+    if len(view) % STATE_SIZE:
+        raise ValueError(f"Buffer size {len(view)} is not a multiple of {STATE_SIZE}")
+    return [unpack(view[offset:offset + STATE_SIZE]) for offset in range(0, len(view), STATE_SIZE)]
+
+
+def save_states(path: str, cubes) -> int:
+    """
+    Write packed states to a file (a header with the count, then `pack_many` data).
+
+    Returns:
+        int: Number of states written.
+    """
+    data = pack_many(cubes)
+    with open(path, "wb") as file:
+        file.write(MAGIC + _HEADER.pack(len(data) // STATE_SIZE) + data)
+    return len(data) // STATE_SIZE
+
+
+def load_states(path: str) -> list[Cube]:
+    """Read states written by `save_states`."""
+    with open(path, "rb") as file:
+        data = file.read()
+    if data[:len(MAGIC)] != MAGIC:
+        raise ValueError(f"Not a cube state file: {path}")
+    (count,) = _HEADER.unpack_from(data, len(MAGIC))
+    start = len(MAGIC) + _HEADER.size
+    return unpack_many(memoryview(data)[start:start + count * STATE_SIZE])
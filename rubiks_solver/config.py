@@ -27,6 +27,103 @@ MAX_GENERATIONS = 1000
 CROSSOVER_RATE = 0.8
 MUTATION_RATE = 0.2
 ELITE_SIZE = 2
+DUPLICATE_PENALTY = 0.5  # fitness factor for duplicate states when GASolver(duplicates="penalize")
+DUPLICATE_REPLACE_ROUNDS = 5  # attempts at a fresh, distinct individual when GASolver(duplicates="replace")
+
+# --- HYPERPARAMETER TUNING (successive halving) ---
+TUNING_SPACE = {
+    "pop_size": [50, 100, 200, 400],
+    "crossover_prob": [0.6, 0.7, 0.8, 0.9],
+    "mutation_prob": [0.1, 0.2, 0.3, 0.5],
+    "elite_size": [1, 2, 4, 8],
+    "chromosome_len": [(7, 10), (10, 20), (20, 35), (26, 50)],
+    "selection": ["roulette", "tournament", "exp_rank"],
+}
+TUNING_NUM_CONFIGS = 27
+TUNING_MIN_GENERATIONS = 20
+TUNING_MAX_GENERATIONS = 540
+TUNING_ETA = 3
+TUNING_REPEATS = 3
+
+# --- SCRAMBLE CORPUS AND THROUGHPUT BENCHMARK ---
+CORPUS_DEPTHS = [1, 2, 3, 5, 8, 12, 20]  # scramble lengths (face turns)
+CORPUS_PER_DEPTH = 20
+CORPUS_PATH = "scramble_corpus.bin"
+BENCHMARK_DEADLINE = 10.0  # time budget of each solve in seconds
+
+# --- ENDGAME TABLE (optimal tails for states near solved) ---
+ENDGAME_DEPTH = 6  # ~1M states, ~16 MB on disk, built in about 8 s with ~80 MB peak memory
+ENDGAME_PATH = "endgame_table.bin"
+
+# --- SOLUTION OPTIMIZER (post-solve shortening, see rubiks_solver.optimize) ---
+SEGMENT_DEPTH = 4  # segments equivalent to at most this many face turns are replaced optimally
+SEGMENT_WINDOW = 12  # longest segment examined
+
+# --- SOLUTION CACHE (persistent stage solutions, see rubiks_solver.cache) ---
+SOLUTION_CACHE_PATH = "solution_cache.sqlite"
+SOLUTION_CACHE_SIZE = 10000  # entries kept (least recently used are evicted)
+WARM_START_SEEDS = 10  # stored solutions of similar states put into a new population
+SIMILAR_SCAN_LIMIT = 2000  # most recently used entries of a stage searched for similar states
+
+# --- MOVE SETS (moves usable as genes, see Cube.all_moves_symbols) ---
+MOVE_SETS = {
+    "quarter_turn": ["F", "F'", "B", "B'", "L", "L'", "R", "R'", "U", "U'", "D", "D'"],
+    "face_turn": [
+        "F", "F'", "F2", "B", "B'", "B2", "L", "L'", "L2",
+        "R", "R'", "R2", "U", "U'", "U2", "D", "D'", "D2",
+    ],
+    # Slice and wide moves also move the centers (GASolver reorients cubes before scoring)
+    "extended": [
+        "F", "F'", "F2", "B", "B'", "B2", "L", "L'", "L2",
+        "R", "R'", "R2", "U", "U'", "U2", "D", "D'", "D2",
+        "M", "M'", "M2", "E", "E'", "E2", "S", "S'", "S2",
+        "Fw", "Fw'", "Fw2", "Bw", "Bw'", "Bw2", "Lw", "Lw'", "Lw2",
+        "Rw", "Rw'", "Rw2", "Uw", "Uw'", "Uw2", "Dw", "Dw'", "Dw2",
+    ],
+}
+
+# Move set used in each stage (stages not listed use quarter turns)
+STAGE_MOVE_SETS = {
+    "white_cross": "face_turn",
+    "first_layer": "face_turn",
+    "second_layer": "face_turn",
+    "full_cube": "face_turn",
+}
+
+# Chromosome length (min, max) in each stage (stages not listed use CHROMOSOME_LENGTH)
+STAGE_CHROMOSOME_LENGTH = {
+    "white_cross": (7, 10),
+    "first_layer": (20, 50),
+    "second_layer": (20, 50),
+    "full_cube": (20, 50),
+}
+
+# --- MACRO MOVES (multi-move algorithms usable as single genes) ---
+# Written for the white layer on U, so they are solved "upside down" on D.
+MACRO_LIBRARY = {
+    # Second layer edge inserts (preserve the first layer)
+    "insert_FR_via_R": ["D'", "R'", "D", "R", "D", "F", "D'", "F'"],
+    "insert_FR_via_F": ["D", "F", "D'", "F'", "D'", "R'", "D", "R"],
+    "insert_FL_via_L": ["D", "L", "D'", "L'", "D'", "F'", "D", "F"],
+    "insert_FL_via_F": ["D'", "F'", "D", "F", "D", "L", "D'", "L'"],
+    "insert_BR_via_R": ["D", "R", "D'", "R'", "D'", "B'", "D", "B"],
+    "insert_BR_via_B": ["D'", "B'", "D", "B", "D", "R", "D'", "R'"],
+    "insert_BL_via_L": ["D'", "L'", "D", "L", "D", "B", "D'", "B'"],
+    "insert_BL_via_B": ["D", "B", "D'", "B'", "D'", "L'", "D", "L"],
+    # Last layer algorithms (preserve the first two layers)
+    "cross_flip": ["B", "R", "D", "R'", "D'", "B'"],
+    "sune": ["R", "D", "R'", "D", "R", "D", "D", "R'"],
+    "t_perm": ["R", "D", "R'", "D'", "R'", "B", "R", "R", "D'", "R'", "D'", "R", "D", "R'", "B'"],
+}
+
+# Macro moves available as genes in each stage (stages not listed use basic moves only)
+STAGE_MACROS = {
+    "second_layer": [
+        "insert_FR_via_R", "insert_FR_via_F", "insert_FL_via_L", "insert_FL_via_F",
+        "insert_BR_via_R", "insert_BR_via_B", "insert_BL_via_L", "insert_BL_via_B",
+    ],
+    "full_cube": ["cross_flip", "sune", "t_perm"],
+}
 
 # --- CUBE STATES FOR STAGE APPROACH ---
 STAGES_TILES = {
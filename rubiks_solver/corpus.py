@@ -0,0 +1,200 @@
+import math
+import random
+import struct
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from rubiks_solver.cube import Cube, QUARTER_TURNS, HALF_TURNS
+from rubiks_solver.endgame import EndgameTable
+from rubiks_solver.rng import derive_seed
+from rubiks_solver.solve import solve, DEFAULT_STAGES
+
+MAGIC = b"RCSC"
+# number of bytes of the move list, number of scrambles
+_HEADER = struct.Struct("<HI")
+# Moves scrambles are drawn from (face turn metric)
+SCRAMBLE_MOVES = QUARTER_TURNS + HALF_TURNS
+# Stages solved by each benchmarked solver
+SOLVER_STAGES = {
+    "staged": DEFAULT_STAGES,
+    "end_to_end": ["full_cube"],
+}
+
+
+def random_scramble(depth: int, rng: random.Random, moves: list[str] | None = None) -> list[str]:
+    """Random scramble of `depth` moves, never turning the same face twice in a row."""
+    moves = moves if moves is not None else SCRAMBLE_MOVES
+    scramble = []
+    while len(scramble) < depth:
+        move = rng.choice(moves)
+        if not scramble or move[0] != scramble[-1][0]:
+            scramble.append(move)
+    return scramble
+
+
+def generate_corpus(depths: list[int], per_depth: int, seed: int = 0) -> list[list[str]]:
+    """
+    Generate `per_depth` scrambles at each depth.
+
+    Every scramble has its own generator derived from (`seed`, depth, index), so a corpus
+    keeps the same scrambles when depths are added or `per_depth` is increased.
+    """
+    return [
+        random_scramble(depth, random.Random(derive_seed(seed, depth, i)))
+        for depth in depths
+        for i in range(per_depth)
+    ]
+
+
+def save_corpus(path: str, scrambles: list[list[str]], moves: list[str] | None = None):
+    """
+    Write scrambles to a binary file: a header with the move list, then per scramble its
+    length and one byte per move.
+    """
+    moves = list(moves if moves is not None else SCRAMBLE_MOVES)
+    code_of = {move: code for code, move in enumerate(moves)}
+    move_list = " ".join(moves).encode()
+    with open(path, "wb") as file:
+        file.write(MAGIC + _HEADER.pack(len(move_list), len(scrambles)) + move_list)
+        for scramble in scrambles:
+            if len(scramble) > 255:
+                raise ValueError(f"Scramble longer than 255 moves: {len(scramble)}")
+            file.write(bytes([len(scramble), *(code_of[move] for move in scramble)]))
+
+
+def load_corpus(path: str) -> list[list[str]]:
+    """Read scrambles written by `save_corpus`."""
+    with open(path, "rb") as file:
+        data = file.read()
+    if data[:len(MAGIC)] != MAGIC:
+        raise ValueError(f"Not a scramble corpus: {path}")
+    moves_size, count = _HEADER.unpack_from(data, len(MAGIC))
+    offset = len(MAGIC) + _HEADER.size
+    moves = data[offset:offset + moves_size].decode().split()
+    offset += moves_size
+
+    scrambles = []
+    for _ in range(count):
+        length = data[offset]
+        scrambles.append([moves[code] for code in data[offset + 1:offset + 1 + length]])
+        offset += 1 + length
+    return scrambles
+
+
+# Endgame tables opened by this process (benchmark workers), by path
+_endgame_tables = {}
+
+
+def run_scramble(scramble: list[str], solver: str = "staged", deadline: float | None = None,
+                 eval_method: str = "cubies_position", endgame_path: str | None = None,
+                 seed: int | None = None) -> dict:
+    """
+    Solve one scramble with `solve` and measure its latency.
+
+    Args:
+        solver (str): "staged" (stages of `DEFAULT_STAGES` in order) or "end_to_end" (full cube at once).
+        deadline (float | None): Time budget of the solve in seconds.
+        endgame_path (str | None): Endgame table file used by the GA (opened once per process).
+
+    Returns:
+        dict: "depth", "solved", "time" and "solution_length" of the run.
+    """
+    if solver not in SOLVER_STAGES:
+        raise ValueError(f"Unknown solver: {solver}")
+    endgame = None
+    if endgame_path is not None:
+        if endgame_path not in _endgame_tables:
+            _endgame_tables[endgame_path] = EndgameTable(endgame_path)
+        endgame = _endgame_tables[endgame_path]
+
+    cube = Cube()
+    cube.shuffle(scramble)
+    start = time.perf_counter()
+    result = solve(cube, deadline=deadline, stages=SOLVER_STAGES[solver], eval_method=eval_method,
+                   endgame=endgame, seed=seed)
+    return {
+        "depth": len(scramble),
+        "solved": result["solved"],
+        "time": time.perf_counter() - start,
+        "solution_length": len(result["solution"]),
+    }
+
+
+def _run_scramble_args(args):
+    """Unpack arguments for `run_scramble` (process pool helper)."""
+    return run_scramble(*args)
+
+
+def percentile(values: list[float], q: float) -> float:
+    """`q`-th percentile of `values` (nearest rank)."""
+    ordered = sorted(values)
+    return ordered[max(math.ceil(q / 100 * len(ordered)), 1) - 1]
+
+
+def run_benchmark(scrambles: list[list[str]], solver: str = "staged", deadline: float | None = None,
+                  eval_method: str = "cubies_position", endgame_path: str | None = None,
+                  workers: int | None = None, seed: int = 0) -> dict:
+    """
+    Solve every scramble of a corpus on a process pool and report throughput and latency.
+
+    Each scramble gets its own seed derived from `seed`, so the benchmark is reproducible
+    apart from timing.
+
+    Returns:
+        dict: "solver", "scrambles", "solved", "wall_time", "solves_per_s" (solved scrambles
+        per second of wall time) and "depths": depth -> {"scrambles", "success_rate",
+        "solves_per_s" (per worker), "p50", "p95", "p99"} with latencies in seconds.
+    """
+    jobs = [
+        (scramble, solver, deadline, eval_method, endgame_path, derive_seed(seed, i))
+        for i, scramble in enumerate(scrambles)
+    ]
+    start = time.perf_counter()
+    if workers == 1:
+        results = [_run_scramble_args(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_run_scramble_args, jobs))
+    wall_time = time.perf_counter() - start
+
+    by_depth = {}
+    for result in results:
+        by_depth.setdefault(result["depth"], []).append(result)
+
+    depths = {}
+    for depth, runs in sorted(by_depth.items()):
+        latencies = [run["time"] for run in runs]
+        solved = sum(run["solved"] for run in runs)
+        depths[depth] = {
+            "scrambles": len(runs),
+            "success_rate": solved / len(runs),
+            "solves_per_s": solved / sum(latencies),
+            "p50": percentile(latencies, 50),
+            "p95": percentile(latencies, 95),
+            "p99": percentile(latencies, 99),
+        }
+
+    solved = sum(result["solved"] for result in results)
+    return {
+        "solver": solver,
+        "scrambles": len(results),
+        "solved": solved,
+        "wall_time": wall_time,
+        "solves_per_s": solved / wall_time,
+        "depths": depths,
+    }
+
+
+def format_benchmark(report: dict) -> str:
+    """Format a benchmark report as a table, one line per depth."""
+    lines = [
+        f"{report['solver']}: {report['solved']}/{report['scrambles']} solved in "
+        f"{report['wall_time']:.2f} s ({report['solves_per_s']:.2f} solves/s)",
+        f"{'depth':>5} {'n':>5} {'success':>8} {'solves/s':>9} {'p50 s':>8} {'p95 s':>8} {'p99 s':>8}",
+    ]
+    for depth, stats in report["depths"].items():
+        lines.append(
+            f"{depth:>5} {stats['scrambles']:>5} {stats['success_rate']:>8.2f} {stats['solves_per_s']:>9.2f} "
+            f"{stats['p50']:>8.3f} {stats['p95']:>8.3f} {stats['p99']:>8.3f}"
+        )
+    return "\n".join(lines)
@@ -1,4 +1,55 @@
+import hashlib
+import itertools
 import random
+from types import MappingProxyType
+
+# Move notation: quarter turns, half turns, slice moves and wide (two-layer) moves
+QUARTER_TURNS = ["F", "F'", "B", "B'", "L", "L'", "R", "R'", "U", "U'", "D", "D'"]
+HALF_TURNS = ["F2", "B2", "L2", "R2", "U2", "D2"]
+SLICE_MOVES = ["M", "M'", "M2", "E", "E'", "E2", "S", "S'", "S2"]
+WIDE_MOVES = [f"{face}w{suffix}" for face in "FBLRUD" for suffix in ("", "'", "2")]
+# Whole-cube rotations (x follows R, y follows U, z follows F)
+ROTATIONS = [f"{axis}{suffix}" for axis in "xyz" for suffix in ("", "'", "2")]
+
+# Colors of the solved cube; every target state assumes this orientation
+SOLVED_COLORS = {
+    'U': 'W',  # White
+    'D': 'Y',  # Yellow
+    'F': 'G',  # Green
+    'B': 'B',  # Blue
+    'L': 'O',  # Orange
+    'R': 'R',  # Red
+}
+
+# Fixed sticker order used by the flat state and permutation representation
+FACE_ORDER = ("U", "D", "F", "B", "L", "R")
+STICKERS = tuple((face, r, c) for face in FACE_ORDER for r in range(3) for c in range(3))
+FACE_OFFSET = {face: 9 * i for i, face in enumerate(FACE_ORDER)}
+# Process-wide version counter: no two cube states (of any cubes) share a `Cube.version`
+_next_version = itertools.count(1).__next__
+
+
+class _ZobristKeys(dict):
+    """
+    Random 64-bit keys of one sticker position, one per tile value.
+
+    Keys are derived by hashing (position, tile), so they are identical in every process
+    and stable across runs (state hashes can be stored on disk).
+    """
+
+    def __init__(self, index: int):
+        super().__init__()
+        self.index = index
+
+    def __missing__(self, tile) -> int:
+        digest = hashlib.blake2b(f"{self.index}:{tile}".encode(), digest_size=8).digest()
+        key = self[tile] = int.from_bytes(digest, "little")
+        return key
+
+
+# Zobrist keys: ZOBRIST_KEYS[sticker index][tile]
+ZOBRIST_KEYS = tuple(_ZobristKeys(i) for i in range(len(STICKERS)))
+
 
 class Cube:
     """
@@ -16,123 +67,121 @@ class Cube:
       │___│___│___│/
     """
 
-    def __init__(self):
-        """Initialize solved cube state and move definitions."""
-        self._init_faces()
-        
-        # Mapping of how face rows/cols shift during each move
-        self.moves = {
-            "F": [
-                ('U', 2, 'row', 0),
-                ('R', 0, 'col', 1),
-                ('D', 0, 'row', 0),
-                ('L', 2, 'col', 1),
-            ],
-            "B": [
-                ('U', 0, 'row', 1),
-                ('L', 0, 'col', 0),
-                ('D', 2, 'row', 1),
-                ('R', 2, 'col', 0)                
-            ],
-            "R": [
-                ('F', 2, 'col', 0),
-                ('U', 2, 'col', 1),
-                ('B', 0, 'col', 1),
-                ('D', 2, 'col', 0),
-            ],
-            "L": [
-                ('F', 0, 'col', 0),
-                ('D', 0, 'col', 1),
-                ('B', 2, 'col', 1),
-                ('U', 0, 'col', 0),
-            ],
-            "U": [
-                ('F', 0, 'row', 0),
-                ('L', 0, 'row', 0),
-                ('B', 0, 'row', 0),
-                ('R', 0, 'row', 0),
-            ],
-            "D": [
-                ('F', 2, 'row', 0),
-                ('R', 2, 'row', 0),
-                ('B', 2, 'row', 0),
-                ('L', 2, 'row', 0),                                                
-            ]
-        }
-    
-        self.all_moves_symbols = ["F", "F'", "B", "B'", "L", "L'", "R", "R'", "U", "U'", "D", "D'"]
-
-        # Map move notation to bound methods
-        self.move_funcs = {
-            "F": self.F, "F'": self.F_,
-            "B": self.B, "B'": self.B_,
-            "L": self.L, "L'": self.L_,
-            "R": self.R, "R'": self.R_,
-            "U": self.U, "U'": self.U_,
-            "D": self.D, "D'": self.D_,
-        }
+    # Move, corner and edge definitions are immutable tables shared by all cubes, so creating
+    # and copying a cube only builds its faces.
 
-        # Opposite moves, useful for inverse operations
-        self.opposite_move = {
-            "F": "F'", "F'": "F",
-            "B": "B'", "B'": "B",
-            "L": "L'", "L'": "L",
-            "R": "R'", "R'": "R",
-            "U": "U'", "U'": "U",
-            "D": "D'", "D'": "D",
-        }
+    # Mapping of how face rows/cols shift during each move
+    moves = MappingProxyType({
+        "F": (
+            ('U', 2, 'row', 0),
+            ('R', 0, 'col', 1),
+            ('D', 0, 'row', 0),
+            ('L', 2, 'col', 1),
+        ),
+        "B": (
+            ('U', 0, 'row', 1),
+            ('L', 0, 'col', 0),
+            ('D', 2, 'row', 1),
+            ('R', 2, 'col', 0),
+        ),
+        "R": (
+            ('F', 2, 'col', 0),
+            ('U', 2, 'col', 1),
+            ('B', 0, 'col', 1),
+            ('D', 2, 'col', 0),
+        ),
+        "L": (
+            ('F', 0, 'col', 0),
+            ('D', 0, 'col', 1),
+            ('B', 2, 'col', 1),
+            ('U', 0, 'col', 0),
+        ),
+        "U": (
+            ('F', 0, 'row', 0),
+            ('L', 0, 'row', 0),
+            ('B', 0, 'row', 0),
+            ('R', 0, 'row', 0),
+        ),
+        "D": (
+            ('F', 2, 'row', 0),
+            ('R', 2, 'row', 0),
+            ('B', 2, 'row', 0),
+            ('L', 2, 'row', 0),
+        ),
+    })
 
-        # Corner stickers: cubelet name -> list of (face, row, col)
-        self.corners = {
-            "FLU": [("F", 0, 0), ("L", 0, 2), ("U", 2, 0)],
-            "FRU": [("F", 0, 2), ("R", 0, 0), ("U", 2, 2)],
-            "FLD": [("F", 2, 0), ("L", 2, 2), ("D", 0, 0)],
-            "FRD": [("F", 2, 2), ("R", 2, 0), ("D", 0, 2)],
-            "BLU": [("B", 0, 2), ("L", 0, 0), ("U", 0, 0)],
-            "BRU": [("B", 0, 0), ("R", 0, 2), ("U", 0, 2)],
-            "BLD": [("B", 2, 2), ("L", 2, 0), ("D", 2, 0)],
-            "BRD": [("B", 2, 0), ("R", 2, 2), ("D", 2, 2)],
-        }
+    # Every supported move, and the 12 quarter turns (default for random shuffles and GA genes)
+    all_moves_symbols = tuple(QUARTER_TURNS + HALF_TURNS + SLICE_MOVES + WIDE_MOVES)
+    quarter_turn_symbols = tuple(QUARTER_TURNS)
 
-        # Edge stickers: cubelet name -> list of (face, row, col)
-        self.edges = {
-            "FU": [("F", 0, 1), ("U", 2, 1)],
-            "FR": [("F", 1, 2), ("R", 1, 0)],
-            "FD": [("F", 2, 1), ("D", 0, 1)],
-            "FL": [("F", 1, 0), ("L", 1, 2)],
-            "BU": [("B", 0, 1), ("U", 0, 1)],
-            "BR": [("B", 1, 0), ("R", 1, 2)],
-            "BD": [("B", 2, 1), ("D", 2, 1)],
-            "BL": [("B", 1, 2), ("L", 1, 0)],
-            "RU": [("R", 0, 1), ("U", 1, 2)],
-            "RD": [("R", 2, 1), ("D", 1, 2)],
-            "LU": [("L", 0, 1), ("U", 1, 0)],
-            "LD": [("L", 2, 1), ("D", 1, 0)],
-        }
+    # Opposite moves and rotations, useful for inverse operations (half turns are their own inverse)
+    opposite_move = MappingProxyType({
+        move: move if move.endswith("2") else move[:-1] if move.endswith("'") else move + "'"
+        for move in all_moves_symbols + tuple(ROTATIONS)
+    })
+
+    # Corner stickers: cubelet name -> tuple of (face, row, col)
+    corners = MappingProxyType({
+        "FLU": (("F", 0, 0), ("L", 0, 2), ("U", 2, 0)),
+        "FRU": (("F", 0, 2), ("R", 0, 0), ("U", 2, 2)),
+        "FLD": (("F", 2, 0), ("L", 2, 2), ("D", 0, 0)),
+        "FRD": (("F", 2, 2), ("R", 2, 0), ("D", 0, 2)),
+        "BLU": (("B", 0, 2), ("L", 0, 0), ("U", 0, 0)),
+        "BRU": (("B", 0, 0), ("R", 0, 2), ("U", 0, 2)),
+        "BLD": (("B", 2, 2), ("L", 2, 0), ("D", 2, 0)),
+        "BRD": (("B", 2, 0), ("R", 2, 2), ("D", 2, 2)),
+    })
+
+    # Edge stickers: cubelet name -> tuple of (face, row, col)
+    edges = MappingProxyType({
+        "FU": (("F", 0, 1), ("U", 2, 1)),
+        "FR": (("F", 1, 2), ("R", 1, 0)),
+        "FD": (("F", 2, 1), ("D", 0, 1)),
+        "FL": (("F", 1, 0), ("L", 1, 2)),
+        "BU": (("B", 0, 1), ("U", 0, 1)),
+        "BR": (("B", 1, 0), ("R", 1, 2)),
+        "BD": (("B", 2, 1), ("D", 2, 1)),
+        "BL": (("B", 1, 2), ("L", 1, 0)),
+        "RU": (("R", 0, 1), ("U", 1, 2)),
+        "RD": (("R", 2, 1), ("D", 1, 2)),
+        "LU": (("L", 0, 1), ("U", 1, 0)),
+        "LD": (("L", 2, 1), ("D", 1, 0)),
+    })
+
+    def __init__(self):
+        """Initialize solved cube state."""
+        # Renewed on every state change, so observers (e.g. the renderer) can skip work
+        self.version = _next_version()
+        # 64-bit Zobrist hash of the state, updated incrementally by every move
+        self.state_hash = 0
+        self._init_faces()
+        # Macro moves: name -> (move sequence, precompiled sticker permutation, sparse changes)
+        self.macros = {}
 
     def _init_faces(self):
         """Reset cube faces to solved state."""
-        self.faces = {
-            'U': [['W']*3 for _ in range(3)],  # White
-            'D': [['Y']*3 for _ in range(3)],  # Yellow
-            'F': [['G']*3 for _ in range(3)],  # Green
-            'B': [['B']*3 for _ in range(3)],  # Blue
-            'L': [['O']*3 for _ in range(3)],  # Orange
-            'R': [['R']*3 for _ in range(3)],  # Red
-        }
+        self.version = _next_version()
+        self.faces = {face: [[color]*3 for _ in range(3)] for face, color in SOLVED_COLORS.items()}
+        self._rehash()
         
     def _rotate_face_cw(self, face_name: str, times: int = 1):
         """Rotate face clockwise by 90° * times."""
+        self.version = _next_version()
         for _ in range(times):
             self.faces[face_name] = [list(row) for row in zip(*self.faces[face_name][::-1])]
     
     def _rotate_face_ccw(self, face_name: str, times: int = 1):
         """Rotate face counter-clockwise by 90° * times."""
+        self.version = _next_version()
         for _ in range(times):
             self.faces[face_name] = [list(row) for row in zip(*self.faces[face_name])][::-1]
     
     def _cycle(self, move_name: str):
-        """Cycle stickers between adjacent faces for a given move (without rotating the face itself)."""
+        """
+        Cycle stickers between adjacent faces for a given move (without rotating the face itself).
+
+        Only used to derive `MOVE_PERMUTATIONS`; moves are applied from the precompiled tables.
+        """
         move = self.moves[move_name]
         
         # Extract rows/cols
@@ -159,81 +208,310 @@ class Cube:
             else:
                 for r in range(3):
                     self.faces[face_name][r][idx] = part[r]
+
+    # ----------- Zobrist hashing -----------
+
+    def _rehash(self):
+        """Recompute `state_hash` from scratch (after bulk state changes)."""
+        state_hash = 0
+        for keys, tile in zip(ZOBRIST_KEYS, self.to_list()):
+            state_hash ^= keys[tile]
+        self.state_hash = state_hash
+
+    def _apply_changes(self, changes: tuple):
+        """
+        Apply a sparse sticker permutation (see `_sparse_changes`) in a single pass,
+        toggling only the Zobrist keys of the stickers that change.
+        """
+        sources, destinations, keys = changes
+        faces = self.faces
+        tiles = [faces[f][r][c] for f, r, c in sources]
+        state_hash = self.state_hash
+        for (f, r, c), key, tile in zip(destinations, keys, tiles):
+            row = faces[f][r]
+            state_hash ^= key[row[c]] ^ key[tile]
+            row[c] = tile
+        self.state_hash = state_hash
+        self.version = _next_version()
+
+    def state_key(self) -> str:
+        """Compact hashable snapshot of the state: one character per sticker in `STICKERS` order."""
+        return "".join(self.to_list())
     
     def reset(self):
         """Reset cube to solved state."""
         self._init_faces()
 
-    def shuffle(self, sequence: list[str] | None = None, lenght: int = 26) -> list[str]:
+    def shuffle(self, sequence: list[str] | None = None, lenght: int = 26, moves: list[str] | None = None) -> list[str]:
         """
         Apply a sequence of moves to the cube.
 
         Args:
             sequence (list[str] | None): List of moves in standard notation. If None, a random sequence is generated.
             lenght (int): Length of random shuffle sequence.
+            moves (list[str] | None): Moves a random sequence is drawn from (default: quarter turns).
 
         Returns:
             list[str]: The sequence of moves that was applied.
         """
         if sequence is None:
-            sequence = [random.choice(self.all_moves_symbols) for _ in range(lenght)]
+            sequence = [random.choice(moves or self.quarter_turn_symbols) for _ in range(lenght)]
         
         for move in sequence:
-            self.move_funcs[move]()
+            changes = MOVE_CHANGES.get(move)
+            if changes is None:
+                changes = self.macros[move][2]
+            self._apply_changes(changes)
 
         return sequence
     
     def copy(self) -> "Cube":
-        """Return a deep copy of the cube state."""
-        new_cube = Cube()
+        """Return a deep copy of the cube state (without running `__init__`)."""
+        new_cube = Cube.__new__(Cube)
+        new_cube.version = _next_version()
         new_cube.faces = {face: [row[:] for row in grid] for face, grid in self.faces.items()}
+        new_cube.state_hash = self.state_hash
+        new_cube.macros = dict(self.macros)
         return new_cube
+
+    def copy_from(self, other: "Cube"):
+        """
+        Overwrite the state with the state of `other` in place, row by row, so a scratch cube
+        can be reset without allocating. Macros are shared with `other`, not copied.
+        """
+        faces = self.faces
+        for face, grid in other.faces.items():
+            rows = faces[face]
+            rows[0][:] = grid[0]
+            rows[1][:] = grid[1]
+            rows[2][:] = grid[2]
+        self.state_hash = other.state_hash
+        self.macros = other.macros
+        self.version = _next_version()
+
+    # ----------- Flat state, permutations and macro moves -----------
+
+    def to_list(self) -> list[str]:
+        """Return the stickers as a flat list in `STICKERS` order."""
+        return [tile for face in FACE_ORDER for row in self.faces[face] for tile in row]
+
+    def _load(self, stickers: list[str]):
+        """Set faces from a flat list of stickers in `STICKERS` order."""
+        self.version = _next_version()
+        self.faces = {
+            face: [list(stickers[k:k + 3]) for k in range(9 * i, 9 * i + 9, 3)]
+            for i, face in enumerate(FACE_ORDER)
+        }
+        self._rehash()
+
+    @staticmethod
+    def compile_sequence(sequence: list[str]) -> tuple[int, ...]:
+        """
+        Precompile a sequence of basic moves into a single sticker permutation.
+
+        Returns:
+            tuple[int, ...]: `perm` such that sticker `i` after the sequence is sticker `perm[i]` before it.
+        """
+        return _compose(*(MOVE_PERMUTATIONS[move] for move in sequence))
+
+    def apply_permutation(self, permutation: tuple[int, ...]):
+        """Apply a precompiled sticker permutation (see `compile_sequence`)."""
+        self._apply_changes(_sparse_changes(permutation))
+
+    def add_macro(self, name: str, sequence: list[str]):
+        """Register a named algorithm that can be used like a single move in `shuffle`."""
+        if name in MOVE_PERMUTATIONS:
+            raise ValueError(f"Macro name collides with a basic move: {name}")
+        permutation = Cube.compile_sequence(sequence)
+        self.macros[name] = (list(sequence), permutation, _sparse_changes(permutation))
+
+    def expand_macros(self, sequence: list[str]) -> list[str]:
+        """Replace macro moves in `sequence` by the basic moves they stand for."""
+        expanded = []
+        for move in sequence:
+            if move in self.macros:
+                expanded.extend(self.macros[move][0])
+            else:
+                expanded.append(move)
+        return expanded
     
     # ----------- Rotations of the entire cube (reorientations) -----------
 
     def rotate_x(self):
         """Rotate cube around X axis (R-L axis)."""
-        U, F, D, B = self.faces['U'], self.faces['F'], self.faces['D'], self.faces['B']
-        self.faces['U'], self.faces['F'], self.faces['D'], self.faces['B'] = F, D, B, U
-        self._rotate_face_cw('B', times=2)
-        self._rotate_face_cw('D', times=2)
-        self._rotate_face_cw('R')
-        self._rotate_face_ccw('L')
+        self._apply_changes(MOVE_CHANGES["x"])
 
     def rotate_y(self):
         """Rotate cube around Y axis (U-D axis)."""
-        F, L, B, R = self.faces['F'], self.faces['L'], self.faces['B'], self.faces['R']
-        self.faces['F'], self.faces['L'], self.faces['B'], self.faces['R'] = R, F, L, B
-        self._rotate_face_cw('U')
-        self._rotate_face_ccw('D')
+        self._apply_changes(MOVE_CHANGES["y"])
 
     def rotate_z(self):
         """Rotate cube around Z axis (F-B axis)."""
-        U, R, D, L = self.faces['U'], self.faces['R'], self.faces['D'], self.faces['L']
-        self.faces['U'], self.faces['R'], self.faces['D'], self.faces['L'] = L, U, R, D
-        self._rotate_face_cw('R')
-        self._rotate_face_cw('D')
-        self._rotate_face_cw('L')
-        self._rotate_face_cw('U')
-        self._rotate_face_cw('F')
-        self._rotate_face_ccw('B')
-    
+        self._apply_changes(MOVE_CHANGES["z"])
+
+    def normalize_orientation(self) -> list[str]:
+        """
+        Rotate the whole cube so its centers match the solved cube (`SOLVED_COLORS`).
+
+        Returns:
+            list[str]: The rotations applied (empty if the cube was already oriented, or its
+            centers do not follow the solved color scheme).
+        """
+        faces = self.faces
+        if faces['U'][1][1] == SOLVED_COLORS['U'] and faces['F'][1][1] == SOLVED_COLORS['F']:
+            return []
+        center_faces = {faces[face][1][1]: face for face in FACE_ORDER}
+        orientation = ORIENTATIONS.get(
+            (center_faces.get(SOLVED_COLORS['U']), center_faces.get(SOLVED_COLORS['F']))
+        )
+        if orientation is None:
+            return []
+        rotations, changes = orientation
+        self._apply_changes(changes)
+        return list(rotations)
+
     # ----------- Face moves (standard Rubik's notation) -----------
 
-    def F(self): self._cycle('F'); self._rotate_face_cw('F')
-    def F_(self): [self._cycle('F') for _ in range(3)]; self._rotate_face_ccw('F')
+    def F(self): self._apply_changes(MOVE_CHANGES["F"])
+    def F_(self): self._apply_changes(MOVE_CHANGES["F'"])
+
+    def B(self): self._apply_changes(MOVE_CHANGES["B"])
+    def B_(self): self._apply_changes(MOVE_CHANGES["B'"])
+
+    def R(self): self._apply_changes(MOVE_CHANGES["R"])
+    def R_(self): self._apply_changes(MOVE_CHANGES["R'"])
+
+    def L(self): self._apply_changes(MOVE_CHANGES["L"])
+    def L_(self): self._apply_changes(MOVE_CHANGES["L'"])
+
+    def U(self): self._apply_changes(MOVE_CHANGES["U"])
+    def U_(self): self._apply_changes(MOVE_CHANGES["U'"])
+
+    def D(self): self._apply_changes(MOVE_CHANGES["D"])
+    def D_(self): self._apply_changes(MOVE_CHANGES["D'"])
+
+
+# ----------- Precompiled move tables -----------
+
+def _compose(*permutations: tuple[int, ...]) -> tuple[int, ...]:
+    """Single permutation equal to applying `permutations` one after another."""
+    result = tuple(range(len(STICKERS)))
+    for permutation in permutations:
+        result = tuple(result[i] for i in permutation)
+    return result
+
 
-    def B(self): self._cycle('B'); self._rotate_face_cw('B')
-    def B_(self): [self._cycle('B') for _ in range(3)]; self._rotate_face_ccw('B')
+def _invert(permutation: tuple[int, ...]) -> tuple[int, ...]:
+    """Inverse of a sticker permutation."""
+    inverse = [0] * len(permutation)
+    for i, source in enumerate(permutation):
+        inverse[source] = i
+    return tuple(inverse)
 
-    def R(self): self._cycle('R'); self._rotate_face_cw('R')
-    def R_(self): [self._cycle('R') for _ in range(3)]; self._rotate_face_ccw('R')
 
-    def L(self): self._cycle('L'); self._rotate_face_cw('L')
-    def L_(self): [self._cycle('L') for _ in range(3)]; self._rotate_face_ccw('L')
+def _sparse_changes(permutation: tuple[int, ...]) -> tuple:
+    """
+    Only the stickers a permutation moves, as (sources, destinations, Zobrist keys of destinations)
+    with positions given as (face, row, col).
+    """
+    moved = [i for i, source in enumerate(permutation) if source != i]
+    return (
+        tuple(STICKERS[permutation[i]] for i in moved),
+        tuple(STICKERS[i] for i in moved),
+        tuple(ZOBRIST_KEYS[i] for i in moved),
+    )
+
+
+def _derive_permutation(action) -> tuple[int, ...]:
+    """Run `action` on a cube whose stickers are labeled by index and read back the permutation."""
+    cube = Cube()
+    cube.faces = {face: [[FACE_OFFSET[face] + 3 * r + c for c in range(3)] for r in range(3)] for face in FACE_ORDER}
+    action(cube)
+    return tuple(cube.to_list())
+
+
+# Whole-cube rotations: face -> face whose stickers it takes over, then face turns (+cw / -ccw)
+_ROTATION_FACES = {
+    "x": ({'U': 'F', 'F': 'D', 'D': 'B', 'B': 'U'}, {'B': 2, 'D': 2, 'R': 1, 'L': -1}),
+    "y": ({'F': 'R', 'L': 'F', 'B': 'L', 'R': 'B'}, {'U': 1, 'D': -1}),
+    "z": ({'U': 'L', 'R': 'U', 'D': 'R', 'L': 'D'}, {'R': 1, 'D': 1, 'L': 1, 'U': 1, 'F': 1, 'B': -1}),
+}
+
+
+def _rotate_faces(cube, axis: str):
+    """Rotate the whole cube by moving and turning its faces (used to derive the rotation tables)."""
+    takes, turns = _ROTATION_FACES[axis]
+    cube.faces.update({face: cube.faces[source] for face, source in takes.items()})
+    for face, times in turns.items():
+        if times > 0:
+            cube._rotate_face_cw(face, times)
+        else:
+            cube._rotate_face_ccw(face, -times)
+
+
+def _build_move_permutations() -> dict[str, tuple[int, ...]]:
+    """
+    Derive the permutation of every move in `Cube.all_moves_symbols` and of every rotation.
+
+    Face turns come from the row/col cycles in `Cube.moves`. Slices follow from whole-cube
+    rotations (x = R M' L', y = U E' D', z = F S B'), and wide moves are a face turn plus
+    the adjacent slice.
+    """
+    def turn(face):
+        return _derive_permutation(lambda cube: (cube._cycle(face), cube._rotate_face_cw(face)))
+
+    base = {face: turn(face) for face in "FBLRUD"}
+    x = base["x"] = _derive_permutation(lambda cube: _rotate_faces(cube, "x"))
+    y = base["y"] = _derive_permutation(lambda cube: _rotate_faces(cube, "y"))
+    z = base["z"] = _derive_permutation(lambda cube: _rotate_faces(cube, "z"))
+    base["M"] = _invert(_compose(x, _invert(base["R"]), base["L"]))
+    base["E"] = _invert(_compose(y, _invert(base["U"]), base["D"]))
+    base["S"] = _compose(z, _invert(base["F"]), base["B"])
+    base["Fw"] = _compose(base["F"], base["S"])
+    base["Bw"] = _compose(base["B"], _invert(base["S"]))
+    base["Lw"] = _compose(base["L"], base["M"])
+    base["Rw"] = _compose(base["R"], _invert(base["M"]))
+    base["Uw"] = _compose(base["U"], _invert(base["E"]))
+    base["Dw"] = _compose(base["D"], base["E"])
+
+    permutations = {}
+    for name, permutation in base.items():
+        permutations[name] = permutation
+        permutations[name + "'"] = _invert(permutation)
+        permutations[name + "2"] = _compose(permutation, permutation)
+    return permutations
+
+
+# Sticker permutation and sparse changes of every move
+MOVE_PERMUTATIONS = _build_move_permutations()
+MOVE_CHANGES = {move: _sparse_changes(permutation) for move, permutation in MOVE_PERMUTATIONS.items()}
+
+
+def _build_orientations() -> dict[tuple[str, str], tuple[tuple[str, ...], tuple]]:
+    """
+    Enumerate the 24 orientations of the cube (breadth-first over x and y rotations).
+
+    Returns:
+        dict: (face holding the U center, face holding the F center) -> (rotations bringing
+        them back to U and F, sparse changes of those rotations).
+    """
+    identity = tuple(range(len(STICKERS)))
+    found = {identity: ()}
+    queue = [identity]
+    for permutation in queue:
+        for rotation in ("x", "y", "x'", "y'"):
+            rotated = _compose(permutation, MOVE_PERMUTATIONS[rotation])
+            if rotated not in found:
+                found[rotated] = found[permutation] + (rotation,)
+                queue.append(rotated)
+
+    u_center, f_center = FACE_OFFSET['U'] + 4, FACE_OFFSET['F'] + 4
+    return {
+        (STICKERS[permutation[u_center]][0], STICKERS[permutation[f_center]][0]):
+            (rotations, _sparse_changes(permutation))
+        for permutation, rotations in found.items()
+    }
 
-    def U(self): self._cycle('U'); self._rotate_face_cw('U')
-    def U_(self): [self._cycle('U') for _ in range(3)]; self._rotate_face_ccw('U')
 
-    def D(self): self._cycle('D'); self._rotate_face_cw('D')
-    def D_(self): [self._cycle('D') for _ in range(3)]; self._rotate_face_ccw('D')
\ No newline at end of file
+# The 24 whole-cube orientations, keyed by where the U and F centers currently are
+ORIENTATIONS = _build_orientations()
@@ -0,0 +1,192 @@
+import heapq
+import mmap
+import os
+import struct
+import tempfile
+
+from rubiks_solver.cube import Cube, MOVE_PERMUTATIONS, QUARTER_TURNS, STICKERS, ZOBRIST_KEYS
+
+MAGIC = b"RCEG"
+# depth, number of bytes of the move list, number of records
+_HEADER = struct.Struct("<BHQ")
+# state hash, tail length, tail move codes (at most MAX_DEPTH)
+_RECORD = struct.Struct("<QB7s")
+MAX_DEPTH = 7
+# Records sorted in memory at a time while building; the sorted runs are merged from disk
+_RUN_SIZE = 1 << 16
+# Records read at a time from each run while merging
+_READ_SIZE = 4096
+
+
+def build_table(path: str, depth: int, moves: list[str] | None = None) -> int:
+    """
+    Write an endgame table of every state within `depth` moves of the solved cube.
+
+    The states are found by breadth-first search from the solved cube, so the stored tail
+    of each state is an optimal solution in `moves`. Records (state hash, tail) are sorted
+    by hash for binary search.
+
+    Only one frontier (stickers packed as bytes) and the hashes of the two levels before it
+    are kept in memory: records are sorted in runs of `_RUN_SIZE`, spilled to a temporary
+    file next to `path` and merged at the end. A depth-6 build peaks at about 80 MB.
+
+    Args:
+        path (str): Output file.
+        depth (int): Search depth, at most `MAX_DEPTH`.
+        moves (list[str] | None): Moves of the search (default: quarter turns).
+
+    Returns:
+        int: Number of states in the table.
+    """
+    if not 0 <= depth <= MAX_DEPTH:
+        raise ValueError(f"Endgame depth must be between 0 and {MAX_DEPTH}, got {depth}")
+    moves = list(moves if moves is not None else QUARTER_TURNS)
+    opposite = Cube().opposite_move
+    code_of = {move: code for code, move in enumerate(moves)}
+    # Per move: its permutation, the positions it changes, and the code of its inverse
+    steps = []
+    for move in moves:
+        permutation = MOVE_PERMUTATIONS[move]
+        changed = [i for i, source in enumerate(permutation) if source != i]
+        steps.append((permutation, changed, bytes((code_of[opposite[move]],))))
+
+    solved = Cube()
+    # Stickers are searched as color codes; keys[i][code] is the Zobrist key of sticker i
+    colors = sorted(set(solved.to_list()))
+    keys = [[ZOBRIST_KEYS[i][color] for color in colors] for i in range(len(STICKERS))]
+    color_code = {color: code for code, color in enumerate(colors)}
+
+    with tempfile.TemporaryFile(dir=os.path.dirname(os.path.abspath(path))) as scratch:
+        runs = []
+        run = [(solved.state_hash, 0, b"")]
+
+        def spill():
+            run.sort()
+            runs.append((scratch.tell(), len(run)))
+            scratch.write(b"".join(_RECORD.pack(*record) for record in run))
+            run.clear()
+
+        # A move leads one level up, down or across, so only the two last levels can repeat
+        previous, current = set(), {solved.state_hash}
+        frontier = [(bytes(color_code[color] for color in solved.to_list()), solved.state_hash, b"")]
+        for level in range(1, depth + 1):
+            found = set()
+            next_frontier = []
+            for stickers, state_hash, tail in frontier:
+                for permutation, changed, inverse in steps:
+                    new_hash = state_hash
+                    for i in changed:
+                        new_hash ^= keys[i][stickers[i]] ^ keys[i][stickers[permutation[i]]]
+                    if new_hash in current or new_hash in previous or new_hash in found:
+                        continue
+                    new_tail = inverse + tail
+                    run.append((new_hash, len(new_tail), new_tail))
+                    if len(run) == _RUN_SIZE:
+                        spill()
+                    # The deepest level is not expanded (its repeats are dropped while merging)
+                    if level < depth:
+                        found.add(new_hash)
+                        next_frontier.append((bytes(map(stickers.__getitem__, permutation)), new_hash, new_tail))
+            previous, current, frontier = current, found, next_frontier
+        if run:
+            spill()
+        scratch.flush()
+
+        move_list = " ".join(moves).encode()
+        count = 0
+        with open(path, "wb") as file, mmap.mmap(scratch.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            header_start = len(MAGIC)
+            file.write(MAGIC + _HEADER.pack(depth, len(move_list), 0) + move_list)
+            last_hash = None
+            # Equal hashes merge shortest tail first
+            for state_hash, length, tail in heapq.merge(*(_read_run(view, start, n) for start, n in runs)):
+                if state_hash != last_hash:
+                    file.write(_RECORD.pack(state_hash, length, tail))
+                    last_hash = state_hash
+                    count += 1
+            file.seek(header_start)
+            file.write(_HEADER.pack(depth, len(move_list), count))
+    return count
+
+
+def _read_run(view, start: int, n: int):
+    """Records of the sorted run of `n` records at offset `start` of `view`, read in blocks."""
+    stop = start + n * _RECORD.size
+    for offset in range(start, stop, _READ_SIZE * _RECORD.size):
+        yield from _RECORD.iter_unpack(view[offset:min(offset + _READ_SIZE * _RECORD.size, stop)])
+
+
+class EndgameTable:
+    """
+    Read-only endgame table (see `build_table`), memory-mapped from disk.
+
+    Lookups binary-search the sorted records in place, so opening the table is instant and
+    the pages are shared between processes that use the same file.
+    """
+
+    def __init__(self, path: str):
+        with open(path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[:len(MAGIC)] != MAGIC:
+            self._map.close()
+            raise ValueError(f"Not an endgame table: {path}")
+        self.depth, moves_size, self.size = _HEADER.unpack_from(self._map, len(MAGIC))
+        start = len(MAGIC) + _HEADER.size
+        self.moves = self._map[start:start + moves_size].decode().split()
+        self._records_start = start + moves_size
+        self._solved = Cube().to_list()
+
+    @classmethod
+    def load_or_build(cls, path: str, depth: int, moves: list[str] | None = None) -> "EndgameTable":
+        """
+        Open the table at `path`, building it first if the file does not exist or was built
+        with another depth or move list (e.g. after `ENDGAME_DEPTH` changed).
+        """
+        moves = list(moves if moves is not None else QUARTER_TURNS)
+        if os.path.exists(path):
+            table = cls(path)
+            if table.depth == depth and table.moves == moves:
+                return table
+            table.close()
+        build_table(path, depth, moves)
+        return cls(path)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def lookup(self, state_hash: int) -> list[str] | None:
+        """Optimal tail solving the state with `state_hash`, or None if it is not in the table."""
+        low, high = 0, self.size
+        while low < high:
+            middle = (low + high) // 2
+            key, length, codes = _RECORD.unpack_from(self._map, self._records_start + middle * _RECORD.size)
+            if key < state_hash:
+                low = middle + 1
+            elif key > state_hash:
+                high = middle
+            else:
+                return [self.moves[code] for code in codes[:length]]
+        return None
+
+    def complete(self, cube) -> list[str]:
+        """
+        Solve `cube` in place if its state is in the table.
+
+        The tail is checked on a copy first, so a hash collision can never corrupt `cube`.
+
+        Returns:
+            list[str]: The moves applied (empty if the state is not in the table).
+        """
+        tail = self.lookup(cube.state_hash)
+        if not tail:
+            return []
+        finished = cube.copy()
+        finished.shuffle(tail)
+        if finished.to_list() != self._solved:
+            return []
+        cube.shuffle(tail)
+        return tail
+
+    def close(self):
+        """Unmap the table file."""
+        self._map.close()
@@ -0,0 +1,271 @@
+import struct
+import zlib
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import pygame
+
+from rubiks_solver.config import COLORS
+from rubiks_solver.cube import Cube
+from rubiks_solver.render import render_cube_perspective, render_cube_orthographic
+
+# Indexed palette of exported frames: background, outlines, then sticker colors
+PALETTE = [(255, 255, 255), (0, 0, 0)] + list(COLORS.values())
+
+
+class GifWriter:
+    """
+    Streaming animated GIF encoder for palette-indexed frames.
+
+    Frames are LZW-compressed and written as soon as they arrive, so memory use does not
+    depend on the number of frames.
+    """
+
+    def __init__(self, file, width: int, height: int, palette: list[tuple], delay: float, loop: int = 0):
+        """
+        Args:
+            file: Binary file object to write to.
+            palette (list[tuple]): Up to 256 RGB colors.
+            delay (float): Delay between frames in seconds.
+            loop (int): Number of repetitions, 0 = forever.
+        """
+        self.file = file
+        self.width = width
+        self.height = height
+        self.delay = delay
+        self.table_bits = max(1, (len(palette) - 1).bit_length())
+        self.min_code_size = max(2, self.table_bits)
+
+        colors = list(palette) + [(0, 0, 0)] * ((1 << self.table_bits) - len(palette))
+        file.write(b"GIF89a")
+        file.write(struct.pack("<HHBBB", width, height, 0xF0 | (self.table_bits - 1), 0, 0))
+        file.write(b"".join(bytes(color) for color in colors))
+        file.write(b"\x21\xFF\x0BNETSCAPE2.0\x03\x01" + struct.pack("<H", loop) + b"\x00")
+
+    def encoder(self) -> tuple:
+        """Picklable `(function, args)` compressing one frame of palette indices for `write_frame`."""
+        return _lzw_encode, (self.min_code_size,)
+
+    def write_frame(self, data: bytes, delay: float | None = None):
+        """Write one frame compressed with `encoder`."""
+        delay = self.delay if delay is None else delay
+        self.file.write(b"\x21\xF9\x04\x04" + struct.pack("<H", round(delay * 100)) + b"\x00\x00")
+        self.file.write(b"\x2C" + struct.pack("<HHHHB", 0, 0, self.width, self.height, 0))
+        self.file.write(bytes((self.min_code_size,)))
+        for i in range(0, len(data), 255):
+            block = data[i:i + 255]
+            self.file.write(bytes((len(block),)) + block)
+        self.file.write(b"\x00")
+
+    def close(self):
+        """Write the GIF trailer."""
+        self.file.write(b"\x3B")
+
+
+class ApngWriter:
+    """
+    Streaming animated PNG encoder for palette-indexed frames.
+
+    APNG stores the frame count up front, so it must be known when the writer is created.
+    """
+
+    def __init__(self, file, width: int, height: int, palette: list[tuple], delay: float,
+                 num_frames: int, loop: int = 0):
+        self.file = file
+        self.width = width
+        self.height = height
+        self.delay = delay
+        self.sequence = 0
+        self.frames = 0
+
+        file.write(b"\x89PNG\r\n\x1a\n")
+        self._chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 3, 0, 0, 0))
+        self._chunk(b"PLTE", b"".join(bytes(color) for color in palette))
+        self._chunk(b"acTL", struct.pack(">II", num_frames, loop))
+
+    def encoder(self) -> tuple:
+        """Picklable `(function, args)` compressing one frame of palette indices for `write_frame`."""
+        return _deflate_rows, (self.width, self.height)
+
+    def write_frame(self, data: bytes, delay: float | None = None):
+        """Write one frame compressed with `encoder`."""
+        delay = self.delay if delay is None else delay
+        self._chunk(b"fcTL", struct.pack(
+            ">IIIIIHHBB", self._next_sequence(), self.width, self.height, 0, 0, round(delay * 100), 100, 0, 0
+        ))
+        if self.frames == 0:
+            self._chunk(b"IDAT", data)
+        else:
+            self._chunk(b"fdAT", struct.pack(">I", self._next_sequence()) + data)
+        self.frames += 1
+
+    def close(self):
+        """Write the PNG end chunk."""
+        self._chunk(b"IEND", b"")
+
+    def _next_sequence(self) -> int:
+        self.sequence += 1
+        return self.sequence - 1
+
+    def _chunk(self, kind: bytes, data: bytes):
+        self.file.write(struct.pack(">I", len(data)) + kind + data)
+        self.file.write(struct.pack(">I", zlib.crc32(kind + data)))
+
+
+def _lzw_encode(indices: bytes, min_code_size: int) -> bytes:
+    """Variable-length LZW compression as used by GIF image data."""
+    clear = 1 << min_code_size
+    end = clear + 1
+    out = bytearray()
+    buffer = 0
+    bits = 0
+
+    table = {}
+    next_code = end + 1
+    code_size = min_code_size + 1
+
+    buffer |= clear << bits
+    bits += code_size
+
+    prefix = indices[0] if indices else None
+    for value in indices[1:]:
+        key = prefix << 8 | value
+        code = table.get(key)
+        if code is not None:
+            prefix = code
+            continue
+
+        buffer |= prefix << bits
+        bits += code_size
+        while bits >= 8:
+            out.append(buffer & 0xFF)
+            buffer >>= 8
+            bits -= 8
+
+        if next_code < 4096:
+            table[key] = next_code
+            next_code += 1
+            if next_code > (1 << code_size) and code_size < 12:
+                code_size += 1
+        else:
+            # Table full: start over with a clear code
+            buffer |= clear << bits
+            bits += code_size
+            table = {}
+            next_code = end + 1
+            code_size = min_code_size + 1
+        prefix = value
+
+    if prefix is not None:
+        buffer |= prefix << bits
+        bits += code_size
+    buffer |= end << bits
+    bits += code_size
+    while bits > 0:
+        out.append(buffer & 0xFF)
+        buffer >>= 8
+        bits -= 8
+    return bytes(out)
+
+
+def _deflate_rows(indices: bytes, width: int, height: int) -> bytes:
+    """PNG image data: unfiltered rows of palette indices, deflated."""
+    rows = b"".join(b"\x00" + indices[y * width:(y + 1) * width] for y in range(height))
+    return zlib.compress(rows, 9)
+
+
+def render_indices(cube, size: tuple[int, int], perspective: bool = True) -> bytes:
+    """Render a cube offscreen and return its pixels as `PALETTE` indices."""
+    surface = pygame.Surface(size, depth=8)
+    surface.set_palette(PALETTE)
+    surface.fill(PALETTE[0])
+    if perspective:
+        render_cube_perspective(surface, cube)
+    else:
+        render_cube_orthographic(surface, cube)
+    return pygame.image.tobytes(surface, "P")
+
+
+def _render_chunk(args) -> list[bytes]:
+    """Worker: render and compress frames `first` .. `first + count - 1` (frame i = cube after i moves)."""
+    moves, first, count, size, perspective, encode, encode_args = args
+    cube = Cube()
+    cube.shuffle(moves[:first])
+    frames = []
+    for i in range(first, first + count):
+        if i > first:
+            cube.shuffle([moves[i - 1]])
+        frames.append(encode(render_indices(cube, size, perspective), *encode_args))
+    return frames
+
+
+def _map_chunks(tasks, workers: int):
+    """Yield `_render_chunk` results in order, keeping at most `2 * workers` tasks in flight."""
+    if workers <= 1:
+        yield from map(_render_chunk, tasks)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for task in tasks:
+            pending.append(pool.submit(_render_chunk, task))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def export_playback(
+    path: str,
+    scramble: list[str],
+    solution: list[str],
+    size: tuple[int, int] = (300, 300),
+    perspective: bool = True,
+    fps: float = 4,
+    hold: float = 1.0,
+    workers: int = 1,
+    chunk_size: int = 16,
+) -> int:
+    """
+    Render scramble + solution playback headlessly into an animated GIF or APNG.
+
+    Frames are streamed into the encoder as they are produced. With `workers` > 1, chunks
+    of frames are rendered and compressed on a process pool; at most `2 * workers` chunks
+    are in flight, so memory stays bounded regardless of the playback length.
+
+    Args:
+        path (str): Output file, ".gif" or ".png"/".apng".
+        size (tuple[int, int]): Frame size in pixels.
+        fps (float): Moves shown per second.
+        hold (float): Seconds to hold the first and last frame.
+        workers (int): Number of rendering processes (1 = render in this process).
+        chunk_size (int): Frames per worker task.
+
+    Returns:
+        int: Number of frames written.
+    """
+    moves = list(scramble) + list(solution)
+    num_frames = len(moves) + 1
+    width, height = size
+
+    with open(path, "wb") as file:
+        if path.lower().endswith(".gif"):
+            writer = GifWriter(file, width, height, PALETTE, 1 / fps)
+        elif path.lower().endswith((".png", ".apng")):
+            writer = ApngWriter(file, width, height, PALETTE, 1 / fps, num_frames)
+        else:
+            raise ValueError(f"Unknown export format: {path}")
+
+        tasks = (
+            (moves, first, min(chunk_size, num_frames - first), size, perspective, *writer.encoder())
+            for first in range(0, num_frames, chunk_size)
+        )
+
+        written = 0
+        for frames in _map_chunks(tasks, workers):
+            for data in frames:
+                writer.write_frame(data, hold if written in (0, num_frames - 1) else None)
+                written += 1
+
+        writer.close()
+    return written
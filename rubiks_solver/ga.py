@@ -1,8 +1,10 @@
 import random
 import heapq
 import bisect
+import time
 
-from rubiks_solver.config import ELITE_SIZE, CHROMOSOME_LENGTH
+from rubiks_solver.config import ELITE_SIZE, CHROMOSOME_LENGTH, DUPLICATE_PENALTY, DUPLICATE_REPLACE_ROUNDS
+from rubiks_solver.nsga import non_dominated_sort, crowding_distance
 
 class GASolver:
     """
@@ -17,36 +19,131 @@ class GASolver:
         crossover_prob: float,
         mutation_prob: float,
         min_chromosome_len: int | None = None,
-        max_chromosome_len: int | None = None
+        max_chromosome_len: int | None = None,
+        macros: dict[str, list[str]] | None = None,
+        elite_size: int | None = None,
+        rng: random.Random | None = None,
+        duplicates: str = "share",
+        duplicate_penalty: float = DUPLICATE_PENALTY,
+        move_set: list[str] | None = None,
+        normalize_orientation: bool = True,
+        endgame=None,
+        local_search_elites: int = 0,
+        multi_objective: bool = False
     ):
-        self.starting_cube = starting_cube
+        """
+        Args:
+            duplicates (str): What happens to individuals whose cube state was already reached by
+                an earlier individual of the same population: "share" (fitness copied),
+                "penalize" (fitness multiplied by `duplicate_penalty`) or "replace" (swapped for a
+                fresh random individual, redrawn up to `DUPLICATE_REPLACE_ROUNDS` times while it
+                still repeats a state; any left over share the fitness).
+            move_set (list[str] | None): Moves used as genes, e.g. one of `config.MOVE_SETS`
+                (default: the 12 quarter turns).
+            normalize_orientation (bool): Reorient every cube so its centers match the solved cube
+                before scoring, making fitness invariant to the 24 whole-cube orientations (needed
+                when slice or wide moves are genes).
+            endgame (EndgameTable | None): Table of states near solved (see `rubiks_solver.endgame`).
+                An individual whose state is in the table is completed with the stored optimal tail.
+            local_search_elites (int): Number of best elites refined by `local_search` in every `step`
+                (not available with `multi_objective`, whose survival has no elites).
+            multi_objective (bool): NSGA-II mode maximizing fitness and minimizing solution length
+                (macros expanded): `select_parents` becomes a crowded tournament, `get_elites` and
+                survival use non-dominated sorting with crowding distance (see `pareto_front`).
+        """
+        if duplicates not in ("share", "penalize", "replace"):
+            raise ValueError(f"Unknown duplicates handling: {duplicates}")
+        if local_search_elites and multi_objective:
+            raise ValueError("local_search_elites is not supported in multi-objective mode")
+
+        # Own copy: macros are registered on it, never on the caller's cube
+        self.starting_cube = starting_cube = starting_cube.copy()
         self.pop_size = pop_size
         self.crossover_prob = crossover_prob
         self.mutation_prob = mutation_prob
         self.population = []
         self.min_chromosome_len = min_chromosome_len if min_chromosome_len is not None else CHROMOSOME_LENGTH[0]
         self.max_chromosome_len = max_chromosome_len if max_chromosome_len is not None else CHROMOSOME_LENGTH[1]
-
-    def init_population(self):
+        self.elite_size = elite_size if elite_size is not None else ELITE_SIZE
+        # Explicit generator for reproducible runs (see `rubiks_solver.rng.spawn_rngs`);
+        # the `random` module itself is used as the global-state default.
+        self.rng = rng if rng is not None else random
+        self.duplicates = duplicates
+        self.duplicate_penalty = duplicate_penalty
+        self.normalize_orientation = normalize_orientation
+        self.endgame = endgame
+        self.local_search_elites = local_search_elites
+        self.multi_objective = multi_objective
+        # Chromosomes already known to be local optima (elites survive many generations)
+        self._local_optima = set()
+        # Scratch cubes reused by every evaluation (see `_scratch_cube`)
+        self._scratch = []
+        # Statistics of the last evaluation, and unique states of every evaluation so far
+        self.eval_stats = {}
+        self.unique_states_history = []
+
+        # Gene pool: moves of the move set plus macro moves. Macros are registered on the
+        # solver's `starting_cube`; expand chromosomes with its `expand_macros` to replay them
+        # on other cubes.
+        self.genes = list(move_set if move_set is not None else starting_cube.quarter_turn_symbols)
+        for move in self.genes:
+            if move not in starting_cube.opposite_move:
+                raise ValueError(f"Unknown move in move set: {move}")
+        for name, sequence in (macros or {}).items():
+            starting_cube.add_macro(name, sequence)
+            self.genes.append(name)
+
+    def init_population(self, seeds: list[list[str]] | None = None):
         """
         Initialize population with random chromosomes (sequences of moves).
         Avoids consecutive opposite moves.
+
+        Args:
+            seeds (list[list[str]] | None): Chromosomes put into the population first (e.g.
+                solutions of similar states from a `SolutionCache`); random ones fill the rest.
         """
-        for _ in range(self.pop_size):
-            chromosome_len = random.randint(self.min_chromosome_len, self.max_chromosome_len)
+        seeds = [list(chromosome) for chromosome in (seeds or [])[:self.pop_size]]
+        for chromosome in seeds + self._random_chromosomes(self.pop_size - len(seeds)):
+            individual = Individual(chromosome)
+            self.population.append(individual)
+
+    def _random_chromosomes(self, n: int) -> list[list[str]]:
+        """Draw `n` random chromosomes in bulk, without consecutive opposite moves."""
+        lengths = self.rng.choices(range(self.min_chromosome_len, self.max_chromosome_len + 1), k=n)
+        genes = iter(self.rng.choices(self.genes, k=sum(lengths)))
+        opposite_move = self.starting_cube.opposite_move
+
+        chromosomes = []
+        for chromosome_len in lengths:
             chromosome = []
+            for new_gene in genes:
+                if chromosome and new_gene == opposite_move.get(chromosome[-1]):
+                    continue
+                chromosome.append(new_gene)
+                if len(chromosome) == chromosome_len:
+                    break
+
+            # Top up genes skipped as opposite moves
             while len(chromosome) < chromosome_len:
-                new_gene = random.choice(self.starting_cube.all_moves_symbols)
-                if not chromosome or new_gene != self.starting_cube.opposite_move[chromosome[-1]]:
+                new_gene = self.rng.choice(self.genes)
+                if not chromosome or new_gene != opposite_move.get(chromosome[-1]):
                     chromosome.append(new_gene)
 
-            individual = Individual(chromosome)
-            self.population.append(individual)
+            chromosomes.append(chromosome)
+        return chromosomes
 
     def evaluate(self, target_state: dict, population: list | None = None, method: str = "correct_tiles"):
         """
         Evaluate fitness of population.
 
+        Individuals are bucketed by resulting cube state (Zobrist hash, taken after orientation
+        normalization if enabled), so each distinct state is scored once. Later individuals
+        reaching an already seen state are handled according to `duplicates` (see `__init__`),
+        and `eval_stats` (including the evaluation time in seconds and, after "replace", the
+        duplicates left) is updated. With an `endgame` table, individuals reaching a state in
+        the table get its tail appended to their chromosome; replacements go through the same
+        bucketing and endgame completion.
+
         Args:
             target_state (dict): Target cube state to compare against.
             population (list[Individual] | None): If None, evaluate self.population.
@@ -54,66 +151,144 @@ class GASolver:
         """
         if population is None:
             population = self.population
-
+        score = self._scorer(method)
+        start = time.perf_counter()
+
+        fitness_by_state = {}
+        state_by_chromosome = {}
+        tail_by_state = {}
+
+        def bucket(individual) -> bool:
+            """Score `individual` (once per state); True if its state was already seen."""
+            chromosome = tuple(individual.chromosome)
+            state_hash = state_by_chromosome.get(chromosome)
+            duplicate = True
+            if state_hash is None:
+                cube, rotations = self._resulting_cube(individual.chromosome)
+                state_hash = state_by_chromosome[chromosome] = cube.state_hash
+                if state_hash not in fitness_by_state:
+                    if self.endgame is not None:
+                        tail = self.endgame.complete(cube)
+                        if tail:
+                            tail_by_state[state_hash] = rotations + tail
+                    fitness_by_state[state_hash] = score(cube, target_state)
+                    duplicate = False
+
+            individual.fitness = fitness_by_state[state_hash]
+            if state_hash in tail_by_state:
+                individual.chromosome = individual.chromosome + tail_by_state[state_hash]
+            return duplicate
+
+        duplicate_idx = [i for i, individual in enumerate(population) if bucket(individual)]
+        remaining = duplicate_idx
+
+        if self.duplicates == "penalize":
+            for i in duplicate_idx:
+                population[i].fitness *= self.duplicate_penalty
+        elif self.duplicates == "replace":
+            for _ in range(DUPLICATE_REPLACE_ROUNDS):
+                if not remaining:
+                    break
+                fresh = [Individual(chromosome) for chromosome in self._random_chromosomes(len(remaining))]
+                still_duplicate = []
+                for i, individual in zip(remaining, fresh):
+                    population[i] = individual
+                    if bucket(individual):
+                        still_duplicate.append(i)
+                remaining = still_duplicate
+
+        self.eval_stats = {
+            "population": len(population),
+            "unique_states": len(fitness_by_state),
+            "duplicates": len(duplicate_idx),
+            "duplicates_left": len(remaining),
+            "endgame_hits": len(tail_by_state),
+            "eval_time": time.perf_counter() - start,
+        }
+        self.unique_states_history.append(len(fitness_by_state))
+
+    def _scorer(self, method: str):
+        """Scoring function for an evaluation method ("correct_tiles" or "cubies_position")."""
         if method == "correct_tiles":
-            self._eval_tiles(target_state, population)
+            return self._score_tiles
         elif method == "cubies_position":
-            self._eval_cubies(target_state, population)
+            return self._score_cubies
         else:
             raise ValueError(f"Unknown evaluation method: {method}")
 
-    def _eval_tiles(self, target_state: dict, population: list):
+    def _scratch_cube(self, slot: int = 0, source=None):
+        """
+        Pooled scratch cube `slot`, reset to `source` (default: the starting cube) by a bulk
+        copy of its stickers, so evaluating an individual allocates no new cube.
+        """
+        while len(self._scratch) <= slot:
+            self._scratch.append(self.starting_cube.copy())
+        cube = self._scratch[slot]
+        cube.copy_from(source if source is not None else self.starting_cube)
+        return cube
+
+    def _resulting_cube(self, chromosome: list[str]):
+        """
+        Starting cube after applying `chromosome` (reoriented if `normalize_orientation`).
+
+        The cube is scratch cube 0, valid until the next call; copy it to keep it.
+
+        Returns:
+            tuple[Cube, list[str]]: The cube and the rotations used to reorient it.
+        """
+        cube = self._scratch_cube()
+        cube.shuffle(chromosome)
+        rotations = cube.normalize_orientation() if self.normalize_orientation else []
+        return cube, rotations
+
+    def _score_tiles(self, cube, target_state: dict) -> float:
         """Fitness = % of correctly placed stickers compared to target_state."""
-        for individual in population:
-            cube = self.starting_cube.copy()
-            cube.shuffle(individual.chromosome)
-            correct_tiles = 0
-            total = 0
-
-            for target_face, face in zip(target_state.values(), cube.faces.values()):
-                for target_row, row in zip(target_face, face):
-                    for target_tile, tile in zip(target_row, row):
-                        if target_tile is not None:
-                            total += 1
-                            if tile == target_tile:
-                                correct_tiles += 1
-
-            individual.fitness = correct_tiles / total
-
-    def _eval_cubies(self, target_state: dict, population: list):
+        correct_tiles = 0
+        total = 0
+
+        for target_face, face in zip(target_state.values(), cube.faces.values()):
+            for target_row, row in zip(target_face, face):
+                for target_tile, tile in zip(target_row, row):
+                    if target_tile is not None:
+                        total += 1
+                        if tile == target_tile:
+                            correct_tiles += 1
+
+        return correct_tiles / total
+
+    def _score_cubies(self, cube, target_state: dict) -> float:
         """Fitness = % of correctly positioned cubies compared to target_state."""
-        for individual in population:
-            cube = self.starting_cube.copy()
-            cube.shuffle(individual.chromosome)
-            correct_cubies = 0
-            total = 0
-            
-            # Corners
-            for name, corner in cube.corners.items():
-                if name in target_state["corners"]:
-                    total += 1
-                    if all(cube.faces[f][r][c] == cube.faces[f][1][1] for f, r, c in corner):
-                        correct_cubies += 1
-
-            # Edges
-            for name, edge in cube.edges.items():
-                if name in target_state["edges"]:
-                    total += 1
-                    if all(cube.faces[f][r][c] == cube.faces[f][1][1] for f, r, c in edge):
-                        correct_cubies += 1
-                        
-            individual.fitness = correct_cubies / total
+        correct_cubies = 0
+        total = 0
+        
+        # Corners
+        for name, corner in cube.corners.items():
+            if name in target_state["corners"]:
+                total += 1
+                if all(cube.faces[f][r][c] == cube.faces[f][1][1] for f, r, c in corner):
+                    correct_cubies += 1
+
+        # Edges
+        for name, edge in cube.edges.items():
+            if name in target_state["edges"]:
+                total += 1
+                if all(cube.faces[f][r][c] == cube.faces[f][1][1] for f, r, c in edge):
+                    correct_cubies += 1
+                    
+        return correct_cubies / total
 
     def select_parents(self, method: str = "tournament", k: int = 5, c: float = 1.5):
         """
         Select parents for crossover.
 
         Args:
-            method (str): "roulette", "tournament", or "exp_rank".
+            method (str): "roulette", "tournament", or "exp_rank" (ignored if `multi_objective`).
             k (int): Tournament size (for "tournament").
             c (float): Exponential base (for "exp_rank").
         """
-        if method == "roulette":
+        if self.multi_objective:
+            return self._crowded_tournament_selection()
+        elif method == "roulette":
             return self._roulette_selection()
         elif method == "tournament":
             return self._tournament_selection(k)
@@ -133,7 +308,7 @@ class GASolver:
             cum_sum.append(running_sum)
 
         for _ in range(self.pop_size):
-            rand = random.random() * total_fitness
+            rand = self.rng.random() * total_fitness
             i = bisect.bisect_left(cum_sum, rand)
             parents.append(self.population[i])
 
@@ -143,7 +318,7 @@ class GASolver:
         """Tournament selection: pick best from random subsets of size k."""
         parents = []
         for _ in range(self.pop_size):
-            tournament = random.sample(self.population, k)
+            tournament = self.rng.sample(self.population, k)
             winner = max(tournament, key=lambda ind: ind.fitness)
             parents.append(winner)
         return [(p1, p2) for p1, p2 in zip(parents[0::2], parents[1::2])]
@@ -162,7 +337,7 @@ class GASolver:
 
         parents = []
         for _ in range(self.pop_size):
-            rand = random.random() * total
+            rand = self.rng.random() * total
             i = bisect.bisect_left(cum_sum, rand)
             parents.append(ranked[i])
 
@@ -181,8 +356,8 @@ class GASolver:
             len1, len2 = len(p1.chromosome), len(p2.chromosome)
             min_len = min(len1, len2)
 
-            if random.random() < self.crossover_prob and min_len > 2:
-                split_idx = random.randint(1, min_len - 1)
+            if self.rng.random() < self.crossover_prob and min_len > 2:
+                split_idx = self.rng.randint(1, min_len - 1)
                 chromosome1 = p1.chromosome[:split_idx] + p2.chromosome[split_idx:]
                 chromosome2 = p2.chromosome[:split_idx] + p1.chromosome[split_idx:]
             else:
@@ -193,7 +368,7 @@ class GASolver:
             children.append(Individual(chromosome2))
 
         # Keep population size fixed
-        children = random.sample(children, self.pop_size - ELITE_SIZE)
+        children = self.rng.sample(children, self.pop_size - self.elite_size)
         return children
 
     def mutate(self, children: list):
@@ -208,56 +383,194 @@ class GASolver:
         Ensures no consecutive opposite moves.
         """
         for individual in children:
-            if random.random() <= self.mutation_prob:
-                rand = random.random()
+            if self.rng.random() <= self.mutation_prob:
+                rand = self.rng.random()
 
                 # Modify gene
                 if rand <= 0.33 and individual.chromosome:
-                    idx = random.randrange(len(individual.chromosome))
+                    idx = self.rng.randrange(len(individual.chromosome))
                     gene = individual.chromosome[idx]
 
                     forbidden = set()
                     if idx > 0:
-                        forbidden.add(self.starting_cube.opposite_move[individual.chromosome[idx - 1]])
+                        forbidden.add(self.starting_cube.opposite_move.get(individual.chromosome[idx - 1]))
                     if idx < len(individual.chromosome) - 1:
-                        forbidden.add(self.starting_cube.opposite_move[individual.chromosome[idx + 1]])
+                        forbidden.add(self.starting_cube.opposite_move.get(individual.chromosome[idx + 1]))
 
-                    available_moves = [m for m in self.starting_cube.all_moves_symbols if m not in forbidden and m != gene]
+                    available_moves = [m for m in self.genes if m not in forbidden and m != gene]
                     if available_moves:
-                        individual.chromosome[idx] = random.choice(available_moves)
+                        individual.chromosome[idx] = self.rng.choice(available_moves)
 
                 # Insert new gene
                 elif rand <= 0.66:
-                    idx = random.randrange(len(individual.chromosome) + 1)
+                    idx = self.rng.randrange(len(individual.chromosome) + 1)
                     forbidden = set()
                     if idx > 0:
-                        forbidden.add(self.starting_cube.opposite_move[individual.chromosome[idx - 1]])
+                        forbidden.add(self.starting_cube.opposite_move.get(individual.chromosome[idx - 1]))
                     if idx < len(individual.chromosome):
-                        forbidden.add(self.starting_cube.opposite_move[individual.chromosome[idx]])
+                        forbidden.add(self.starting_cube.opposite_move.get(individual.chromosome[idx]))
 
-                    available_moves = [m for m in self.starting_cube.all_moves_symbols if m not in forbidden]
+                    available_moves = [m for m in self.genes if m not in forbidden]
                     if available_moves:
-                        individual.chromosome.insert(idx, random.choice(available_moves))
+                        individual.chromosome.insert(idx, self.rng.choice(available_moves))
 
                 # Remove gene
                 else:
                     if len(individual.chromosome) > 1:
                         while True:
-                            idx = random.randrange(len(individual.chromosome))
+                            idx = self.rng.randrange(len(individual.chromosome))
                             new_chromosome = individual.chromosome[:idx] + individual.chromosome[idx + 1:]
                             
                             if 0 < idx < len(new_chromosome):
                                 left, right = new_chromosome[idx - 1], new_chromosome[idx]
-                                if self.starting_cube.opposite_move[left] == right:
+                                if self.starting_cube.opposite_move.get(left) == right:
                                     continue
                             individual.chromosome = new_chromosome
                             break
 
         return children
 
+    def _crowded_tournament_selection(self):
+        """NSGA-II binary tournament: lower front rank wins, then larger crowding distance."""
+        if any(ind.rank is None for ind in self.population):
+            self._nsga_survivors(self.population, len(self.population))
+        parents = []
+        for _ in range(self.pop_size):
+            a, b = self.rng.sample(self.population, 2)
+            parents.append(a if (a.rank, -a.crowding) <= (b.rank, -b.crowding) else b)
+        return [(p1, p2) for p1, p2 in zip(parents[0::2], parents[1::2])]
+
+    def _objectives(self, individual) -> tuple[float, int]:
+        """Objective vector (both maximized): fitness and negated solution length."""
+        return individual.fitness, -len(self.starting_cube.expand_macros(individual.chromosome))
+
+    def _nsga_survivors(self, population: list, n: int) -> list:
+        """
+        Best `n` individuals by non-dominated sorting, the last front filled by crowding
+        distance. Sets `rank` and `crowding` of every individual in `population`.
+
+        Individuals repeating the objective vector of an earlier one only survive after all
+        distinct vectors, so copies of cheap short chromosomes cannot crowd out the front.
+        """
+        points = [self._objectives(ind) for ind in population]
+        first_idx = {}
+        for i, point in enumerate(points):
+            first_idx.setdefault(point, i)
+        distinct = list(first_idx.values())
+
+        survivors = []
+        for rank, front in enumerate(non_dominated_sort([points[i] for i in distinct])):
+            front = [distinct[j] for j in front]
+            distance = crowding_distance(points, front)
+            for i in front:
+                population[i].rank = rank
+                population[i].crowding = distance[i]
+            if len(survivors) < n:
+                ordered = sorted(front, key=lambda i: -distance[i])
+                survivors.extend(population[i] for i in ordered[:n - len(survivors)])
+
+        repeats = [i for i, point in enumerate(points) if first_idx[point] != i]
+        for i in repeats:
+            population[i].rank = population[first_idx[points[i]]].rank
+            population[i].crowding = 0.0
+        repeats.sort(key=lambda i: population[i].rank)
+        survivors.extend(population[i] for i in repeats[:n - len(survivors)])
+        return survivors
+
+    def pareto_front(self) -> list:
+        """
+        Non-dominated individuals of the current population (one per chromosome), by fitness
+        descending then length ascending, so the first with fitness 1.0 is the shortest solution.
+        """
+        points = [self._objectives(ind) for ind in self.population]
+        front = {}
+        for i in non_dominated_sort(points)[0] if points else []:
+            front.setdefault(tuple(self.population[i].chromosome), self.population[i])
+        return sorted(front.values(), key=lambda ind: tuple(-value for value in self._objectives(ind)))
+
     def get_elites(self):
-        """Return top-ELITE_SIZE individuals from current population."""
-        return heapq.nlargest(ELITE_SIZE, self.population, key=lambda ind: ind.fitness)
+        """Return top-`elite_size` individuals from current population (by front and crowding if `multi_objective`)."""
+        if self.multi_objective:
+            return self._nsga_survivors(self.population, self.elite_size)
+        return heapq.nlargest(self.elite_size, self.population, key=lambda ind: ind.fitness)
+
+    def local_search(self, individual, target_state: dict, method: str = "correct_tiles"):
+        """
+        Memetic hill climbing: for each position, try every other gene and keep the best
+        improvement (in place).
+
+        The cube state before the current position is cached while sweeping forward, so a
+        candidate only re-simulates the suffix from that position instead of the whole
+        chromosome. Substitutions creating consecutive opposite moves are skipped, and
+        chromosomes that are already local optima are not searched again.
+
+        Returns:
+            Individual: `individual`, with updated chromosome and fitness.
+        """
+        score = self._scorer(method)
+        opposite_move = self.starting_cube.opposite_move
+        chromosome = individual.chromosome
+        if tuple(chromosome) in self._local_optima:
+            return individual
+        if individual.fitness is None:
+            individual.fitness = score(self._resulting_cube(chromosome)[0], target_state)
+
+        prefix = self._scratch_cube(1)
+        for i, current in enumerate(chromosome):
+            suffix = chromosome[i + 1:]
+            best_gene = current
+            for gene in self.genes:
+                if gene == current:
+                    continue
+                if i > 0 and opposite_move.get(chromosome[i - 1]) == gene:
+                    continue
+                if suffix and opposite_move.get(gene) == suffix[0]:
+                    continue
+
+                cube = self._scratch_cube(2, prefix)
+                cube.shuffle([gene])
+                cube.shuffle(suffix)
+                if self.normalize_orientation:
+                    cube.normalize_orientation()
+                fitness = score(cube, target_state)
+                if fitness > individual.fitness:
+                    individual.fitness = fitness
+                    best_gene = gene
+
+            chromosome[i] = best_gene
+            prefix.shuffle([best_gene])
+
+        if len(self._local_optima) >= 1000:
+            self._local_optima.clear()
+        self._local_optima.add(tuple(chromosome))
+        return individual
+
+    def step(self, target_state: dict, method: str = "correct_tiles", selection: str = "roulette"):
+        """
+        Run one generation: selection, crossover, mutation, elitism (with local search of
+        the best `local_search_elites` elites) and evaluation.
+
+        With `multi_objective`, the children are evaluated and NSGA-II survival selects the
+        next population from parents and children together.
+
+        Returns:
+            Individual: Best individual (by fitness) of the new population.
+        """
+        if self.multi_objective:
+            children = self.mutate(self.crossover(self.select_parents()))
+            self.evaluate(target_state, population=children, method=method)
+            self.population = self._nsga_survivors(self.population + children, self.pop_size)
+            return max(self.population, key=lambda ind: ind.fitness)
+
+        parents = self.select_parents(method=selection)
+        children = self.crossover(parents)
+        children = self.mutate(children)
+        elites = self.get_elites()
+        for elite in elites[:self.local_search_elites]:
+            self.local_search(elite, target_state, method)
+        self.population = elites + children
+        self.evaluate(target_state, method=method)
+        return max(self.population, key=lambda ind: ind.fitness)
 
 
 class Individual:
@@ -266,3 +579,6 @@ class Individual:
     def __init__(self, chromosome: list[str]):
         self.chromosome = chromosome
         self.fitness: float | None = None
+        # NSGA-II front index and crowding distance (multi-objective mode only)
+        self.rank: int | None = None
+        self.crowding: float = 0.0
@@ -0,0 +1,122 @@
+import multiprocessing
+import queue
+import random
+import time
+
+from rubiks_solver.ga import GASolver
+from rubiks_solver.cube import Cube
+from rubiks_solver.config import (
+    POPULATION_SIZE, MAX_GENERATIONS, CROSSOVER_RATE, MUTATION_RATE, STAGES_TILES
+)
+
+
+def _worker_cube(stickers: list[str]) -> Cube:
+    """Rebuild the starting cube in the worker from its flat stickers (`Cube.to_list`)."""
+    cube = Cube()
+    cube._load(stickers)
+    return cube
+
+
+def _solver_worker(stickers: list[str], updates, stop, target_state: dict, eval_method: str,
+                   selection: str, max_generations: int, min_interval: float, seed: int | None):
+    """
+    Background process: run the GA and publish progress without ever blocking on the consumer.
+
+    An update is sent at most every `min_interval` seconds, and dropped if the queue is still
+    full (the renderer has not caught up); the final update is always delivered.
+    """
+    ga_solver = GASolver(_worker_cube(stickers), POPULATION_SIZE, CROSSOVER_RATE, MUTATION_RATE, rng=random.Random(seed))
+    ga_solver.init_population()
+    ga_solver.evaluate(target_state, method=eval_method)
+    best = max(ga_solver.population, key=lambda ind: ind.fitness)
+
+    last_sent = 0.0
+    gen = 0
+    while True:
+        done = best.fitness == 1.0 or gen >= max_generations or stop.is_set()
+        now = time.perf_counter()
+        if done or now - last_sent >= min_interval:
+            fitness_values = [ind.fitness for ind in ga_solver.population]
+            update = {
+                "generation": gen,
+                "best_fitness": best.fitness,
+                "avg_fitness": sum(fitness_values) / len(fitness_values),
+                "chromosome": best.chromosome[:],
+                "done": done,
+            }
+            if done:
+                updates.put(update)
+                return
+            try:
+                updates.put_nowait(update)
+                last_sent = now
+            except queue.Full:
+                pass
+
+        best = ga_solver.step(target_state, method=eval_method, selection=selection)
+        gen += 1
+
+
+class LiveSolver:
+    """
+    Runs a GASolver in a background process and exposes its latest progress.
+
+    `poll` never blocks, so it can be called every frame of the render loop.
+    """
+
+    def __init__(self, starting_cube, target_state: dict | None = None, eval_method: str = "correct_tiles",
+                 selection: str = "roulette", max_generations: int = MAX_GENERATIONS,
+                 min_interval: float = 1 / 30, seed: int | None = None):
+        self.starting_cube = starting_cube.copy()
+        self.latest = None
+        self.best_cube = self.starting_cube.copy()
+
+        self._updates = multiprocessing.Queue(maxsize=2)
+        self._stop = multiprocessing.Event()
+        self._process = multiprocessing.Process(
+            target=_solver_worker,
+            args=(
+                self.starting_cube.to_list(), self._updates, self._stop,
+                target_state if target_state is not None else STAGES_TILES["full_cube"],
+                eval_method, selection, max_generations, min_interval, seed,
+            ),
+            daemon=True,
+        )
+
+    def start(self):
+        """Start the background solver process."""
+        self._process.start()
+
+    def poll(self) -> bool:
+        """
+        Take the newest pending update (older ones are skipped) without blocking.
+
+        Returns:
+            bool: True if `latest` and `best_cube` changed.
+        """
+        update = None
+        while True:
+            try:
+                update = self._updates.get_nowait()
+            except queue.Empty:
+                break
+
+        if update is None:
+            return False
+        self.latest = update
+        self.best_cube = self.starting_cube.copy()
+        self.best_cube.shuffle(update["chromosome"])
+        return True
+
+    @property
+    def done(self) -> bool:
+        """True once the final update has been received."""
+        return self.latest is not None and self.latest["done"]
+
+    def stop(self):
+        """Ask the solver to finish (cooperatively) and wait for the process."""
+        self._stop.set()
+        while self._process.is_alive():
+            self.poll()
+            self._process.join(timeout=0.05)
+        self.poll()
@@ -0,0 +1,61 @@
+import operator
+
+
+def dominates(a: tuple, b: tuple) -> bool:
+    """True if objective vector `a` is at least as good as `b` everywhere and better somewhere (maximization)."""
+    return a != b and all(map(operator.ge, a, b))
+
+
+def non_dominated_sort(points: list[tuple]) -> list[list[int]]:
+    """
+    Fast non-dominated sorting (NSGA-II).
+
+    Args:
+        points (list[tuple]): Objective vectors, all objectives maximized.
+
+    Returns:
+        list[list[int]]: Indices of `points` per front; front 0 is the Pareto front.
+    """
+    dominated_by = [[] for _ in points]
+    domination_count = [0] * len(points)
+    for i, p in enumerate(points):
+        for j in range(i + 1, len(points)):
+            q = points[j]
+            if dominates(p, q):
+                dominated_by[i].append(j)
+                domination_count[j] += 1
+            elif dominates(q, p):
+                dominated_by[j].append(i)
+                domination_count[i] += 1
+
+    fronts = [[i for i in range(len(points)) if domination_count[i] == 0]]
+
+    while fronts[-1]:
+        next_front = []
+        for i in fronts[-1]:
+            for j in dominated_by[i]:
+                domination_count[j] -= 1
+                if domination_count[j] == 0:
+                    next_front.append(j)
+        fronts.append(next_front)
+    return fronts[:-1]
+
+
+def crowding_distance(points: list[tuple], front: list[int]) -> dict[int, float]:
+    """
+    Crowding distance of every point of one front: the normalized size of the cuboid formed
+    by its neighbours in objective space (boundary points get infinity).
+    """
+    distance = {i: 0.0 for i in front}
+    if len(front) < 3:
+        return {i: float("inf") for i in front}
+
+    for k in range(len(points[front[0]])):
+        ordered = sorted(front, key=lambda i: points[i][k])
+        low, high = points[ordered[0]][k], points[ordered[-1]][k]
+        distance[ordered[0]] = distance[ordered[-1]] = float("inf")
+        if high == low:
+            continue
+        for previous, current, following in zip(ordered, ordered[1:], ordered[2:]):
+            distance[current] += (points[following][k] - points[previous][k]) / (high - low)
+    return distance
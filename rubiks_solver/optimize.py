@@ -0,0 +1,71 @@
+from functools import lru_cache
+
+from rubiks_solver.cube import MOVE_PERMUTATIONS, QUARTER_TURNS, HALF_TURNS, STICKERS
+from rubiks_solver.config import SEGMENT_DEPTH, SEGMENT_WINDOW
+
+
+@lru_cache(maxsize=None)
+def build_segment_table(depth: int = SEGMENT_DEPTH, moves: tuple[str, ...] | None = None) -> dict[bytes, tuple[str, ...]]:
+    """
+    Optimal move sequence of every sticker permutation within `depth` moves of the identity.
+
+    Found by breadth-first search over `moves` (default: face turns, where a half turn counts
+    as one move), skipping two turns of the same face in a row. Tables are cached per
+    (depth, moves); depth 4 holds about 47000 permutations and builds in under a second.
+
+    Returns:
+        dict[bytes, tuple[str, ...]]: Permutation (as bytes) -> shortest sequence producing it.
+    """
+    moves = moves if moves is not None else tuple(QUARTER_TURNS + HALF_TURNS)
+    identity = tuple(range(len(STICKERS)))
+    table = {bytes(identity): ()}
+    frontier = [(identity, ())]
+    for _ in range(depth):
+        next_frontier = []
+        for permutation, sequence in frontier:
+            for move in moves:
+                if sequence and move[0] == sequence[-1][0]:
+                    continue
+                new_permutation = tuple(permutation[i] for i in MOVE_PERMUTATIONS[move])
+                key = bytes(new_permutation)
+                if key not in table:
+                    table[key] = sequence + (move,)
+                    next_frontier.append((new_permutation, table[key]))
+        frontier = next_frontier
+    return table
+
+
+def optimize_solution(sequence: list[str], depth: int = SEGMENT_DEPTH, window: int = SEGMENT_WINDOW) -> list[str]:
+    """
+    Shorten a move sequence without changing its effect.
+
+    A window of up to `window` moves slides over the sequence; whenever the moves in the
+    window are equivalent to a shorter sequence of `build_segment_table(depth)`, they are
+    replaced by it (so cancelling moves disappear and e.g. "R R" becomes "R2"). Passes
+    repeat until nothing changes. Moves outside the table (rotations, slice and wide moves)
+    are kept unless a window containing them cancels out to a face-turn sequence.
+
+    Args:
+        sequence (list[str]): Moves of `MOVE_PERMUTATIONS` (expand macros first).
+
+    Returns:
+        list[str]: The optimized sequence.
+    """
+    table = build_segment_table(depth)
+    moves = list(sequence)
+    changed = True
+    while changed:
+        changed = False
+        i = 0
+        while i < len(moves):
+            permutation = tuple(range(len(STICKERS)))
+            for j in range(i, min(i + window, len(moves))):
+                permutation = tuple(permutation[k] for k in MOVE_PERMUTATIONS[moves[j]])
+                replacement = table.get(bytes(permutation))
+                if replacement is not None and len(replacement) < j + 1 - i:
+                    moves[i:j + 1] = replacement
+                    changed = True
+                    break
+            else:
+                i += 1
+    return moves
@@ -0,0 +1,60 @@
+import pygame
+
+# Line colors of consecutive series (best fitness solid, average fitness thin)
+SERIES_COLORS = [(31, 119, 180), (214, 39, 40), (44, 160, 44), (255, 127, 14), (148, 103, 189), (140, 86, 75)]
+MARGIN = 60
+
+
+def render_fitness_plot(records: list[dict], path: str, size: tuple[int, int] = (1000, 600),
+                        title: str = "Fitness evolution"):
+    """
+    Draw best and average fitness per generation from telemetry records (see
+    `rubiks_solver.telemetry`) and save the image (format from the extension, e.g. ".png").
+
+    One series is drawn per (run, stage) pair.
+    """
+    pygame.font.init()
+    font = pygame.font.Font(None, 20)
+    width, height = size
+    surface = pygame.Surface(size)
+    surface.fill((255, 255, 255))
+
+    series = {}
+    for record in records:
+        series.setdefault((record["run"], record["stage"]), []).append(record)
+    max_generation = max((record["generation"] for record in records), default=0) or 1
+
+    left, top = MARGIN, MARGIN // 2
+    plot_w, plot_h = width - MARGIN - left, height - MARGIN - top
+
+    def point(generation, fitness):
+        return left + generation / max_generation * plot_w, top + (1 - fitness) * plot_h
+
+    # Axes, grid and labels
+    for i in range(6):
+        y = top + plot_h * i / 5
+        pygame.draw.line(surface, (225, 225, 225), (left, y), (left + plot_w, y))
+        label = font.render(f"{1 - i / 5:.1f}", True, (0, 0, 0))
+        surface.blit(label, (left - label.get_width() - 6, y - label.get_height() // 2))
+    for i in range(11):
+        x = left + plot_w * i / 10
+        label = font.render(str(round(max_generation * i / 10)), True, (0, 0, 0))
+        surface.blit(label, (x - label.get_width() // 2, top + plot_h + 6))
+    pygame.draw.rect(surface, (0, 0, 0), (left, top, plot_w, plot_h), 1)
+    surface.blit(font.render("Generation", True, (0, 0, 0)), (left + plot_w // 2 - 30, height - 24))
+    surface.blit(font.render(title, True, (0, 0, 0)), (left, 8))
+
+    for i, ((run, stage), points) in enumerate(series.items()):
+        color = SERIES_COLORS[i % len(SERIES_COLORS)]
+        points.sort(key=lambda record: record["generation"])
+        best = [point(record["generation"], record["best_fitness"]) for record in points]
+        avg = [point(record["generation"], record["avg_fitness"]) for record in points]
+        if len(points) > 1:
+            pygame.draw.lines(surface, color, False, best, 2)
+            pygame.draw.lines(surface, color, False, avg, 1)
+
+        name = f"run {run}" + (f" {stage}" if stage else "")
+        legend = font.render(f"{name}: best (thick) / avg (thin)", True, color)
+        surface.blit(legend, (left + 10, top + 10 + i * 18))
+
+    pygame.image.save(surface, path)
@@ -0,0 +1,534 @@
+import array
+import bisect
+import heapq
+import itertools
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from rubiks_solver.cube import Cube
+from rubiks_solver.ga import GASolver, Individual
+
+# Gene code marking "no opposite move" (e.g. macros), so at most 255 genes are supported
+NO_OPPOSITE = 255
+
+# Chromosomes generated per batch when building a random population
+_BATCH_SIZE = 10_000
+
+
+class PopulationStore:
+    """
+    Struct-of-arrays population for very large runs.
+
+    All chromosomes live in one contiguous uint8 buffer of gene codes (code `g` stands for
+    `genes[g]`), delimited by an int64 offsets array: chromosome `i` is
+    `gene_codes[offsets[i]:offsets[i + 1]]`. Fitness values are kept in a parallel float32
+    array. The store can be copied into shared memory (`share`) and attached from other
+    processes by name (`attach`) without copying; `refill` then replaces the population
+    in the same block, so it is shared once for a whole run.
+    """
+
+    def __init__(self, genes: list[str], gene_codes, offsets, fitness, shm=None):
+        """
+        Args:
+            genes (list[str]): Gene symbols indexed by gene code.
+            gene_codes: uint8 buffer (bytearray or memoryview).
+            offsets: int64 array of `len(store) + 1` chromosome boundaries.
+            fitness: float32 array of `len(store)` values.
+            shm (SharedMemory | None): Shared memory block backing the arrays, if any.
+        """
+        if len(genes) >= NO_OPPOSITE:
+            raise ValueError(f"At most {NO_OPPOSITE - 1} genes are supported, got {len(genes)}")
+        self.genes = list(genes)
+        self.gene_codes = gene_codes
+        self.offsets = offsets
+        self.fitness = fitness
+        self.shm = shm
+        # True for the block created by `share` (which `refill` may replace)
+        self._owned = False
+
+    @classmethod
+    def from_codes(cls, genes: list[str], chromosomes) -> "PopulationStore":
+        """Build a store from an iterable of gene code sequences (fitness set to 0)."""
+        gene_codes = bytearray()
+        offsets = array.array("q", [0])
+        for codes in chromosomes:
+            gene_codes += codes
+            offsets.append(len(gene_codes))
+        return cls(genes, gene_codes, offsets, array.array("f", [0.0]) * (len(offsets) - 1))
+
+    @classmethod
+    def from_chromosomes(cls, genes: list[str], chromosomes) -> "PopulationStore":
+        """Build a store from an iterable of chromosomes (lists of gene symbols)."""
+        code_of = {gene: code for code, gene in enumerate(genes)}
+        return cls.from_codes(genes, (bytes(code_of[gene] for gene in chromosome) for chromosome in chromosomes))
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def codes(self, i: int) -> bytes:
+        """Gene codes of chromosome `i`."""
+        return bytes(self.gene_codes[self.offsets[i]:self.offsets[i + 1]])
+
+    def chromosome(self, i: int) -> list[str]:
+        """Chromosome `i` as gene symbols."""
+        genes = self.genes
+        return [genes[code] for code in self.codes(i)]
+
+    def gather(self, indices) -> "PopulationStore":
+        """New store holding copies of the chromosomes (and fitness) at `indices`."""
+        store = PopulationStore.from_codes(self.genes, (self.codes(i) for i in indices))
+        store.fitness = array.array("f", (self.fitness[i] for i in indices))
+        return store
+
+    def concat(self, other: "PopulationStore") -> "PopulationStore":
+        """New store with the individuals of `self` followed by those of `other`."""
+        store = PopulationStore.from_codes(
+            self.genes, itertools.chain((self.codes(i) for i in range(len(self))),
+                                        (other.codes(i) for i in range(len(other))))
+        )
+        store.fitness = array.array("f", itertools.chain(self.fitness, other.fitness))
+        return store
+
+    # ----------- Shared memory -----------
+
+    def share(self, capacity: int = 0) -> "PopulationStore":
+        """
+        Copy the store into a new shared memory block.
+
+        Layout: int64 header (size, number of gene codes, gene code capacity), int64 offsets,
+        float32 fitness (padded to 8 bytes), then room for `capacity` (at least the current
+        number of) uint8 gene codes. The caller owns the block and must `close` and `unlink` it.
+        """
+        n = len(self)
+        total = self.offsets[n]
+        capacity = max(capacity, total, 1)
+        shm = shared_memory.SharedMemory(create=True, size=_HEADER_BYTES + 8 * (n + 1) + _fitness_bytes(n) + capacity)
+        shm.buf[:_HEADER_BYTES].cast("q")[:] = array.array("q", [n, total, capacity])
+        store = PopulationStore._from_buffer(self.genes, shm)
+        store.offsets[:] = self.offsets
+        store.fitness[:] = self.fitness
+        store.gene_codes[:] = self.gene_codes[:total]
+        store._owned = True
+        return store
+
+    @classmethod
+    def attach(cls, name: str, genes: list[str]) -> "PopulationStore":
+        """Attach to a store shared by another process (see `share`); call `close` when done."""
+        return cls._from_buffer(genes, shared_memory.SharedMemory(name=name))
+
+    @classmethod
+    def _from_buffer(cls, genes: list[str], shm) -> "PopulationStore":
+        """Store viewing the population currently written in block `shm` (see `share`)."""
+        n, total, _ = shm.buf[:_HEADER_BYTES].cast("q")
+        offsets_start = _HEADER_BYTES
+        fitness_start = offsets_start + 8 * (n + 1)
+        codes_start = fitness_start + _fitness_bytes(n)
+        buf = shm.buf
+        return cls(
+            genes,
+            buf[codes_start:codes_start + total],
+            buf[offsets_start:fitness_start].cast("q"),
+            buf[fitness_start:fitness_start + 4 * n].cast("f"),
+            shm,
+        )
+
+    def refill(self, chromosomes):
+        """
+        Replace the individuals with `chromosomes` (gene code sequences), fitness set to 0.
+
+        A shared store writes them into its own block, so processes attached by name see the
+        new population. Only when the number of individuals changes or the gene codes
+        outgrow the block's capacity is the block replaced by one twice as large (with a
+        new name).
+        """
+        chromosomes = list(chromosomes)
+        if self.shm is None:
+            store = PopulationStore.from_codes(self.genes, chromosomes)
+            self.gene_codes, self.offsets, self.fitness = store.gene_codes, store.offsets, store.fitness
+            return
+
+        n = len(chromosomes)
+        total = sum(len(codes) for codes in chromosomes)
+        _, _, capacity = self.shm.buf[:_HEADER_BYTES].cast("q")
+        if n != len(self) or total > capacity:
+            if not self._owned:
+                raise ValueError("Only the process that shared a store can grow it")
+            store = PopulationStore.from_codes(self.genes, chromosomes).share(capacity=2 * total)
+            self.close()
+            self.unlink()
+            self.gene_codes, self.offsets, self.fitness, self.shm = (
+                store.gene_codes, store.offsets, store.fitness, store.shm
+            )
+            return
+
+        self.shm.buf[:_HEADER_BYTES].cast("q")[:] = array.array("q", [n, total, capacity])
+        self._release_views()
+        store = PopulationStore._from_buffer(self.genes, self.shm)
+        store.offsets[:] = array.array("q", itertools.accumulate((len(codes) for codes in chromosomes), initial=0))
+        store.fitness[:] = array.array("f", [0.0]) * n
+        store.gene_codes[:] = b"".join(chromosomes)
+        self.gene_codes, self.offsets, self.fitness = store.gene_codes, store.offsets, store.fitness
+
+    @property
+    def name(self) -> str | None:
+        """Name of the backing shared memory block (None if not shared)."""
+        return self.shm.name if self.shm is not None else None
+
+    def _release_views(self):
+        """Release the views into shared memory (the block stays open)."""
+        for view in (self.gene_codes, self.offsets, self.fitness):
+            view.release()
+
+    def close(self):
+        """Release the views into shared memory and close the block (no-op if not shared)."""
+        if self.shm is None:
+            return
+        self._release_views()
+        self.shm.close()
+
+    def unlink(self):
+        """Destroy the shared memory block (creating process only)."""
+        if self.shm is not None:
+            self.shm.unlink()
+
+
+def _fitness_bytes(n: int) -> int:
+    """Size of the float32 fitness array, padded to a multiple of 8 bytes."""
+    return (4 * n + 7) // 8 * 8
+
+
+# Size of the shared block header: number of individuals, of gene codes, gene code capacity
+_HEADER_BYTES = 24
+
+# Evaluation context of a worker process, set once by `_init_worker`
+_worker = {}
+
+
+def _init_worker(genes: list[str], stickers: list[str], macros: dict, options: dict, pop_size: int,
+                 target_state: dict, method: str):
+    """Worker initializer: build the cube and scoring solver used by every task of this process."""
+    cube = Cube()
+    cube._load(stickers)
+    _worker.update(
+        genes=genes,
+        solver=ArrayGASolver(cube, pop_size, 0.0, 0.0, macros=macros, **options),
+        target_state=target_state,
+        method=method,
+        name=None,
+        shm=None,
+    )
+
+
+def _evaluate_shared(name: str, start: int, stop: int) -> tuple[int, int]:
+    """Worker: evaluate individuals `start` .. `stop - 1` of the shared store `name` in place."""
+    if _worker["name"] != name:
+        # The block is kept open across tasks and only reattached when the store moved
+        if _worker["shm"] is not None:
+            _worker["shm"].close()
+        _worker["shm"] = shared_memory.SharedMemory(name=name)
+        _worker["name"] = name
+    store = PopulationStore._from_buffer(_worker["genes"], _worker["shm"])
+    try:
+        return _worker["solver"]._evaluate_range(store, _worker["target_state"], _worker["method"], start, stop)
+    finally:
+        store._release_views()
+
+
+class ArrayGASolver(GASolver):
+    """
+    GASolver backed by a `PopulationStore` instead of a list of `Individual` objects.
+
+    Selection, elite extraction, crossover and mutation work on index arrays and gene code
+    buffers, which keeps memory and garbage collection time flat for populations of
+    hundreds of thousands of individuals. With `workers` > 1, the store lives in one shared
+    memory block for the solver's lifetime (until `close`): each generation is written into
+    it, and evaluation runs on a process pool whose workers attach to it by name and keep
+    their cube and scorer between tasks.
+    """
+
+    def __init__(self, starting_cube, pop_size: int, crossover_prob: float, mutation_prob: float,
+                 *args, workers: int = 1, **kwargs):
+        """
+        Accepts the arguments of `GASolver` (duplicates "replace", `endgame`,
+        `local_search_elites` and `multi_objective` are not supported), plus:
+
+        Args:
+            workers (int): Number of evaluation processes (1 = evaluate in this process).
+        """
+        super().__init__(starting_cube, pop_size, crossover_prob, mutation_prob, *args, **kwargs)
+        if self.duplicates == "replace":
+            raise ValueError("ArrayGASolver does not support duplicates='replace'")
+        if self.endgame is not None:
+            raise ValueError("ArrayGASolver does not support endgame tables")
+        if self.local_search_elites:
+            raise ValueError("ArrayGASolver does not support local search")
+        if self.multi_objective:
+            raise ValueError("ArrayGASolver does not support multi-objective mode")
+        self.workers = workers
+        self.store = None
+        self._executor = None
+        # (genes, target_state, method) the pool's workers were initialized with
+        self._executor_context = None
+
+    def init_population(self, seeds: list[list[str]] | None = None):
+        """
+        Initialize the store with the `seeds` chromosomes (moves of the gene pool only),
+        then random chromosomes generated in batches.
+        """
+        seeds = [list(chromosome) for chromosome in (seeds or [])[:self.pop_size]]
+        if any(gene not in self.genes for chromosome in seeds for gene in chromosome):
+            raise ValueError("Seed chromosomes may only use moves of the gene pool")
+        chromosomes = itertools.chain(seeds, (
+            chromosome
+            for start in range(len(seeds), self.pop_size, _BATCH_SIZE)
+            for chromosome in self._random_chromosomes(min(_BATCH_SIZE, self.pop_size - start))
+        ))
+        store = PopulationStore.from_chromosomes(self.genes, chromosomes)
+        self._release_store()
+        if self.workers > 1:
+            # Room for chromosomes to grow before the block has to be replaced
+            store = store.share(capacity=2 * len(store.gene_codes))
+        self.store = store
+
+    def evaluate(self, target_state: dict, population: PopulationStore | None = None, method: str = "correct_tiles"):
+        """
+        Evaluate fitness of the store (in place).
+
+        Each process deduplicates states within its own chunk, so with `workers` > 1
+        "unique_states" in `eval_stats` is an upper bound. A `population` that is not in
+        shared memory is copied into a temporary block for the evaluation.
+        """
+        store = population if population is not None else self.store
+        self._scorer(method)
+        started = time.perf_counter()
+
+        if self.workers <= 1 or len(store) < 2 * self.workers:
+            unique_states, duplicates = self._evaluate_range(store, target_state, method, 0, len(store))
+        else:
+            executor = self._pool(store.genes, target_state, method)
+            shared = store if store.shm is not None else store.share()
+            try:
+                bounds = [len(store) * i // self.workers for i in range(self.workers + 1)]
+                futures = [
+                    executor.submit(_evaluate_shared, shared.name, start, stop)
+                    for start, stop in zip(bounds, bounds[1:])
+                ]
+                results = [future.result() for future in futures]
+                if shared is not store:
+                    store.fitness = array.array("f")
+                    store.fitness.frombytes(shared.fitness.tobytes())
+            finally:
+                if shared is not store:
+                    shared.close()
+                    shared.unlink()
+            unique_states = sum(unique for unique, _ in results)
+            duplicates = sum(duplicates for _, duplicates in results)
+
+        self.eval_stats = {
+            "population": len(store),
+            "unique_states": unique_states,
+            "duplicates": duplicates,
+            "eval_time": time.perf_counter() - started,
+        }
+        self.unique_states_history.append(unique_states)
+
+    def _pool(self, genes: list[str], target_state: dict, method: str) -> ProcessPoolExecutor:
+        """Evaluation pool whose workers score `method` against `target_state` (restarted if these change)."""
+        context = (genes, target_state, method)
+        if self._executor is not None and self._executor_context != context:
+            self._executor.shutdown()
+            self._executor = None
+        if self._executor is None:
+            options = {
+                "duplicates": self.duplicates,
+                "duplicate_penalty": self.duplicate_penalty,
+                "normalize_orientation": self.normalize_orientation,
+            }
+            macros = {name: macro[0] for name, macro in self.starting_cube.macros.items()}
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(genes, self.starting_cube.to_list(), macros, options, self.pop_size, target_state, method),
+            )
+            self._executor_context = context
+        return self._executor
+
+    def _evaluate_range(self, store: PopulationStore, target_state: dict, method: str,
+                        start: int, stop: int) -> tuple[int, int]:
+        """
+        Score individuals `start` .. `stop - 1` of `store`, once per distinct cube state.
+
+        Returns:
+            tuple[int, int]: Number of unique states and of duplicates.
+        """
+        score = self._scorer(method)
+        genes = store.genes
+        fitness = store.fitness
+        penalty = self.duplicate_penalty if self.duplicates == "penalize" else 1.0
+
+        fitness_by_state = {}
+        state_by_codes = {}
+        duplicates = 0
+        for i in range(start, stop):
+            codes = store.codes(i)
+            state_hash = state_by_codes.get(codes)
+            if state_hash is None:
+                cube, _ = self._resulting_cube([genes[code] for code in codes])
+                state_hash = state_by_codes[codes] = cube.state_hash
+                if state_hash not in fitness_by_state:
+                    fitness[i] = fitness_by_state[state_hash] = score(cube, target_state)
+                    continue
+
+            fitness[i] = fitness_by_state[state_hash] * penalty
+            duplicates += 1
+        return len(fitness_by_state), duplicates
+
+    def select_parents(self, method: str = "tournament", k: int = 5, c: float = 1.5) -> array.array:
+        """
+        Select parents for crossover.
+
+        Returns:
+            array.array: `pop_size` indices into the store; consecutive entries form a pair.
+        """
+        fitness = self.store.fitness
+        n = len(self.store)
+
+        if method == "roulette":
+            cum_sum = list(itertools.accumulate(fitness))
+            total = cum_sum[-1]
+            return array.array("q", (
+                bisect.bisect_left(cum_sum, self.rng.random() * total) for _ in range(self.pop_size)
+            ))
+        elif method == "tournament":
+            return array.array("q", (
+                max(self.rng.sample(range(n), k), key=fitness.__getitem__) for _ in range(self.pop_size)
+            ))
+        elif method == "exp_rank":
+            ranked = sorted(range(n), key=fitness.__getitem__)
+            cum_sum = list(itertools.accumulate(c**rank for rank in range(1, n + 1)))
+            total = cum_sum[-1]
+            return array.array("q", (
+                ranked[bisect.bisect_left(cum_sum, self.rng.random() * total)] for _ in range(self.pop_size)
+            ))
+        else:
+            raise ValueError(f"Unknown selection method: {method}")
+
+    def crossover(self, parents: array.array) -> list[bytes]:
+        """1-point crossover between consecutive parent indices; returns the children's gene codes."""
+        store = self.store
+        children = []
+        for p1, p2 in zip(parents[0::2], parents[1::2]):
+            codes1, codes2 = store.codes(p1), store.codes(p2)
+            min_len = min(len(codes1), len(codes2))
+
+            if self.rng.random() < self.crossover_prob and min_len > 2:
+                split_idx = self.rng.randint(1, min_len - 1)
+                children.append(codes1[:split_idx] + codes2[split_idx:])
+                children.append(codes2[:split_idx] + codes1[split_idx:])
+            else:
+                children.append(codes1)
+                children.append(codes2)
+
+        # Keep population size fixed
+        keep = self.rng.sample(range(len(children)), self.pop_size - self.elite_size)
+        return [children[i] for i in keep]
+
+    def mutate(self, children: list[bytes]) -> list[bytes]:
+        """Modify, insert or remove one gene of each child with probability `mutation_prob` (see `GASolver.mutate`)."""
+        genes = self.store.genes
+        opposite = self._opposite_codes(genes)
+        all_codes = range(len(genes))
+
+        mutated = []
+        for codes in children:
+            if self.rng.random() <= self.mutation_prob:
+                rand = self.rng.random()
+                codes = bytearray(codes)
+
+                # Modify gene
+                if rand <= 0.33 and codes:
+                    idx = self.rng.randrange(len(codes))
+                    forbidden = {codes[idx]}
+                    if idx > 0:
+                        forbidden.add(opposite[codes[idx - 1]])
+                    if idx < len(codes) - 1:
+                        forbidden.add(opposite[codes[idx + 1]])
+
+                    available_codes = [code for code in all_codes if code not in forbidden]
+                    if available_codes:
+                        codes[idx] = self.rng.choice(available_codes)
+
+                # Insert new gene
+                elif rand <= 0.66:
+                    idx = self.rng.randrange(len(codes) + 1)
+                    forbidden = set()
+                    if idx > 0:
+                        forbidden.add(opposite[codes[idx - 1]])
+                    if idx < len(codes):
+                        forbidden.add(opposite[codes[idx]])
+
+                    available_codes = [code for code in all_codes if code not in forbidden]
+                    if available_codes:
+                        codes.insert(idx, self.rng.choice(available_codes))
+
+                # Remove gene
+                elif len(codes) > 1:
+                    while True:
+                        idx = self.rng.randrange(len(codes))
+                        if 0 < idx < len(codes) - 1 and opposite[codes[idx - 1]] == codes[idx + 1]:
+                            continue
+                        del codes[idx]
+                        break
+
+            mutated.append(bytes(codes))
+        return mutated
+
+    def _opposite_codes(self, genes: list[str]) -> bytes:
+        """Code of the opposite move of every gene code (`NO_OPPOSITE` if none)."""
+        code_of = {gene: code for code, gene in enumerate(genes)}
+        opposite_move = self.starting_cube.opposite_move
+        return bytes(code_of.get(opposite_move.get(gene), NO_OPPOSITE) for gene in genes)
+
+    def get_elites(self) -> list[int]:
+        """Return the indices of the top-`elite_size` individuals."""
+        return heapq.nlargest(self.elite_size, range(len(self.store)), key=self.store.fitness.__getitem__)
+
+    def best(self) -> Individual:
+        """Best individual of the store."""
+        i = max(range(len(self.store)), key=self.store.fitness.__getitem__)
+        individual = Individual(self.store.chromosome(i))
+        individual.fitness = self.store.fitness[i]
+        return individual
+
+    def step(self, target_state: dict, method: str = "correct_tiles", selection: str = "roulette") -> Individual:
+        """
+        Run one generation: selection, crossover, mutation, elitism and evaluation.
+
+        The new population (elites, then children) is written into the existing store.
+
+        Returns:
+            Individual: Best individual of the new population.
+        """
+        parents = self.select_parents(method=selection)
+        children = self.mutate(self.crossover(parents))
+        elites = [self.store.codes(i) for i in self.get_elites()]
+        self.store.refill(elites + children)
+        self.evaluate(target_state, method=method)
+        return self.best()
+
+    def _release_store(self):
+        """Move a shared store back to local memory and destroy its block."""
+        store = self.store
+        if store is not None and store.shm is not None:
+            self.store = store.gather(range(len(store)))
+            store.close()
+            store.unlink()
+
+    def close(self):
+        """Shut down the evaluation process pool and free the shared store (which stays readable)."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+            self._executor_context = None
+        self._release_store()
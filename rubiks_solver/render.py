@@ -1,36 +1,48 @@
+import functools
+
 import pygame
 
-from rubiks_solver.config import SCREEN_WIDTH, SCREEN_HEIGHT, COLORS
+from rubiks_solver.config import COLORS
 
 
-def render_cube_perspective(screen, cube):
+# Key color marking transparent pixels of cached layers
+TRANSPARENT = (255, 0, 255)
+
+
+@functools.lru_cache(maxsize=None)
+def _perspective_geometry(width: int, height: int) -> tuple[dict, list]:
     """
-    Render cube in perspective view.
+    Precompute perspective view geometry for a screen size.
+
+    Returns:
+        tuple[dict, list]: Face -> 9 tile polygons (row-major), and outlines as point lists
+        (two points for a grid line, four for a face border).
     """
-    size = min(SCREEN_HEIGHT, SCREEN_WIDTH) * 0.5 
+    size = min(height, width) * 0.5
     skew = size / 3
     tile_size = size / 3
     tile_skew = skew / 3
+    tiles = {}
+    outlines = []
 
     # --- Front face ---
-    v1_front = (SCREEN_WIDTH * 0.15, SCREEN_HEIGHT * 0.35)
+    v1_front = (width * 0.15, height * 0.35)
     v2_front = (v1_front[0] + size, v1_front[1])
     v3_front = (v1_front[0] + size, v1_front[1] + size)
     v4_front = (v1_front[0], v1_front[1] + size)
 
-    for iy, row in enumerate(cube.faces["F"]):
-        for ix, tile in enumerate(row):
+    tiles["F"] = []
+    for iy in range(3):
+        for ix in range(3):
             x = v1_front[0] + ix * tile_size
             y = v1_front[1] + iy * tile_size
-            color = COLORS[tile]
-            v1, v2, v3, v4 = (x, y), (x + tile_size, y), (x + tile_size, y + tile_size), (x, y + tile_size)
-            pygame.draw.polygon(screen, color, [v1, v2, v3, v4])
+            tiles["F"].append([(x, y), (x + tile_size, y), (x + tile_size, y + tile_size), (x, y + tile_size)])
 
-    pygame.draw.polygon(screen, "black", [v1_front, v2_front, v3_front, v4_front], 3)
-    pygame.draw.line(screen, "black", (v1_front[0] + tile_size, v1_front[1]), (v4_front[0] + tile_size, v4_front[1]), 3)
-    pygame.draw.line(screen, "black", (v1_front[0] + tile_size * 2, v1_front[1]), (v4_front[0] + tile_size * 2, v4_front[1]), 3)
-    pygame.draw.line(screen, "black", (v1_front[0], v1_front[1] + tile_size), (v2_front[0], v2_front[1] + tile_size), 3)
-    pygame.draw.line(screen, "black", (v1_front[0], v1_front[1] + tile_size * 2), (v2_front[0], v2_front[1] + tile_size * 2), 3)
+    outlines.append([v1_front, v2_front, v3_front, v4_front])
+    outlines.append([(v1_front[0] + tile_size, v1_front[1]), (v4_front[0] + tile_size, v4_front[1])])
+    outlines.append([(v1_front[0] + tile_size * 2, v1_front[1]), (v4_front[0] + tile_size * 2, v4_front[1])])
+    outlines.append([(v1_front[0], v1_front[1] + tile_size), (v2_front[0], v2_front[1] + tile_size)])
+    outlines.append([(v1_front[0], v1_front[1] + tile_size * 2), (v2_front[0], v2_front[1] + tile_size * 2)])
 
     # --- Up face ---
     v1_up = (v1_front[0] + skew, v1_front[1] - skew)
@@ -38,19 +50,18 @@ def render_cube_perspective(screen, cube):
     v3_up = (v1_up[0] + size - skew, v1_up[1] + skew)
     v4_up = (v1_up[0] - skew, v1_up[1] + skew)
 
-    for iy, row in enumerate(cube.faces["U"]):
-        for ix, tile in enumerate(row):
+    tiles["U"] = []
+    for iy in range(3):
+        for ix in range(3):
             x = v1_up[0] + tile_size * ix - tile_skew * iy
             y = v1_up[1] + tile_skew * iy
-            color = COLORS[tile]
-            v1, v2, v3, v4 = (x, y), (x + tile_size, y), (x + tile_size - tile_skew, y + tile_skew), (x - tile_skew, y + tile_skew)
-            pygame.draw.polygon(screen, color, [v1, v2, v3, v4])
+            tiles["U"].append([(x, y), (x + tile_size, y), (x + tile_size - tile_skew, y + tile_skew), (x - tile_skew, y + tile_skew)])
 
-    pygame.draw.polygon(screen, "black", [v1_up, v2_up, v3_up, v4_up], 3)
-    pygame.draw.line(screen, "black", (v4_up[0] + tile_size, v4_up[1]), (v4_up[0] + tile_size + skew, v4_up[1] - skew), 3)
-    pygame.draw.line(screen, "black", (v4_up[0] + tile_size * 2, v4_up[1]), (v4_up[0] + tile_size * 2 + skew, v4_up[1] - skew), 3)
-    pygame.draw.line(screen, "black", (v4_up[0] + tile_skew, v4_up[1] - tile_skew), (v3_up[0] + tile_skew, v3_up[1] - tile_skew), 3)
-    pygame.draw.line(screen, "black", (v4_up[0] + tile_skew * 2, v4_up[1] - tile_skew * 2), (v3_up[0] + tile_skew * 2, v3_up[1] - tile_skew * 2), 3)
+    outlines.append([v1_up, v2_up, v3_up, v4_up])
+    outlines.append([(v4_up[0] + tile_size, v4_up[1]), (v4_up[0] + tile_size + skew, v4_up[1] - skew)])
+    outlines.append([(v4_up[0] + tile_size * 2, v4_up[1]), (v4_up[0] + tile_size * 2 + skew, v4_up[1] - skew)])
+    outlines.append([(v4_up[0] + tile_skew, v4_up[1] - tile_skew), (v3_up[0] + tile_skew, v3_up[1] - tile_skew)])
+    outlines.append([(v4_up[0] + tile_skew * 2, v4_up[1] - tile_skew * 2), (v3_up[0] + tile_skew * 2, v3_up[1] - tile_skew * 2)])
 
     # --- Right face ---
     v1_right = (v1_front[0] + size, v1_front[1])
@@ -58,66 +69,145 @@ def render_cube_perspective(screen, cube):
     v3_right = (v1_right[0] + skew, v1_right[1] + size - skew)
     v4_right = (v1_right[0], v1_right[1] + size)
 
-    for iy, row in enumerate(cube.faces["R"]):
-        for ix, tile in enumerate(row):
+    tiles["R"] = []
+    for iy in range(3):
+        for ix in range(3):
             x = v1_right[0] + ix * tile_skew
             y = v1_right[1] + iy * tile_size - ix * tile_skew
-            color = COLORS[tile]
-            v1, v2, v3, v4 = (x, y), (x + tile_skew, y - tile_skew), (x + tile_skew, y - tile_skew + tile_size), (x, y + tile_size)
-            pygame.draw.polygon(screen, color, [v1, v2, v3, v4])
+            tiles["R"].append([(x, y), (x + tile_skew, y - tile_skew), (x + tile_skew, y - tile_skew + tile_size), (x, y + tile_size)])
 
-    pygame.draw.polygon(screen, "black", [v1_right, v2_right, v3_right, v4_right], 3)
-    pygame.draw.line(screen, "black", (v4_right[0], v4_right[1] - tile_size), (v3_right[0], v3_right[1] - tile_size), 3)
-    pygame.draw.line(screen, "black", (v4_right[0], v4_right[1] - tile_size * 2), (v3_right[0], v3_right[1] - tile_size * 2), 3)
-    pygame.draw.line(screen, "black", (v4_right[0] + tile_skew, v4_right[1] - tile_skew), (v1_right[0] + tile_skew, v1_right[1] - tile_skew), 3)
-    pygame.draw.line(screen, "black", (v4_right[0] + tile_skew * 2, v4_right[1] - tile_skew * 2), (v1_right[0] + tile_skew * 2, v1_right[1] - tile_skew * 2), 3)
+    outlines.append([v1_right, v2_right, v3_right, v4_right])
+    outlines.append([(v4_right[0], v4_right[1] - tile_size), (v3_right[0], v3_right[1] - tile_size)])
+    outlines.append([(v4_right[0], v4_right[1] - tile_size * 2), (v3_right[0], v3_right[1] - tile_size * 2)])
+    outlines.append([(v4_right[0] + tile_skew, v4_right[1] - tile_skew), (v1_right[0] + tile_skew, v1_right[1] - tile_skew)])
+    outlines.append([(v4_right[0] + tile_skew * 2, v4_right[1] - tile_skew * 2), (v1_right[0] + tile_skew * 2, v1_right[1] - tile_skew * 2)])
 
+    return tiles, outlines
 
-def render_cube_orthographic(screen, cube):
+
+@functools.lru_cache(maxsize=None)
+def _orthographic_geometry(width: int, height: int) -> tuple[dict, list]:
     """
-    Render cube in orthographic (flat net) view.
+    Precompute orthographic (flat net) view geometry for a screen size.
+
+    Returns:
+        tuple[dict, list]: Face -> 9 tile rects (row-major), and the black backing rect of every face.
     """
-    size = min(SCREEN_HEIGHT, SCREEN_WIDTH) / 5
+    size = min(height, width) / 5
+    tile_size = size / 3
+    tile_offset = 3
 
     # Top-left corner coordinates for each face
-    x_left = SCREEN_WIDTH / 2 - size * 2
-    y_left = SCREEN_HEIGHT / 2 - size / 2
+    x_left = width / 2 - size * 2
+    y_left = height / 2 - size / 2
+    corners = {
+        "L": (x_left, y_left),
+        "F": (x_left + size, y_left),
+        "R": (x_left + size * 2, y_left),
+        "B": (x_left + size * 3, y_left),
+        "U": (x_left + size, y_left - size),
+        "D": (x_left + size, y_left + size),
+    }
+
+    tiles = {}
+    backgrounds = []
+    for face, (x, y) in corners.items():
+        backgrounds.append((x - tile_offset, y - tile_offset, size + tile_offset, size + tile_offset))
+        tiles[face] = [
+            (x + j * tile_size, y + i * tile_size, tile_size - tile_offset, tile_size - tile_offset)
+            for i in range(3) for j in range(3)
+        ]
+    return tiles, backgrounds
+
+
+# Cached outline layers: (view, width, height) -> surface
+_layers = {}
+
+
+def _outline_layer(view: str, width: int, height: int):
+    """Static outline layer of a view (grid lines or face backgrounds), drawn once and cached."""
+    key = (view, width, height)
+    if key not in _layers:
+        layer = pygame.Surface((width, height))
+        layer.fill(TRANSPARENT)
+        layer.set_colorkey(TRANSPARENT)
+        if view == "perspective":
+            for points in _perspective_geometry(width, height)[1]:
+                if len(points) == 2:
+                    pygame.draw.line(layer, "black", *points, 3)
+                else:
+                    pygame.draw.polygon(layer, "black", points, 3)
+        else:
+            for rect in _orthographic_geometry(width, height)[1]:
+                pygame.draw.rect(layer, "black", rect)
+        _layers[key] = layer
+    return _layers[key]
+
 
-    x_front = x_left + size
-    y_front = y_left
+def render_cube_perspective(screen, cube):
+    """
+    Render cube in perspective view.
+    """
+    width, height = screen.get_size()
+    tiles, _ = _perspective_geometry(width, height)
+    for face in ("F", "U", "R"):
+        for polygon, tile in zip(tiles[face], _face_tiles(cube.faces[face])):
+            pygame.draw.polygon(screen, COLORS[tile], polygon)
+    screen.blit(_outline_layer("perspective", width, height), (0, 0))
 
-    x_right = x_front + size
-    y_right = y_front
 
-    x_back = x_right + size
-    y_back = y_right
+def render_cube_orthographic(screen, cube):
+    """
+    Render cube in orthographic (flat net) view.
+    """
+    width, height = screen.get_size()
+    tiles, _ = _orthographic_geometry(width, height)
+    screen.blit(_outline_layer("orthographic", width, height), (0, 0))
+    for face, rects in tiles.items():
+        for rect, tile in zip(rects, _face_tiles(cube.faces[face])):
+            pygame.draw.rect(screen, COLORS[tile], rect)
 
-    x_up = x_front
-    y_up = y_front - size
 
-    x_down = x_front
-    y_down = y_front + size
+def _face_tiles(face):
+    """Helper: tiles of a 3×3 face in row-major order."""
+    return [tile for row in face for tile in row]
 
-    _draw_face(screen, cube.faces["L"], x_left, y_left, size)
-    _draw_face(screen, cube.faces["F"], x_front, y_front, size)
-    _draw_face(screen, cube.faces["R"], x_right, y_right, size)
-    _draw_face(screen, cube.faces["B"], x_back, y_back, size)
-    _draw_face(screen, cube.faces["U"], x_up, y_up, size)
-    _draw_face(screen, cube.faces["D"], x_down, y_down, size)
 
+class CubeRenderer:
+    """
+    Renderer that keeps the last drawn cube on a cached surface.
 
-def _draw_face(screen, face, x, y, size):
-    """Helper: draw a single 3×3 face."""
-    tile_size = size / 3
-    tile_offset = 3
-    pygame.draw.rect(screen, "black", (x - tile_offset, y - tile_offset, size + tile_offset, size + tile_offset))
-    for i, row in enumerate(face):
-        for j, tile in enumerate(row):
-            pygame.draw.rect(
-                screen,
-                COLORS[tile],
-                (x + j * tile_size, y + i * tile_size, tile_size - tile_offset, tile_size - tile_offset),
-            )
+    Tiles are redrawn only when the cube state (`Cube.version`, unique across all cubes) or
+    the view changes; otherwise `render` only blits the cached surface.
+    """
+
+    def __init__(self):
+        self._surface = None
+        self._drawn = None
+
+    def render(self, screen, cube, perspective: bool = True) -> bool:
+        """
+        Blit the cube onto `screen`, redrawing the cached surface if needed.
+
+        Returns:
+            bool: True if the cube had to be redrawn.
+        """
+        size = screen.get_size()
+        state = (cube.version, perspective, size)
+        redrawn = state != self._drawn
+        if redrawn:
+            if self._surface is None or self._surface.get_size() != size:
+                self._surface = pygame.Surface(size)
+                self._surface.set_colorkey(TRANSPARENT)
+            self._surface.fill(TRANSPARENT)
+            if perspective:
+                render_cube_perspective(self._surface, cube)
+            else:
+                render_cube_orthographic(self._surface, cube)
+            self._drawn = state
+
+        screen.blit(self._surface, (0, 0))
+        return redrawn
 
 
 def draw_button(screen, font, text, center_pos, events, on_click=None):
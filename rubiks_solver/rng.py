@@ -0,0 +1,18 @@
+import hashlib
+import random
+
+
+def derive_seed(master_seed: int, *path: int) -> int:
+    """
+    Derive an independent 64-bit seed from a master seed and a path of indices.
+
+    Seeds are hashed, so streams for neighbouring indices (e.g. worker 0 and worker 1)
+    are uncorrelated and stay the same no matter how many streams are spawned.
+    """
+    key = ":".join(str(part) for part in (master_seed, *path)).encode()
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little")
+
+
+def spawn_rngs(master_seed: int, n: int) -> list[random.Random]:
+    """Create `n` independent generators (one per worker) from one master seed."""
+    return [random.Random(derive_seed(master_seed, i)) for i in range(n)]
@@ -0,0 +1,173 @@
+import random
+import time
+
+from rubiks_solver.ga import GASolver
+from rubiks_solver.config import (
+    POPULATION_SIZE, MAX_GENERATIONS, CROSSOVER_RATE, MUTATION_RATE, STAGES_TILES, STAGES_CUBIES,
+    MACRO_LIBRARY, STAGE_MACROS, MOVE_SETS, STAGE_MOVE_SETS, STAGE_CHROMOSOME_LENGTH, CHROMOSOME_LENGTH,
+    WARM_START_SEEDS
+)
+from rubiks_solver.rng import derive_seed
+from rubiks_solver.optimize import optimize_solution
+
+# Stages solved one after another by default (as in run_ga_stages.py)
+DEFAULT_STAGES = ["white_cross", "first_layer", "second_layer", "full_cube"]
+
+
+def apply_stage_solution(cube, stage_solution: list[str]) -> list[str]:
+    """
+    Apply a solved stage's moves to `cube`, then rotate it back to the solved orientation
+    (slice and wide moves may have reoriented it), so later stages match their targets.
+
+    Returns:
+        list[str]: The moves applied: `stage_solution` followed by the rotations.
+    """
+    cube.shuffle(stage_solution)
+    return list(stage_solution) + cube.normalize_orientation()
+
+
+def iter_solve(
+    cube,
+    deadline: float | None = None,
+    stages: list[str] | None = None,
+    cancel=None,
+    eval_method: str = "cubies_position",
+    selection: str = "roulette",
+    max_generations: int = MAX_GENERATIONS,
+    pop_size: int = POPULATION_SIZE,
+    endgame=None,
+    seed: int | None = None,
+    optimize: bool = False,
+    cache=None,
+):
+    """
+    Solve `cube` stage by stage, yielding the best solution so far whenever it improves.
+
+    The search stops when all stages are solved, a stage runs out of generations, the
+    deadline passes or `cancel` is set. Deadline and cancellation are checked before each
+    stage is set up and between generations, so the overshoot is at most one generation
+    (or one stage's initial population). `cube` itself is not modified.
+
+    Args:
+        deadline (float | None): Time budget in seconds from the call (None = no limit).
+        stages (list[str] | None): Stage names solved in order (default: `DEFAULT_STAGES`).
+        cancel: Object with `is_set()` (e.g. `threading.Event`) set from another thread to stop.
+        endgame (EndgameTable | None): Endgame table passed to every stage's `GASolver`.
+        seed (int | None): Seed for reproducible runs.
+        optimize (bool): Shorten the solution of the last update with `optimize_solution`.
+        cache (SolutionCache | None): Stage solutions are looked up here first and stored after
+            solving; on a miss, solutions of similar states seed the population.
+
+    Yields:
+        dict: "stage", "generation", "fitness" (of the current stage), "solution" (moves from
+        the scrambled cube, completed stages included), "solved", "elapsed" and "done".
+        The last update has "done" True and "reason": "solved", "deadline", "cancelled" or
+        "max_generations".
+
+    Raises:
+        ValueError: If `stages` is empty or names an unknown stage.
+    """
+    start = time.perf_counter()
+    stop_at = start + deadline if deadline is not None else None
+    stages = list(stages) if stages is not None else DEFAULT_STAGES
+    if not stages:
+        raise ValueError("At least one stage is required")
+    targets = STAGES_TILES if eval_method == "correct_tiles" else STAGES_CUBIES
+    for stage in stages:
+        if stage not in targets:
+            raise ValueError(f"Unknown stage name: {stage}")
+    seed = seed if seed is not None else random.getrandbits(64)
+
+    def update(stage, generation, fitness, stage_solution, done=False, reason=None):
+        result = {
+            "stage": stage,
+            "generation": generation,
+            "fitness": fitness,
+            "solution": solution + stage_solution,
+            "solved": reason == "solved",
+            "elapsed": time.perf_counter() - start,
+            "done": done,
+        }
+        if done:
+            result["reason"] = reason
+            if optimize:
+                result["solution"] = optimize_solution(result["solution"])
+        return result
+
+    def stopped():
+        if cancel is not None and cancel.is_set():
+            return "cancelled"
+        if stop_at is not None and time.perf_counter() >= stop_at:
+            return "deadline"
+        return None
+
+    cube = cube.copy()
+    solution = []
+    for i, stage in enumerate(stages):
+        # Setting up a stage (cache lookup, initial population) may take a while
+        if (reason := stopped()) is not None:
+            yield update(stage, 0, 0.0, [], done=True, reason=reason)
+            return
+
+        # Solutions of one stage differ between evaluation methods, so both are part of the key
+        cache_stage = f"{stage}:{eval_method}"
+        cached = cache.get(cube, cache_stage) if cache is not None else None
+        if cached is not None:
+            best_fitness, best_chromosome = 1.0, cached
+            expand = list
+        else:
+            min_len, max_len = STAGE_CHROMOSOME_LENGTH.get(stage, CHROMOSOME_LENGTH)
+            ga_solver = GASolver(
+                cube, pop_size, CROSSOVER_RATE, MUTATION_RATE, min_len, max_len,
+                macros={name: MACRO_LIBRARY[name] for name in STAGE_MACROS.get(stage, [])},
+                rng=random.Random(derive_seed(seed, i)),
+                move_set=MOVE_SETS[STAGE_MOVE_SETS.get(stage, "quarter_turn")],
+                endgame=endgame,
+            )
+            # Solutions of similar states give the search a head start
+            ga_solver.init_population(
+                cache.similar(cube, cache_stage, WARM_START_SEEDS, genes=ga_solver.genes) if cache is not None else None
+            )
+            ga_solver.evaluate(targets[stage], method=eval_method)
+            best = max(ga_solver.population, key=lambda ind: ind.fitness)
+            best_fitness, best_chromosome = best.fitness, best.chromosome[:]
+            expand = ga_solver.starting_cube.expand_macros
+        yield update(stage, 0, best_fitness, expand(best_chromosome))
+
+        gen = 0
+        reason = None
+        while best_fitness < 1.0:
+            reason = stopped() or ("max_generations" if gen >= max_generations else None)
+            if reason is not None:
+                break
+            best = ga_solver.step(targets[stage], method=eval_method, selection=selection)
+            gen += 1
+            if best.fitness > best_fitness:
+                best_fitness, best_chromosome = best.fitness, best.chromosome[:]
+                yield update(stage, gen, best_fitness, expand(best_chromosome))
+
+        stage_solution = expand(best_chromosome)
+        if reason is not None:
+            yield update(stage, gen, best_fitness, stage_solution, done=True, reason=reason)
+            return
+
+        if cache is not None and cached is None:
+            cache.put(cube, cache_stage, stage_solution)
+        solution += apply_stage_solution(cube, stage_solution)
+
+    yield update(stages[-1], gen, best_fitness, [], done=True, reason="solved")
+
+
+def solve(cube, deadline: float | None = None, stages: list[str] | None = None, cancel=None, **options) -> dict:
+    """
+    Solve `cube` within an optional time budget and return the best solution found.
+
+    Accepts the arguments of `iter_solve`.
+
+    Returns:
+        dict: The final update of `iter_solve` ("solution", "solved", "reason", ...).
+    """
+    result = None
+    for result in iter_solve(cube, deadline=deadline, stages=stages, cancel=cancel, **options):
+        pass
+    return result
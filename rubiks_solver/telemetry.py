@@ -0,0 +1,133 @@
+import csv
+import json
+import math
+
+# Columns of a telemetry record
+FIELDS = (
+    "run", "stage", "generation", "best_fitness", "avg_fitness", "diversity",
+    "unique_states", "population", "eval_time",
+)
+
+
+class Telemetry:
+    """
+    Buffered sink for per-generation GA statistics.
+
+    Records are kept in memory and written in batches as CSV or JSONL (chosen by the file
+    extension), so logging costs almost nothing inside the generation loop. Every
+    `sample_every`-th generation is recorded; unless `quiet`, recorded generations are also
+    printed as a one-line summary.
+    """
+
+    def __init__(self, path: str | None = None, sample_every: int = 1, quiet: bool = False,
+                 buffer_size: int = 256):
+        """
+        Args:
+            path (str | None): Output file ".csv" or ".jsonl" (None = console only).
+            sample_every (int): Record every n-th generation (forced records are always kept).
+            quiet (bool): Do not print generation summaries.
+            buffer_size (int): Records held in memory before they are written.
+        """
+        if sample_every < 1:
+            raise ValueError(f"sample_every must be at least 1, got {sample_every}")
+        if path is not None and not path.lower().endswith((".csv", ".jsonl")):
+            raise ValueError(f"Unknown telemetry format: {path}")
+
+        self.path = path
+        self.sample_every = sample_every
+        self.quiet = quiet
+        self.buffer_size = buffer_size
+        self.buffer = []
+        self._file = None
+        self._writer = None
+
+    def record(self, generation: int, fitness_values: list[float], eval_stats: dict | None = None,
+               force: bool = False, run: int = 0, stage: str = "") -> dict | None:
+        """
+        Record one generation, if it is sampled.
+
+        Args:
+            fitness_values (list[float]): Fitness of every individual.
+            eval_stats (dict | None): `GASolver.eval_stats` of the generation.
+            force (bool): Record even if the generation is not sampled (e.g. the last one).
+            run (int), stage (str): Tags identifying the series.
+
+        Returns:
+            dict | None: The record, or None if the generation was skipped.
+        """
+        if not force and generation % self.sample_every:
+            return None
+
+        n = len(fitness_values)
+        avg = sum(fitness_values) / n
+        eval_stats = eval_stats or {}
+        record = {
+            "run": run,
+            "stage": stage,
+            "generation": generation,
+            "best_fitness": max(fitness_values),
+            "avg_fitness": avg,
+            # Standard deviation of fitness in the population
+            "diversity": math.sqrt(sum((value - avg) ** 2 for value in fitness_values) / n),
+            "unique_states": eval_stats.get("unique_states", n),
+            "population": eval_stats.get("population", n),
+            "eval_time": eval_stats.get("eval_time", 0.0),
+        }
+
+        if not self.quiet:
+            print(
+                f"Generation {generation}: Best fitness = {record['best_fitness']:.4f}, "
+                f"Avg fitness = {avg:.4f}, Unique states = {record['unique_states']}/{record['population']}"
+            )
+        if self.path is not None:
+            self.buffer.append(record)
+            if len(self.buffer) >= self.buffer_size:
+                self.flush()
+        return record
+
+    def flush(self):
+        """Write buffered records to the file."""
+        if not self.buffer:
+            return
+        if self._file is None:
+            self._file = open(self.path, "w", newline="")
+            if self.path.lower().endswith(".csv"):
+                self._writer = csv.DictWriter(self._file, fieldnames=FIELDS)
+                self._writer.writeheader()
+
+        if self._writer is not None:
+            self._writer.writerows(self.buffer)
+        else:
+            self._file.write("".join(json.dumps(record) + "\n" for record in self.buffer))
+        self._file.flush()
+        self.buffer = []
+
+    def close(self):
+        """Write remaining records and close the file."""
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def read_records(path: str) -> list[dict]:
+    """Read a telemetry file written by `Telemetry` (CSV or JSONL)."""
+    with open(path, newline="") as file:
+        if path.lower().endswith(".jsonl"):
+            return [json.loads(line) for line in file if line.strip()]
+
+        records = []
+        for row in csv.DictReader(file):
+            record = {"stage": row["stage"]}
+            for name in ("run", "generation", "unique_states", "population"):
+                record[name] = int(row[name])
+            for name in ("best_fitness", "avg_fitness", "diversity", "eval_time"):
+                record[name] = float(row[name])
+            records.append(record)
+        return records
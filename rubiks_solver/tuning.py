@@ -0,0 +1,184 @@
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from rubiks_solver.ga import GASolver
+from rubiks_solver.config import STAGES_TILES, STAGES_CUBIES
+from rubiks_solver.cube import Cube
+from rubiks_solver.rng import derive_seed
+
+
+def sample_configs(space: dict, n: int, seed: int | None = None) -> list[dict]:
+    """
+    Draw `n` distinct random configurations from a search space.
+
+    Args:
+        space (dict): Parameter name -> list of candidate values (see `TUNING_SPACE`).
+        n (int): Number of configurations (capped at the size of the space).
+        seed (int | None): Seed for reproducible sampling.
+    """
+    rng = random.Random(seed)
+    n = min(n, math.prod(len(values) for values in space.values()))
+    configs = []
+    seen = set()
+    while len(configs) < n:
+        config = {name: rng.choice(values) for name, values in space.items()}
+        key = tuple(config.values())
+        if key not in seen:
+            seen.add(key)
+            configs.append(config)
+    return configs
+
+
+def run_trial(config: dict, scramble: list[str], stage: str, max_generations: int,
+              eval_method: str = "correct_tiles", seed: int | None = None) -> dict:
+    """
+    Run a single GA with `config` on one stage and measure time-to-solution.
+
+    Returns:
+        dict: "solved", "generations", "time" and "best_fitness" of the run.
+    """
+    stages = STAGES_TILES if eval_method == "correct_tiles" else STAGES_CUBIES
+    target_state = stages[stage]
+
+    start = time.perf_counter()
+    cube = Cube()
+    cube.shuffle(scramble)
+    ga_solver = GASolver(
+        starting_cube=cube,
+        pop_size=config["pop_size"],
+        crossover_prob=config["crossover_prob"],
+        mutation_prob=config["mutation_prob"],
+        min_chromosome_len=config["chromosome_len"][0],
+        max_chromosome_len=config["chromosome_len"][1],
+        elite_size=config["elite_size"],
+        rng=random.Random(seed),
+    )
+    ga_solver.init_population()
+    ga_solver.evaluate(target_state, method=eval_method)
+    best = max(ga_solver.population, key=lambda ind: ind.fitness)
+
+    gen = 0
+    while best.fitness < 1.0 and gen < max_generations:
+        best = ga_solver.step(target_state, method=eval_method, selection=config["selection"])
+        gen += 1
+
+    return {
+        "solved": best.fitness == 1.0,
+        "generations": gen,
+        "time": time.perf_counter() - start,
+        "best_fitness": best.fitness,
+    }
+
+
+def _run_trial_args(args):
+    """Unpack arguments for `run_trial` (process pool helper)."""
+    return run_trial(*args)
+
+
+def summarize(config: dict, trials: dict[str, list[dict]]) -> dict:
+    """
+    Aggregate trial results of one configuration.
+
+    Args:
+        trials (dict[str, list[dict]]): Stage name -> results of `run_trial`.
+
+    Returns:
+        dict: Per stage success rate and mean time (unsolved runs count with their full time),
+        plus overall "success_rate", "time" and "best_fitness".
+    """
+    stages = {}
+    for stage, results in trials.items():
+        stages[stage] = {
+            "success_rate": sum(r["solved"] for r in results) / len(results),
+            "time": sum(r["time"] for r in results) / len(results),
+            "best_fitness": sum(r["best_fitness"] for r in results) / len(results),
+        }
+    return {
+        "config": config,
+        "stages": stages,
+        "success_rate": sum(s["success_rate"] for s in stages.values()) / len(stages),
+        "time": sum(s["time"] for s in stages.values()),
+        "best_fitness": sum(s["best_fitness"] for s in stages.values()) / len(stages),
+    }
+
+
+def _rank_key(summary: dict):
+    """Rank by success rate, then time-to-solution, then fitness."""
+    return (-summary["success_rate"], summary["time"], -summary["best_fitness"])
+
+
+def successive_halving(
+    configs: list[dict],
+    scramble: list[str],
+    stages: list[str],
+    min_generations: int,
+    max_generations: int,
+    eta: int = 3,
+    repeats: int = 3,
+    eval_method: str = "correct_tiles",
+    workers: int | None = None,
+    seed: int | None = None,
+) -> list[dict]:
+    """
+    Race GA configurations with successive halving.
+
+    All configurations get a budget of `min_generations`; after each round only the best
+    1/`eta` survive and their budget is multiplied by `eta`, up to `max_generations`.
+    Trials of a round run in parallel on a process pool, each with its own generator
+    derived from `seed`, so the whole race is reproducible.
+
+    Returns:
+        list[dict]: Summaries (see `summarize`) of the last round each configuration reached,
+        best first. Each summary also has "budget" set to that round's generation budget.
+    """
+    seed = seed if seed is not None else random.getrandbits(64)
+    survivors = list(configs)
+    budget = min_generations
+    final = []
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        while survivors:
+            jobs = [
+                (config, scramble, stage, budget, eval_method, derive_seed(seed, budget, i, k, j))
+                for i, config in enumerate(survivors)
+                for k, stage in enumerate(stages)
+                for j in range(repeats)
+            ]
+            results = iter(pool.map(_run_trial_args, jobs))
+
+            summaries = []
+            for config in survivors:
+                trials = {stage: [next(results) for _ in range(repeats)] for stage in stages}
+                summary = summarize(config, trials)
+                summary["budget"] = budget
+                summaries.append(summary)
+            summaries.sort(key=_rank_key)
+
+            keep = len(summaries) // eta
+            if keep == 0 or budget * eta > max_generations:
+                final = summaries + final
+                break
+            final = summaries[keep:] + final
+            survivors = [s["config"] for s in summaries[:keep]]
+            budget *= eta
+
+    return final
+
+
+def format_report(summaries: list[dict]) -> str:
+    """Format a ranked report of tuning results, one configuration per block."""
+    lines = []
+    for rank, summary in enumerate(summaries, start=1):
+        config = ", ".join(f"{name}={value}" for name, value in summary["config"].items())
+        lines.append(
+            f"#{rank} budget={summary['budget']} success={summary['success_rate']:.2f} "
+            f"time={summary['time']:.3f} s fitness={summary['best_fitness']:.4f}"
+        )
+        lines.append(f"    {config}")
+        for stage, stats in summary["stages"].items():
+            lines.append(
+                f"    {stage}: success={stats['success_rate']:.2f} time={stats['time']:.3f} s"
+            )
+    return "\n".join(lines)
@@ -0,0 +1,40 @@
+import os
+
+from rubiks_solver.corpus import generate_corpus, save_corpus, load_corpus, run_benchmark, format_benchmark
+from rubiks_solver.endgame import EndgameTable
+from rubiks_solver.config import (
+    CORPUS_DEPTHS, CORPUS_PER_DEPTH, CORPUS_PATH, BENCHMARK_DEADLINE, ENDGAME_DEPTH, ENDGAME_PATH
+)
+
+
+def main():
+    # --- CONFIG ---
+    SOLVERS = ["staged", "end_to_end"]
+    EVAL_METHOD = "cubies_position"
+    USE_ENDGAME = True  # finish individuals near solved from the endgame table
+    WORKERS = None  # None = one worker per CPU
+    SEED = 0
+
+    if not os.path.exists(CORPUS_PATH):
+        print(f"Generating corpus {CORPUS_PATH}: {CORPUS_PER_DEPTH} scrambles at depths {CORPUS_DEPTHS}")
+        save_corpus(CORPUS_PATH, generate_corpus(CORPUS_DEPTHS, CORPUS_PER_DEPTH, seed=SEED))
+    scrambles = load_corpus(CORPUS_PATH)
+
+    endgame_path = None
+    if USE_ENDGAME:
+        print(f"Loading endgame table {ENDGAME_PATH} (built on first use)...")
+        EndgameTable.load_or_build(ENDGAME_PATH, ENDGAME_DEPTH).close()
+        endgame_path = ENDGAME_PATH
+
+    for solver in SOLVERS:
+        print(f"\nBenchmarking {solver} solver on {len(scrambles)} scrambles "
+              f"(deadline {BENCHMARK_DEADLINE} s per solve)...")
+        report = run_benchmark(
+            scrambles, solver=solver, deadline=BENCHMARK_DEADLINE, eval_method=EVAL_METHOD,
+            endgame_path=endgame_path, workers=WORKERS, seed=SEED,
+        )
+        print(format_benchmark(report))
+
+
+if __name__ == "__main__":
+    main()
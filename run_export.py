@@ -0,0 +1,28 @@
+import time
+
+from rubiks_solver.export import export_playback
+from rubiks_solver.config import SHUFFLE_SEQUENCE
+from rubiks_solver.cube import Cube
+
+
+def main():
+    # --- CONFIG ---
+    OUTPUT_PATH = "playback.gif"  # ".gif" or ".png" (APNG)
+    SCRAMBLE = SHUFFLE_SEQUENCE
+    SOLUTION = [Cube().opposite_move[move] for move in reversed(SHUFFLE_SEQUENCE)]
+    SIZE = (300, 300)
+    PERSPECTIVE = True
+    FPS = 8
+    WORKERS = 4
+
+    start = time.perf_counter()
+    frames = export_playback(
+        OUTPUT_PATH, SCRAMBLE, SOLUTION,
+        size=SIZE, perspective=PERSPECTIVE, fps=FPS, workers=WORKERS
+    )
+    elapsed = time.perf_counter() - start
+    print(f"Exported {frames} frames to {OUTPUT_PATH} in {elapsed:.3f} s ({frames / elapsed:.1f} frames/s)")
+
+
+if __name__ == "__main__":
+    main()
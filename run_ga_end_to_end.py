@@ -2,9 +2,12 @@ import time
 from rubiks_solver.ga import GASolver, Individual
 from rubiks_solver.config import (
     POPULATION_SIZE, MAX_GENERATIONS, CROSSOVER_RATE, MUTATION_RATE,
-    STAGES_CUBIES, SHUFFLE_SEQUENCE, STAGES_TILES
+    STAGES_CUBIES, SHUFFLE_SEQUENCE, STAGES_TILES, ENDGAME_DEPTH, ENDGAME_PATH
 )
 from rubiks_solver.cube import Cube
+from rubiks_solver.endgame import EndgameTable
+from rubiks_solver.telemetry import Telemetry
+from rubiks_solver.optimize import optimize_solution
 
 def main():
     # --- CONFIG ---
@@ -12,11 +15,21 @@ def main():
     EVAL_METHOD = "correct_tiles" #"cubies_position"
     MIN_CHROMO_LEN = 26
     MAX_CHROMO_LEN = 50
+    TELEMETRY_PATH = "telemetry_end_to_end.csv"  # per-generation records, see run_plot_telemetry.py
+    SAMPLE_EVERY = 1  # record every n-th generation
+    QUIET = False  # do not print generation summaries
+    USE_ENDGAME = True  # finish individuals within ENDGAME_DEPTH moves of solved from the table
     STAGES = STAGES_CUBIES if EVAL_METHOD == "cubies_position" else STAGES_TILES
 
+    endgame = None
+    if USE_ENDGAME:
+        print(f"Loading endgame table {ENDGAME_PATH} (built on first use)...")
+        endgame = EndgameTable.load_or_build(ENDGAME_PATH, ENDGAME_DEPTH)
+
     all_best_fitness = []
     all_times = []
     best_ever_overall = None
+    telemetry = Telemetry(TELEMETRY_PATH, sample_every=SAMPLE_EVERY, quiet=QUIET)
 
     for run in range(NUM_RUNS):
         print(f"\n=== Run {run + 1}/{NUM_RUNS} ===")
@@ -32,6 +45,7 @@ def main():
             mutation_prob=MUTATION_RATE,
             min_chromosome_len=MIN_CHROMO_LEN,
             max_chromosome_len=MAX_CHROMO_LEN,
+            endgame=endgame,
         )
         ga_solver.init_population()
         ga_solver.evaluate(STAGES["full_cube"], method=EVAL_METHOD)
@@ -48,14 +62,14 @@ def main():
 
             fitness_values = [ind.fitness for ind in ga_solver.population]
             best_in_gen = max(ga_solver.population, key=lambda ind: ind.fitness)
-            avg_fitness = sum(fitness_values) / len(fitness_values)
 
             # --- save copy of best ---
             if best_ever_individual is None or best_in_gen.fitness > best_ever_individual.fitness:
                 best_ever_individual = Individual(best_in_gen.chromosome[:])
                 best_ever_individual.fitness = best_in_gen.fitness
 
-            print(f"Generation {gen}: Best fitness = {best_in_gen.fitness:.4f}, Avg fitness = {avg_fitness:.4f}")
+            finished = best_in_gen.fitness == 1.0 or gen == MAX_GENERATIONS - 1
+            telemetry.record(gen, fitness_values, ga_solver.eval_stats, force=finished, run=run)
 
             if best_in_gen.fitness == 1.0:
                 print(f"Solution found in generation {gen}")
@@ -72,6 +86,8 @@ def main():
         if best_ever_overall is None or best_ever_individual.fitness > best_ever_overall.fitness:
             best_ever_overall = best_ever_individual
 
+    telemetry.close()
+
     # --- SUMMARY ---
     avg_best_fitness = sum(all_best_fitness) / NUM_RUNS
     avg_time = sum(all_times) / NUM_RUNS
@@ -81,6 +97,8 @@ def main():
     print(f"Average execution time: {avg_time:.3f} s")
     print("Best ever chromosome overall:", best_ever_overall.chromosome)
     print("Best ever fitness overall:", best_ever_overall.fitness)
+    optimized = optimize_solution(best_ever_overall.chromosome)
+    print(f"Optimized best chromosome ({len(optimized)} moves):", optimized)
 
 if __name__ == "__main__":
     main()
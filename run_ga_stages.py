@@ -3,28 +3,49 @@ import sys
 from rubiks_solver.ga import GASolver
 from rubiks_solver.config import (
     POPULATION_SIZE, MAX_GENERATIONS, CROSSOVER_RATE, MUTATION_RATE,
-    SHUFFLE_SEQUENCE, STAGES_TILES, STAGES_CUBIES
+    SHUFFLE_SEQUENCE, STAGES_TILES, STAGES_CUBIES, MACRO_LIBRARY, STAGE_MACROS,
+    MOVE_SETS, STAGE_MOVE_SETS, STAGE_CHROMOSOME_LENGTH, SOLUTION_CACHE_PATH, WARM_START_SEEDS
 )
 from rubiks_solver.cube import Cube
+from rubiks_solver.telemetry import Telemetry
+from rubiks_solver.optimize import optimize_solution
+from rubiks_solver.cache import SolutionCache
+from rubiks_solver.solve import apply_stage_solution
 
 
-def run_stage(stage_name, cube, max_generation, min_chromosome_len, max_chromosome_len, eval_method="correct_tiles"):
+def run_stage(stage_name, cube, max_generation, min_chromosome_len, max_chromosome_len, eval_method="correct_tiles",
+              telemetry=None, cache=None):
     """
     Run a single GA stage for the cube.
 
     stage_name: key in STAGES_TILES / STAGES_CUBIES
     eval_method: "correct_tiles" or "cubies_position"
-    Returns (fitness, chromosome).
+    telemetry: Telemetry receiving per-generation records (default: print every generation)
+    cache: SolutionCache with stage solutions of earlier runs (also seeds the population)
+    Returns (fitness, chromosome) with macros expanded.
     """
+    if telemetry is None:
+        telemetry = Telemetry()
     stages = STAGES_TILES if eval_method == "correct_tiles" else STAGES_CUBIES
     if stage_name not in stages:
         raise ValueError(f"Unknown stage name: {stage_name}")
 
+    cache_stage = f"{stage_name}:{eval_method}"
+    if cache is not None:
+        cached = cache.get(cube, cache_stage)
+        if cached is not None:
+            print("Solution found in cache")
+            return 1.0, cached
+
+    macros = {name: MACRO_LIBRARY[name] for name in STAGE_MACROS.get(stage_name, [])}
+    move_set = MOVE_SETS[STAGE_MOVE_SETS.get(stage_name, "quarter_turn")]
     ga_solver = GASolver(
         cube, POPULATION_SIZE, CROSSOVER_RATE, MUTATION_RATE,
-        min_chromosome_len, max_chromosome_len
+        min_chromosome_len, max_chromosome_len, macros, move_set=move_set
+    )
+    ga_solver.init_population(
+        cache.similar(cube, cache_stage, WARM_START_SEEDS, genes=ga_solver.genes) if cache is not None else None
     )
-    ga_solver.init_population()
     ga_solver.evaluate(target_state=stages[stage_name], method=eval_method)
 
     best_solution = None
@@ -39,7 +60,11 @@ def run_stage(stage_name, cube, max_generation, min_chromosome_len, max_chromoso
         ga_solver.evaluate(target_state=stages[stage_name], method=eval_method)
 
         current_best = max(ga_solver.population, key=lambda ind: ind.fitness)
-        print(f"Generation {gen}: Best fitness = {current_best.fitness:.4f}")
+        finished = current_best.fitness == 1.0 or gen == max_generation - 1
+        telemetry.record(
+            gen, [ind.fitness for ind in ga_solver.population], ga_solver.eval_stats,
+            force=finished, stage=stage_name
+        )
 
         if best_solution is None or current_best.fitness > best_solution.fitness:
             best_solution = current_best
@@ -48,21 +73,28 @@ def run_stage(stage_name, cube, max_generation, min_chromosome_len, max_chromoso
             print(f"Solution found in generation {gen}")
             break
     
-    return best_solution.fitness, best_solution.chromosome
+    solution = ga_solver.starting_cube.expand_macros(best_solution.chromosome)
+    if cache is not None and best_solution.fitness == 1.0:
+        cache.put(cube, cache_stage, solution)
+    return best_solution.fitness, solution
 
 
-def run_and_check(stage_name, cube, min_len, max_len, sequences, eval_method="cubies_position"):
+def run_and_check(stage_name, cube, min_len, max_len, sequences, eval_method="cubies_position", telemetry=None,
+                  cache=None):
     """Helper: run stage, update cube, append sequence, exit if failed."""
     print(f"\n=== {stage_name.upper()} ===")
-    fitness, chromosome = run_stage(stage_name, cube, MAX_GENERATIONS, min_len, max_len, eval_method)
-    sequences.append(chromosome)
-    cube.shuffle(chromosome)
+    fitness, chromosome = run_stage(stage_name, cube, MAX_GENERATIONS, min_len, max_len, eval_method, telemetry, cache)
+    sequences.append(apply_stage_solution(cube, chromosome))
 
     if fitness == 1.0:
         print(f"{stage_name.capitalize()} finished with success!")
     else:
         print(f"{stage_name.capitalize()} finished with failure!")
         print(f"Best fitness: {fitness:.4f}, with sequences: {sequences}")
+        if telemetry is not None:
+            telemetry.close()
+        if cache is not None:
+            cache.close()
         sys.exit()
 
 
@@ -72,10 +104,19 @@ if __name__ == "__main__":
     cube.shuffle(SHUFFLE_SEQUENCE)
     sequences = []
     eval_method = "cubies_position"
-
-    run_and_check("white_cross", cube, 7, 10, sequences, eval_method)
-    run_and_check("first_layer", cube, 20, 50, sequences, eval_method)
-    run_and_check("second_layer", cube, 20, 50, sequences, eval_method)
-    run_and_check("full_cube", cube, 20, 50, sequences, eval_method)
-
-    print("Cube solved!")
\ No newline at end of file
+    # Per-generation records of all stages, see run_plot_telemetry.py
+    telemetry = Telemetry("telemetry_stages.csv", sample_every=1, quiet=False)
+    # Stage solutions of earlier runs: repeated stages are skipped, similar ones warm-started
+    cache = SolutionCache(SOLUTION_CACHE_PATH)
+
+    for stage_name in ("white_cross", "first_layer", "second_layer", "full_cube"):
+        min_len, max_len = STAGE_CHROMOSOME_LENGTH[stage_name]
+        run_and_check(stage_name, cube, min_len, max_len, sequences, eval_method, telemetry, cache)
+    telemetry.close()
+    cache.close()
+
+    print("Cube solved!")
+    solution = [move for sequence in sequences for move in sequence]
+    optimized = optimize_solution(solution)
+    print(f"Solution: {len(solution)} moves, optimized: {len(optimized)} moves")
+    print("Optimized solution:", optimized)
\ No newline at end of file
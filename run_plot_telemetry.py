@@ -0,0 +1,18 @@
+from rubiks_solver.telemetry import read_records
+from rubiks_solver.plot import render_fitness_plot
+
+
+def main():
+    # --- CONFIG ---
+    INPUT_PATH = "telemetry_end_to_end.csv"  # written by run_ga_end_to_end.py / run_ga_stages.py
+    OUTPUT_PATH = "figures/fitness_plot.png"
+    SIZE = (1000, 600)
+    TITLE = "Fitness evolution"
+
+    records = read_records(INPUT_PATH)
+    render_fitness_plot(records, OUTPUT_PATH, size=SIZE, title=TITLE)
+    print(f"Plotted {len(records)} records from {INPUT_PATH} to {OUTPUT_PATH}")
+
+
+if __name__ == "__main__":
+    main()
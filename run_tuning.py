@@ -0,0 +1,36 @@
+from rubiks_solver.tuning import sample_configs, successive_halving, format_report
+from rubiks_solver.config import (
+    SHUFFLE_SEQUENCE, TUNING_SPACE, TUNING_NUM_CONFIGS, TUNING_MIN_GENERATIONS,
+    TUNING_MAX_GENERATIONS, TUNING_ETA, TUNING_REPEATS
+)
+
+
+def main():
+    # --- CONFIG ---
+    STAGES = ["white_cross", "first_layer"]
+    EVAL_METHOD = "correct_tiles"
+    WORKERS = None  # None = one worker per CPU
+    SEED = 0
+
+    configs = sample_configs(TUNING_SPACE, TUNING_NUM_CONFIGS, seed=SEED)
+    print(f"Tuning {len(configs)} configurations on stages: {', '.join(STAGES)}")
+
+    summaries = successive_halving(
+        configs,
+        scramble=SHUFFLE_SEQUENCE,
+        stages=STAGES,
+        min_generations=TUNING_MIN_GENERATIONS,
+        max_generations=TUNING_MAX_GENERATIONS,
+        eta=TUNING_ETA,
+        repeats=TUNING_REPEATS,
+        eval_method=EVAL_METHOD,
+        workers=WORKERS,
+        seed=SEED,
+    )
+
+    print("\n=== TUNING REPORT ===")
+    print(format_report(summaries))
+
+
+if __name__ == "__main__":
+    main()
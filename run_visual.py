@@ -1,9 +1,10 @@
 import pygame
 
 from rubiks_solver.config import SCREEN_WIDTH, SCREEN_HEIGHT, SHUFFLE_SEQUENCE
-from rubiks_solver.render import render_cube_perspective, render_cube_orthographic, draw_button
+from rubiks_solver.render import CubeRenderer, draw_button
 from rubiks_solver.cube import Cube
 from rubiks_solver.controls import handle_keyboard
+from rubiks_solver.live import LiveSolver
 
 def main():
     # --- Initialize pygame ---
@@ -15,40 +16,72 @@ def main():
 
     # --- Cube state ---
     cube = Cube()
+    renderer = CubeRenderer()
 
     # --- Main loop ---
     running = True
     perspective_view = True
+    drawn_version = None
+    live_solver = None
 
-    while running:
-        screen.fill("white")
+    def toggle_live_solver():
+        nonlocal live_solver
+        if live_solver is None:
+            live_solver = LiveSolver(cube)
+            live_solver.start()
+        else:
+            live_solver.stop()
+            live_solver = None
 
+    while running:
         events = pygame.event.get()
         for event in events:
             if event.type == pygame.QUIT:
                 running = False
+
+        # --- Live GA: take the newest best individual, never wait for the solver ---
+        live_updated = live_solver is not None and live_solver.poll()
+        shown_cube = live_solver.best_cube if live_solver is not None else cube
+
+        # --- Idle: nothing to redraw until an event arrives or the cube changes ---
+        if not events and not live_updated and shown_cube.version == drawn_version:
+            clock.tick(60)
+            continue
+
+        screen.fill("white")
         
         # --- UI buttons ---
         draw_button(screen, font, "Shuffle", (50, 30), events, on_click=lambda: cube.shuffle(None))
         draw_button(screen, font, "Shuffle GA", (160, 30), events, on_click=lambda: [cube.reset(), cube.shuffle(SHUFFLE_SEQUENCE)])
         draw_button(screen, font, "Reset", (262, 30), events, on_click=cube.reset)
+        live_text = "Stop live GA" if live_solver is not None else "Solve live GA"
+        draw_button(screen, font, live_text, (80, SCREEN_HEIGHT - 30), events, on_click=toggle_live_solver)
 
         view_text = "Switch to orthographic" if perspective_view else "Switch to perspective"
         if draw_button(screen, font, view_text, (423, 30), events):
             perspective_view = not perspective_view
 
-        # --- Handle keyboard input ---
-        handle_keyboard(cube, events)
+        # --- Handle keyboard input (the live view shows the solver's cube, not the manual one) ---
+        if live_solver is None:
+            handle_keyboard(cube, events)
+        else:
+            stats = live_solver.latest
+            readout = "Starting solver..." if stats is None else (
+                f"Gen {stats['generation']}: best {stats['best_fitness']:.4f}, avg {stats['avg_fitness']:.4f}"
+                + (" (done)" if stats["done"] else "")
+            )
+            screen.blit(font.render(readout, True, (0, 0, 0)), (170, SCREEN_HEIGHT - 40))
 
         # --- Render cube ---
-        if perspective_view:
-            render_cube_perspective(screen, cube)
-        else:
-            render_cube_orthographic(screen, cube)
+        shown_cube = live_solver.best_cube if live_solver is not None else cube
+        renderer.render(screen, shown_cube, perspective_view)
+        drawn_version = shown_cube.version
 
         pygame.display.flip()
         clock.tick(60)
 
+    if live_solver is not None:
+        live_solver.stop()
     pygame.quit()
 
 
@@ -0,0 +1,87 @@
+import random
+
+import pytest
+
+from rubiks_solver.cache import SolutionCache
+from rubiks_solver.ga import GASolver
+from rubiks_solver.solve import iter_solve
+from rubiks_solver.cube import Cube
+
+
+def _scrambled(sequence):
+    cube = Cube()
+    cube.shuffle(sequence)
+    return cube
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = SolutionCache(str(tmp_path / "cache.sqlite"), max_entries=3)
+    yield cache
+    cache.close()
+
+
+def test_solution_found_in_any_orientation(tmp_path, cache):
+    cube = _scrambled(["R", "U"])
+    cache.put(cube, "full_cube", ["U'", "R'"])
+    assert cache.get(cube, "full_cube") == ["U'", "R'"]
+    assert cache.get(cube, "white_cross") is None
+
+    rotated = cube.copy()
+    rotated.shuffle(["x", "y"])
+    solution = cache.get(rotated, "full_cube")
+    rotated.shuffle(solution)
+    rotated.normalize_orientation()
+    assert rotated.faces == Cube().faces
+    assert (cache.hits, cache.misses) == (2, 1)
+
+    # Persistent across instances
+    cache.close()
+    with SolutionCache(cache.path) as reopened:
+        assert reopened.get(cube, "full_cube") == ["U'", "R'"]
+
+
+def test_shorter_solutions_kept_and_size_bounded(cache):
+    cube = _scrambled(["R"])
+    cache.put(cube, "full_cube", ["R", "R"])
+    cache.put(cube, "full_cube", ["R'"])
+    cache.put(cube, "full_cube", ["R", "R", "R"])
+    assert cache.get(cube, "full_cube") == ["R'"]
+
+    for move in ["U", "F", "L"]:
+        cache.put(_scrambled([move]), "full_cube", [move + "'"])
+    assert len(cache) == 3
+    assert cache.get(cube, "full_cube") is None
+
+
+def test_similar_states_ranked_by_distance(cache):
+    cache.put(_scrambled(["R"]), "full_cube", ["R'"])
+    cache.put(_scrambled(["R", "U", "F"]), "full_cube", ["F'", "U'", "R'"])
+    assert cache.similar(_scrambled(["R", "D"]), "full_cube", 2) == [["R'"], ["F'", "U'", "R'"]]
+    assert cache.similar(_scrambled(["R", "D"]), "full_cube", 2, max_distance=8) == [["R'"]]
+
+
+def test_similar_keeps_gene_pool_solutions_of_recent_entries(cache):
+    cache.put(_scrambled(["R"]), "full_cube", ["R'"])
+    cache.put(_scrambled(["R", "U"]), "full_cube", ["x", "F'", "x'", "R'"])
+    query = _scrambled(["R", "D"])
+    assert cache.similar(query, "full_cube", 2) == [["R'"], ["x", "F'", "x'", "R'"]]
+    assert cache.similar(query, "full_cube", 2, genes=Cube.quarter_turn_symbols) == [["R'"]]
+    # Only the most recently used entry is scanned
+    assert cache.similar(query, "full_cube", 2, scan_limit=1) == [["x", "F'", "x'", "R'"]]
+
+
+def test_seeds_start_the_population():
+    ga_solver = GASolver(Cube(), 10, 0.8, 0.2, 3, 5, rng=random.Random(0))
+    ga_solver.init_population([["R", "U"], ["F"]])
+    assert len(ga_solver.population) == 10
+    assert [ind.chromosome for ind in ga_solver.population[:2]] == [["R", "U"], ["F"]]
+
+
+def test_repeat_solve_comes_from_cache(cache):
+    cube = _scrambled(["R", "U'", "F"])
+    first = list(iter_solve(cube, stages=["white_cross"], eval_method="correct_tiles", cache=cache, seed=1))
+    repeat = list(iter_solve(cube, stages=["white_cross"], eval_method="correct_tiles", cache=cache, seed=2))
+    assert first[-1]["solved"] and repeat[-1]["solved"]
+    assert len(repeat) == 2 and repeat[0]["generation"] == 0
+    assert repeat[-1]["solution"] == first[-1]["solution"]
@@ -0,0 +1,74 @@
+import random
+
+import pytest
+
+from rubiks_solver.codec import (
+    to_facelets, from_facelets, validate_state, is_solvable, pack, unpack, pack_many, unpack_many,
+    save_states, load_states, STATE_SIZE
+)
+from rubiks_solver.cube import Cube
+
+SOLVED_FACELETS = "UUUUUUUUURRRRRRRRRFFFFFFFFFDDDDDDDDDLLLLLLLLLBBBBBBBBB"
+
+
+def _scrambled(seed, moves=None):
+    rng = random.Random(seed)
+    cube = Cube()
+    cube.shuffle([rng.choice(moves or cube.quarter_turn_symbols) for _ in range(30)])
+    return cube
+
+
+def test_facelet_string_round_trip():
+    assert to_facelets(Cube()) == SOLVED_FACELETS
+    cube = Cube()
+    cube.R()
+    assert to_facelets(cube) == "UUFUUFUUFRRRRRRRRRFFDFFDFFDDDBDDBDDBLLLLLLLLLUBBUBBUBB"
+    cube = _scrambled(1)
+    assert from_facelets(to_facelets(cube)).faces == cube.faces
+
+    with pytest.raises(ValueError):
+        from_facelets(SOLVED_FACELETS[:-1])
+    with pytest.raises(ValueError):
+        from_facelets(SOLVED_FACELETS[:-1] + "X")
+
+
+def test_packed_state_is_orientation_invariant():
+    cube = _scrambled(2, moves=list(Cube.all_moves_symbols))
+    data = pack(cube)
+    assert len(data) == STATE_SIZE
+    cube.shuffle(["x", "y'"])
+    assert pack(cube) == data
+
+    oriented = cube.copy()
+    oriented.normalize_orientation()
+    assert unpack(data).faces == oriented.faces
+
+
+def test_validation_rejects_unsolvable_states():
+    facelets = list(SOLVED_FACELETS)
+    twisted = facelets[:]
+    twisted[8], twisted[9], twisted[20] = facelets[9], facelets[20], facelets[8]
+    flipped = facelets[:]
+    flipped[5], flipped[10] = facelets[10], facelets[5]
+    # UF and UR edges exchanged
+    swapped = Cube()
+    swapped.faces["F"][0][1], swapped.faces["R"][0][1] = "R", "G"
+
+    assert is_solvable(_scrambled(3))
+    assert not is_solvable(from_facelets("".join(twisted), validate=False))
+    assert not is_solvable(from_facelets("".join(flipped), validate=False))
+    with pytest.raises(ValueError, match="parities"):
+        validate_state(swapped)
+
+
+def test_bulk_encoding(tmp_path):
+    cubes = [_scrambled(seed) for seed in range(20)]
+    buffer = pack_many(cubes)
+    assert len(buffer) == 20 * STATE_SIZE
+    assert [cube.faces for cube in unpack_many(bytearray(buffer))] == [cube.faces for cube in cubes]
+
+    path = str(tmp_path / "states.bin")
+    assert save_states(path, cubes) == 20
+    assert [pack(cube) for cube in load_states(path)] == [pack(cube) for cube in cubes]
+    with pytest.raises(ValueError):
+        unpack_many(buffer[:-1])
@@ -0,0 +1,50 @@
+import random
+
+import pytest
+
+from rubiks_solver.corpus import (
+    random_scramble, generate_corpus, save_corpus, load_corpus, percentile, run_benchmark, format_benchmark
+)
+
+
+def test_corpus_is_reproducible_and_stable():
+    corpus = generate_corpus([1, 4], 3, seed=7)
+    assert [len(scramble) for scramble in corpus] == [1, 1, 1, 4, 4, 4]
+    assert corpus == generate_corpus([1, 4], 3, seed=7)
+    # Adding depths keeps the existing scrambles
+    assert generate_corpus([1, 2, 4], 3, seed=7)[-3:] == corpus[-3:]
+    for scramble in corpus:
+        assert all(a[0] != b[0] for a, b in zip(scramble, scramble[1:]))
+
+
+def test_corpus_round_trip(tmp_path):
+    path = str(tmp_path / "corpus.bin")
+    corpus = generate_corpus([0, 5, 20], 4, seed=1)
+    save_corpus(path, corpus)
+    assert load_corpus(path) == corpus
+    # Length byte plus one byte per move
+    assert (tmp_path / "corpus.bin").stat().st_size < 200 + sum(len(s) + 1 for s in corpus)
+
+    (tmp_path / "bad.bin").write_bytes(b"nope")
+    with pytest.raises(ValueError):
+        load_corpus(str(tmp_path / "bad.bin"))
+
+
+def test_percentile_nearest_rank():
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile([3.0], 95) == 3.0
+
+
+def test_benchmark_reports_per_depth():
+    scrambles = [random_scramble(1, random.Random(i)) for i in range(3)]
+    report = run_benchmark(scrambles, solver="end_to_end", deadline=0.5, workers=1, seed=0)
+    assert report["scrambles"] == 3
+    stats = report["depths"][1]
+    assert stats["scrambles"] == 3
+    assert stats["p50"] <= stats["p95"] <= stats["p99"]
+    assert "depth" in format_benchmark(report)
+
+    with pytest.raises(ValueError):
+        run_benchmark(scrambles, solver="no_such_solver", workers=1)
@@ -1,6 +1,7 @@
 import pytest
 
-from rubiks_solver.cube import Cube
+from rubiks_solver.cube import Cube, ORIENTATIONS
+from rubiks_solver.config import MACRO_LIBRARY, STAGES_TILES
 
 def test_copy_independence():
     cube = Cube()
@@ -8,6 +9,22 @@ def test_copy_independence():
     copy_cube.F()
     assert cube.faces != copy_cube.faces
 
+def test_copy_from_resets_in_place():
+    source = Cube()
+    source.shuffle(["R", "U", "F'"])
+    scratch = Cube()
+    rows = [row for face in scratch.faces.values() for row in face]
+    scratch.copy_from(source)
+    assert scratch.faces == source.faces and scratch.state_hash == source.state_hash
+    assert all(a is b for a, b in zip(rows, (row for face in scratch.faces.values() for row in face)))
+    scratch.F()
+    assert scratch.faces != source.faces
+
+def test_move_tables_are_shared_and_immutable():
+    assert Cube().corners is Cube().corners
+    with pytest.raises(TypeError):
+        Cube().opposite_move["F"] = "F"
+
 def test_shuffle_should_change_state():
     shuffled = Cube()
     solved = Cube()
@@ -42,4 +59,117 @@ def test_opposite_rotations_should_not_change_state():
     test = Cube()
     test._rotate_face_ccw("F")
     test._rotate_face_cw("F")
-    assert test.faces == solved.faces
\ No newline at end of file
+    assert test.faces == solved.faces
+
+def test_half_turns_equal_two_quarter_turns():
+    for face in "FBLRUD":
+        expected = Cube()
+        expected.shuffle([face, face])
+        test = Cube()
+        test.shuffle([face + "2"])
+        assert test.faces == expected.faces
+
+def test_wide_moves_equal_opposite_face_turn_and_rotation():
+    for wide, face, rotate in (("Rw", "L", Cube.rotate_x), ("Uw", "D", Cube.rotate_y), ("Fw", "B", Cube.rotate_z)):
+        expected = Cube()
+        expected.shuffle([face])
+        rotate(expected)
+        test = Cube()
+        test.shuffle([wide])
+        assert test.faces == expected.faces
+
+def test_slice_moves_keep_outer_layers():
+    for move, kept in (("M", ("L", "R")), ("E", ("U", "D")), ("S", ("F", "B"))):
+        test = Cube()
+        test.shuffle(["R", "U", "F"])
+        before = test.copy()
+        test.shuffle([move])
+        assert all(test.faces[face] == before.faces[face] for face in kept)
+        assert test.faces != before.faces
+        test.shuffle([move] * 3)
+        assert test.faces == before.faces
+
+def test_rotation_repeated_four_times_should_not_change_state():
+    for rotate in (Cube.rotate_x, Cube.rotate_y, Cube.rotate_z):
+        test = Cube()
+        test.shuffle(["R", "U", "F'"])
+        before = test.copy()
+        for _ in range(4):
+            rotate(test)
+        assert test.faces == before.faces
+
+def test_normalize_orientation_covers_all_24_orientations():
+    assert len(ORIENTATIONS) == 24
+    for rotations, _ in ORIENTATIONS.values():
+        test = Cube()
+        test.shuffle([test.opposite_move[rotation] for rotation in reversed(rotations)])
+        applied = test.normalize_orientation()
+        assert test.faces == Cube().faces
+        assert list(applied) == list(rotations)
+
+def test_normalize_orientation_undoes_wide_moves():
+    test = Cube()
+    test.shuffle(["Rw", "L'"])
+    assert test.normalize_orientation() != []
+    assert test.faces == Cube().faces
+    assert test.normalize_orientation() == []
+
+def test_compiled_sequence_matches_move_by_move():
+    sequence = ["R", "U", "R'", "U'", "F", "D'"]
+    expected = Cube()
+    expected.shuffle(sequence)
+    test = Cube()
+    test.apply_permutation(Cube.compile_sequence(sequence))
+    assert test.faces == expected.faces
+
+def test_macro_move_equals_its_sequence():
+    sequence = ["R", "D", "R'", "D", "R", "D", "D", "R'"]
+    expected = Cube()
+    expected.shuffle(sequence)
+    test = Cube()
+    test.add_macro("sune", sequence)
+    test.shuffle(["sune"])
+    assert test.faces == expected.faces
+    assert test.expand_macros(["F", "sune"]) == ["F"] + sequence
+
+def test_macro_library_preserves_first_layer():
+    target = STAGES_TILES["first_layer"]
+    for sequence in MACRO_LIBRARY.values():
+        test = Cube()
+        test.shuffle(sequence)
+        for face, grid in target.items():
+            for target_row, row in zip(grid, test.faces[face]):
+                assert all(t is None or t == tile for t, tile in zip(target_row, row))
+
+def test_version_changes_on_every_state_change():
+    test = Cube()
+    versions = [test.version]
+    for action in (test.F, test.R_, test.rotate_x, test.reset, lambda: test.shuffle(["U"])):
+        action()
+        versions.append(test.version)
+    assert all(a < b for a, b in zip(versions, versions[1:]))
+    # Versions are never shared between cubes, so a new cube never looks already drawn
+    assert len({Cube().version, Cube().version, test.copy().version, test.version}) == 4
+
+def test_incremental_hash_matches_full_recomputation():
+    test = Cube()
+    for move in test.shuffle(lenght=50, moves=test.all_moves_symbols) + ["F'", "R'", "U'"]:
+        test.shuffle([move])
+        expected = test.state_hash
+        test._rehash()
+        assert test.state_hash == expected
+    test.rotate_x()
+    test.rotate_z()
+    expected = test.state_hash
+    test._rehash()
+    assert test.state_hash == expected
+
+def test_equal_states_have_equal_hash_and_key():
+    first = Cube()
+    second = Cube()
+    first.shuffle(["R", "R", "U"])
+    second.shuffle(["R'", "R'", "U"])
+    assert first.state_hash == second.state_hash
+    assert first.state_key() == second.state_key()
+    assert first.state_hash != Cube().state_hash
+    assert first.copy().state_hash == first.state_hash
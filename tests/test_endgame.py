@@ -0,0 +1,74 @@
+import pytest
+
+from rubiks_solver import endgame
+from rubiks_solver.endgame import EndgameTable, build_table
+from rubiks_solver.ga import GASolver, Individual
+from rubiks_solver.cube import Cube
+from rubiks_solver.config import STAGES_TILES
+
+
+@pytest.fixture(scope="module")
+def table(tmp_path_factory):
+    path = tmp_path_factory.mktemp("endgame") / "table.bin"
+    # 1 + 12 + 114 + 1068 states within 3 quarter turns
+    assert build_table(str(path), 3) == 1195
+    table = EndgameTable(str(path))
+    yield table
+    table.close()
+
+
+def test_lookup_returns_optimal_tail(table):
+    cube = Cube()
+    cube.shuffle(["R", "U", "U"])
+    tail = table.lookup(cube.state_hash)
+    assert len(tail) == 3
+    cube.shuffle(tail)
+    assert cube.faces == Cube().faces
+
+    cube.shuffle(["R", "R'", "F"])
+    assert table.lookup(cube.state_hash) == ["F'"]
+    cube.shuffle(["R", "U", "F", "L"])
+    assert table.lookup(cube.state_hash) is None
+    assert table.complete(cube) == []
+
+
+def test_evaluation_completes_individuals_in_table(table):
+    cube = Cube()
+    cube.shuffle(["F", "R", "U", "L", "B"])
+    solver = GASolver(cube, pop_size=2, crossover_prob=0.8, mutation_prob=0.2, endgame=table)
+    solver.population = [Individual(["B'", "L'"]), Individual(["B'"])]
+    solver.evaluate(STAGES_TILES["full_cube"], method="correct_tiles")
+
+    completed = solver.population[0]
+    assert completed.fitness == 1.0
+    assert completed.chromosome == ["B'", "L'", "U'", "R'", "F'"]
+    assert solver.population[1].fitness < 1.0
+    assert solver.eval_stats["endgame_hits"] == 1
+
+
+def test_load_or_build_rebuilds_other_tables(tmp_path):
+    path = str(tmp_path / "table.bin")
+    EndgameTable.load_or_build(path, 2).close()
+    table = EndgameTable.load_or_build(path, 3)
+    assert (table.depth, len(table)) == (3, 1195)
+    table.close()
+    table = EndgameTable.load_or_build(path, 3, moves=["R", "R'"])
+    assert table.moves == ["R", "R'"] and len(table) == 4
+    table.close()
+
+
+def test_rejects_files_that_are_not_tables(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"not a table at all")
+    with pytest.raises(ValueError):
+        EndgameTable(str(path))
+
+
+def test_build_merges_runs_spilled_to_disk(tmp_path, monkeypatch):
+    whole = tmp_path / "whole.bin"
+    build_table(str(whole), 3)
+    monkeypatch.setattr(endgame, "_RUN_SIZE", 100)
+    monkeypatch.setattr(endgame, "_READ_SIZE", 7)
+    spilled = tmp_path / "spilled.bin"
+    assert build_table(str(spilled), 3) == 1195
+    assert spilled.read_bytes() == whole.read_bytes()
@@ -0,0 +1,36 @@
+import pygame
+
+from rubiks_solver.export import export_playback, render_indices, PALETTE
+from rubiks_solver.cube import Cube
+
+SCRAMBLE = ["F", "R", "U'"]
+SOLUTION = ["U", "R'", "F'"]
+
+
+def test_export_gif_writes_one_frame_per_move(tmp_path):
+    path = str(tmp_path / "playback.gif")
+    frames = export_playback(path, SCRAMBLE, SOLUTION, size=(120, 100))
+    data = open(path, "rb").read()
+    assert frames == len(SCRAMBLE) + len(SOLUTION) + 1
+    assert data.startswith(b"GIF89a") and data.endswith(b";")
+    assert pygame.image.load(path).get_size() == (120, 100)
+
+
+def test_parallel_export_matches_serial(tmp_path):
+    serial = str(tmp_path / "serial.gif")
+    parallel = str(tmp_path / "parallel.gif")
+    export_playback(serial, SCRAMBLE, SOLUTION, size=(60, 60))
+    export_playback(parallel, SCRAMBLE, SOLUTION, size=(60, 60), workers=2, chunk_size=2)
+    assert open(serial, "rb").read() == open(parallel, "rb").read()
+
+
+def test_export_apng(tmp_path):
+    path = str(tmp_path / "playback.png")
+    export_playback(path, SCRAMBLE, SOLUTION, size=(60, 60), perspective=False)
+    assert pygame.image.load(path).get_size() == (60, 60)
+
+
+def test_render_indices_uses_palette():
+    indices = render_indices(Cube(), (60, 60))
+    assert len(indices) == 60 * 60
+    assert max(indices) < len(PALETTE)
@@ -2,7 +2,7 @@ import pytest
 
 from rubiks_solver.ga import GASolver, Individual
 from rubiks_solver.cube import Cube
-from rubiks_solver.config import ELITE_SIZE
+from rubiks_solver.config import ELITE_SIZE, STAGES_TILES
 
 @pytest.fixture
 def cube():
@@ -79,3 +79,132 @@ def test_get_elites_returns_top_individuals(ga_solver):
     assert len(elites) == ELITE_SIZE
     fitnesses = [ind.fitness for ind in elites]
     assert all(fitnesses[i] >= fitnesses[i + 1] for i in range(len(fitnesses) - 1))
+
+
+def test_macros_are_used_as_genes(cube):
+    solver = GASolver(
+        starting_cube=cube,
+        pop_size=10,
+        crossover_prob=0.8,
+        mutation_prob=1.0,
+        min_chromosome_len=20,
+        max_chromosome_len=30,
+        macros={"sexy": ["R", "U", "R'", "U'"]}
+    )
+    solver.init_population()
+    assert "sexy" in solver.genes
+    assert any("sexy" in ind.chromosome for ind in solver.population)
+    solver.evaluate(target_state=cube.faces, method="correct_tiles")
+    solver.mutate(solver.population)
+    assert all(0 <= ind.fitness <= 1 for ind in solver.population)
+    # Registered on the solver's copy only
+    assert cube.macros == {}
+    assert solver.starting_cube.expand_macros(["sexy"]) == ["R", "U", "R'", "U'"]
+
+
+def test_move_set_defines_genes(cube):
+    solver = GASolver(cube, pop_size=10, crossover_prob=0.8, mutation_prob=1.0, move_set=["R2", "U2", "M2"])
+    solver.init_population()
+    solver.mutate(solver.population)
+    assert all(gene in ("R2", "U2", "M2") for ind in solver.population for gene in ind.chromosome)
+    assert GASolver(cube, 10, 0.8, 0.2).genes == list(cube.quarter_turn_symbols)
+    with pytest.raises(ValueError):
+        GASolver(cube, 10, 0.8, 0.2, move_set=["X"])
+
+
+def test_fitness_is_invariant_to_orientation(cube):
+    solver = GASolver(cube, pop_size=2, crossover_prob=0.8, mutation_prob=0.2)
+    solver.population = [Individual(["Rw", "L'"]), Individual(["x", "y2"])]
+    solver.evaluate(target_state=STAGES_TILES["full_cube"], method="correct_tiles")
+    assert all(ind.fitness == 1.0 for ind in solver.population)
+
+    fixed = GASolver(cube, pop_size=2, crossover_prob=0.8, mutation_prob=0.2, normalize_orientation=False)
+    fixed.population = [Individual(["Rw", "L'"])]
+    fixed.evaluate(target_state=STAGES_TILES["full_cube"], method="correct_tiles")
+    assert fixed.population[0].fitness < 1.0
+
+
+def test_local_search_fixes_single_gene():
+    cube = Cube()
+    cube.shuffle(["R"])
+    solver = GASolver(cube, pop_size=1, crossover_prob=0.8, mutation_prob=0.2)
+    individual = solver.local_search(Individual(["L"]), STAGES_TILES["full_cube"])
+    assert individual.chromosome == ["R'"]
+    assert individual.fitness == 1.0
+
+
+def test_local_search_never_worsens_and_matches_full_replay(cube):
+    cube.shuffle(["R", "U", "F'", "D", "L2"])
+    solver = GASolver(cube, pop_size=5, crossover_prob=0.8, mutation_prob=0.2, min_chromosome_len=8,
+                      max_chromosome_len=12, local_search_elites=1)
+    solver.init_population()
+    solver.evaluate(STAGES_TILES["full_cube"])
+    for individual in solver.population:
+        before = individual.fitness
+        solver.local_search(individual, STAGES_TILES["full_cube"])
+        replay = cube.copy()
+        replay.shuffle(individual.chromosome)
+        assert individual.fitness >= before
+        assert individual.fitness == solver._score_tiles(replay, STAGES_TILES["full_cube"])
+    best_before = max(ind.fitness for ind in solver.population)
+    assert solver.step(STAGES_TILES["full_cube"]).fitness >= best_before
+
+
+def _solver_with_clones(cube, duplicates):
+    solver = GASolver(cube, pop_size=4, crossover_prob=0.8, mutation_prob=0.5, duplicates=duplicates)
+    # "F F" and "F' F'" reach the same state, "R" differs
+    solver.population = [Individual(["F", "F"]), Individual(["F'", "F'"]), Individual(["F", "F"]), Individual(["R"])]
+    return solver
+
+
+def test_duplicate_states_share_fitness(cube):
+    solver = _solver_with_clones(cube, "share")
+    solver.evaluate(target_state=cube.faces, method="correct_tiles")
+    stats = solver.eval_stats
+    assert (stats["population"], stats["unique_states"], stats["duplicates"], stats["endgame_hits"]) == (4, 2, 2, 0)
+    assert stats["eval_time"] >= 0
+    assert solver.population[0].fitness == solver.population[1].fitness == solver.population[2].fitness
+    assert solver.unique_states_history == [2]
+
+
+def test_duplicate_states_penalized(cube):
+    solver = _solver_with_clones(cube, "penalize")
+    solver.evaluate(target_state=cube.faces, method="correct_tiles")
+    first, clone = solver.population[0].fitness, solver.population[1].fitness
+    assert clone == pytest.approx(first * solver.duplicate_penalty)
+
+
+def test_duplicate_states_replaced(cube):
+    solver = _solver_with_clones(cube, "replace")
+    clones = solver.population[1:3]
+    solver.evaluate(target_state={"corners": cube.corners.keys(), "edges": cube.edges.keys()}, method="cubies_position")
+    assert all(c not in solver.population for c in clones)
+    assert len(solver.population) == 4
+    assert all(0 <= ind.fitness <= 1 for ind in solver.population)
+
+
+def test_replacements_are_deduplicated_again(cube):
+    # Only 4 states are reachable with "R": every replacement is checked against them
+    solver = GASolver(cube, pop_size=4, crossover_prob=0.8, mutation_prob=0.5, move_set=["R"],
+                      duplicates="replace")
+    solver.population = [Individual(["R"]) for _ in range(4)]
+    solver.evaluate(target_state=STAGES_TILES["full_cube"], method="correct_tiles")
+    stats = solver.eval_stats
+    assert stats["duplicates"] == 3
+    assert stats["unique_states"] == 4 - stats["duplicates_left"]
+    states = set()
+    for individual in solver.population:
+        replayed = cube.copy()
+        replayed.shuffle(individual.chromosome)
+        states.add(replayed.state_hash)
+    assert len(states) == stats["unique_states"]
+
+
+def test_evaluation_reuses_scratch_cube(ga_solver):
+    ga_solver.evaluate(target_state=STAGES_TILES["full_cube"], method="correct_tiles")
+    fitness = [ind.fitness for ind in ga_solver.population]
+    scratch = ga_solver._scratch[0]
+    ga_solver.evaluate(target_state=STAGES_TILES["full_cube"], method="correct_tiles")
+    assert ga_solver._scratch == [scratch]
+    assert [ind.fitness for ind in ga_solver.population] == fitness
+    assert ga_solver.starting_cube.faces == Cube().faces
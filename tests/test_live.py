@@ -0,0 +1,43 @@
+import time
+
+from rubiks_solver.live import LiveSolver, _worker_cube
+from rubiks_solver.cube import Cube
+
+
+def _wait_until_done(solver, timeout=30.0):
+    deadline = time.monotonic() + timeout
+    while not solver.done and time.monotonic() < deadline:
+        solver.poll()
+        time.sleep(0.01)
+
+
+def test_worker_cube_keeps_state_hash():
+    cube = Cube()
+    cube.shuffle(["F", "R", "U'", "B2"])
+    worker_cube = _worker_cube(cube.to_list())
+    assert worker_cube.faces == cube.faces
+    assert worker_cube.state_hash == cube.state_hash != Cube().state_hash
+
+
+def test_live_solver_streams_best_individual():
+    cube = Cube()
+    cube.shuffle(["F", "R"])
+    solver = LiveSolver(cube, max_generations=3, seed=0)
+    solver.start()
+    _wait_until_done(solver)
+    solver.stop()
+
+    assert solver.done
+    assert solver.latest["generation"] <= 3
+    expected = cube.copy()
+    expected.shuffle(solver.latest["chromosome"])
+    assert solver.best_cube.faces == expected.faces
+
+
+def test_live_solver_can_be_stopped_early():
+    cube = Cube()
+    cube.shuffle(["F", "R", "U", "B"])
+    solver = LiveSolver(cube, max_generations=10**6, seed=0)
+    solver.start()
+    solver.stop()
+    assert solver.done
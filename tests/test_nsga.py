@@ -0,0 +1,50 @@
+import random
+
+import pytest
+
+from rubiks_solver.nsga import dominates, non_dominated_sort, crowding_distance
+from rubiks_solver.ga import GASolver
+from rubiks_solver.cube import Cube
+from rubiks_solver.config import STAGES_TILES
+
+
+def test_non_dominated_sort_fronts():
+    points = [(1.0, -5), (0.5, -2), (0.5, -5), (1.0, -3), (0.25, -1), (0.25, -4)]
+    assert dominates((1.0, -3), (1.0, -5))
+    assert not dominates((1.0, -3), (1.0, -3))
+    assert [sorted(front) for front in non_dominated_sort(points)] == [[1, 3, 4], [0, 5], [2]]
+
+
+def test_crowding_distance_prefers_boundaries():
+    points = [(0.0, -4), (0.5, -3), (0.75, -2), (1.0, -1)]
+    distance = crowding_distance(points, [0, 1, 2, 3])
+    assert distance[0] == distance[3] == float("inf")
+    assert distance[1] == pytest.approx(0.75 + 2 / 3)
+    assert distance[2] == pytest.approx(0.5 + 2 / 3)
+
+
+def test_multi_objective_rejects_local_search():
+    with pytest.raises(ValueError):
+        GASolver(Cube(), 10, 0.8, 0.2, multi_objective=True, local_search_elites=1)
+
+
+def test_multi_objective_pareto_front():
+    cube = Cube()
+    cube.shuffle(["R", "U'", "F"])
+    target = STAGES_TILES["white_cross"]
+    ga_solver = GASolver(cube, 40, 0.8, 0.2, 3, 12, rng=random.Random(5), multi_objective=True)
+    ga_solver.init_population()
+    ga_solver.evaluate(target)
+
+    best_fitness = max(ind.fitness for ind in ga_solver.population)
+    for _ in range(10):
+        best = ga_solver.step(target)
+        assert best.fitness >= best_fitness
+        best_fitness = best.fitness
+    assert len(ga_solver.population) == 40
+
+    front = ga_solver.pareto_front()
+    objectives = [(ind.fitness, -len(ind.chromosome)) for ind in front]
+    assert objectives[0][0] == best_fitness
+    assert objectives == sorted(objectives, reverse=True)
+    assert not any(dominates(a, b) for a in objectives for b in objectives)
@@ -0,0 +1,38 @@
+import random
+
+from rubiks_solver.optimize import build_segment_table, optimize_solution
+from rubiks_solver.cube import Cube
+
+
+def _same_effect(a, b):
+    first, second = Cube(), Cube()
+    first.shuffle(a)
+    second.shuffle(b)
+    return first.faces == second.faces
+
+
+def test_segment_table_is_optimal():
+    table = build_segment_table(2)
+    # identity + 18 single turns + 243 distinct two-move states
+    assert len(table) == 1 + 18 + 243
+    assert all(len(sequence) <= 2 for sequence in table.values())
+
+
+def test_redundant_segments_are_replaced():
+    assert optimize_solution(["R", "U", "U'", "R'"]) == []
+    assert optimize_solution(["R", "R"]) == ["R2"]
+    assert optimize_solution(["F", "R", "U", "R'", "U'", "U", "R", "U'", "R'", "F'"]) == []
+    assert optimize_solution(["L", "R", "L'"]) == ["R"]
+    # Non-face moves without a shorter equivalent are kept
+    assert optimize_solution(["x", "M"]) == ["x", "M"]
+
+
+def test_optimized_solution_has_same_effect():
+    rng = random.Random(0)
+    moves = Cube.quarter_turn_symbols + ("F2", "U2", "M", "x")
+    for _ in range(5):
+        sequence = [rng.choice(moves) for _ in range(60)]
+        optimized = optimize_solution(sequence)
+        assert len(optimized) < len(sequence)
+        assert _same_effect(sequence, optimized)
+        assert optimize_solution(optimized) == optimized
@@ -0,0 +1,108 @@
+import random
+
+import pytest
+
+from rubiks_solver.population import PopulationStore, ArrayGASolver
+from rubiks_solver.cube import Cube
+from rubiks_solver.config import STAGES_TILES
+
+GENES = ["F", "F'", "R", "R'"]
+
+
+def test_store_round_trips_chromosomes():
+    chromosomes = [["F", "R"], [], ["R'", "F'", "F'"]]
+    store = PopulationStore.from_chromosomes(GENES, chromosomes)
+    assert len(store) == 3
+    assert [store.chromosome(i) for i in range(3)] == chromosomes
+    assert list(store.offsets) == [0, 2, 2, 5]
+
+    store.fitness[0], store.fitness[2] = 0.25, 0.5
+    subset = store.gather([2, 0]).concat(store.gather([1]))
+    assert [subset.chromosome(i) for i in range(3)] == [chromosomes[2], chromosomes[0], chromosomes[1]]
+    assert list(subset.fitness) == [0.5, 0.25, 0.0]
+
+
+def test_shared_store_is_visible_when_attached():
+    store = PopulationStore.from_chromosomes(GENES, [["F", "R"], ["R'"]])
+    shared = store.share()
+    try:
+        attached = PopulationStore.attach(shared.name, GENES)
+        assert [attached.chromosome(i) for i in range(2)] == [["F", "R"], ["R'"]]
+        attached.fitness[1] = 0.75
+        attached.close()
+        assert shared.fitness[1] == 0.75
+    finally:
+        shared.close()
+        shared.unlink()
+
+
+@pytest.mark.parametrize("selection", ["roulette", "tournament", "exp_rank"])
+def test_array_solver_runs_generations(selection):
+    cube = Cube()
+    cube.shuffle(["R", "U", "F'"])
+    solver = ArrayGASolver(cube, 50, 0.8, 0.5, rng=random.Random(3))
+    solver.init_population()
+    solver.evaluate(STAGES_TILES["full_cube"])
+    first = solver.best().fitness
+    for _ in range(3):
+        best = solver.step(STAGES_TILES["full_cube"], selection=selection)
+        assert len(solver.store) == 50
+    # Elites are kept, so the best fitness never drops
+    assert best.fitness >= first
+    assert all(gene in solver.genes for i in range(50) for gene in solver.store.chromosome(i))
+
+
+def test_parallel_evaluation_matches_serial():
+    cube = Cube()
+    cube.shuffle(["R", "U", "F'"])
+    serial = ArrayGASolver(cube, 40, 0.8, 0.5, rng=random.Random(5))
+    serial.init_population()
+    serial.evaluate(STAGES_TILES["full_cube"])
+
+    parallel = ArrayGASolver(cube, 40, 0.8, 0.5, rng=random.Random(5), workers=2)
+    parallel.init_population()
+    try:
+        parallel.evaluate(STAGES_TILES["full_cube"])
+    finally:
+        parallel.close()
+    assert list(parallel.store.fitness) == list(serial.store.fitness)
+
+
+def test_refill_writes_into_the_shared_block():
+    store = PopulationStore.from_chromosomes(GENES, [["F", "R"], ["R'"]]).share(capacity=8)
+    try:
+        name = store.name
+        store.refill([bytes([0, 1, 2]), bytes([3])])
+        assert store.name == name
+        attached = PopulationStore.attach(name, GENES)
+        assert [attached.chromosome(i) for i in range(2)] == [["F", "F'", "R"], ["R'"]]
+        attached.close()
+
+        # Outgrowing the capacity moves the store to a larger block
+        store.refill([bytes(10), bytes(1)])
+        assert store.name != name
+        assert [len(store.codes(i)) for i in range(2)] == [10, 1]
+    finally:
+        store.close()
+        store.unlink()
+
+
+def test_parallel_generations_match_serial_in_one_block():
+    cube = Cube()
+    cube.shuffle(["R", "U", "F'"])
+    serial = ArrayGASolver(cube, 40, 0.8, 0.5, rng=random.Random(7))
+    parallel = ArrayGASolver(cube, 40, 0.8, 0.5, rng=random.Random(7), workers=2)
+    try:
+        for solver in (serial, parallel):
+            solver.init_population()
+            solver.evaluate(STAGES_TILES["full_cube"])
+        name = parallel.store.name
+        for _ in range(3):
+            serial.step(STAGES_TILES["full_cube"])
+            parallel.step(STAGES_TILES["full_cube"])
+            assert list(parallel.store.fitness) == list(serial.store.fitness)
+        assert parallel.store.name == name
+    finally:
+        parallel.close()
+    assert parallel.store.shm is None
+    assert len(parallel.store) == 40
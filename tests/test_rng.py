@@ -0,0 +1,41 @@
+import random
+
+from rubiks_solver.rng import derive_seed, spawn_rngs
+from rubiks_solver.ga import GASolver
+from rubiks_solver.cube import Cube
+
+
+def _run(rng):
+    cube = Cube()
+    cube.shuffle(["F", "R", "U"])
+    solver = GASolver(cube, pop_size=20, crossover_prob=0.8, mutation_prob=0.5,
+                      min_chromosome_len=3, max_chromosome_len=8, rng=rng)
+    solver.init_population()
+    solver.evaluate(target_state=Cube().faces)
+    for _ in range(5):
+        solver.step(target_state=Cube().faces, selection="tournament")
+    return [ind.chromosome for ind in solver.population]
+
+
+def test_spawned_streams_are_independent_and_reproducible():
+    first = [rng.random() for rng in spawn_rngs(42, 4)]
+    second = [rng.random() for rng in spawn_rngs(42, 4)]
+    assert first == second
+    assert len(set(first)) == 4
+    assert derive_seed(42, 0) != derive_seed(43, 0)
+
+
+def test_ga_run_is_reproducible_with_explicit_rng():
+    assert _run(random.Random(7)) == _run(random.Random(7))
+    assert _run(random.Random(7)) != _run(random.Random(8))
+
+
+def test_init_population_avoids_opposite_moves():
+    cube = Cube()
+    solver = GASolver(cube, pop_size=50, crossover_prob=0.8, mutation_prob=0.5,
+                      min_chromosome_len=10, max_chromosome_len=20, rng=random.Random(0))
+    solver.init_population()
+    for ind in solver.population:
+        assert 10 <= len(ind.chromosome) <= 20
+        for left, right in zip(ind.chromosome, ind.chromosome[1:]):
+            assert cube.opposite_move[left] != right
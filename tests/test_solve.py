@@ -0,0 +1,91 @@
+import threading
+
+import pytest
+
+from rubiks_solver.solve import iter_solve, solve, apply_stage_solution
+from rubiks_solver.cube import Cube
+from rubiks_solver.config import SHUFFLE_SEQUENCE, STAGES_TILES
+
+
+def _scrambled():
+    cube = Cube()
+    cube.shuffle(SHUFFLE_SEQUENCE)
+    return cube
+
+
+def test_solve_returns_replayable_solution():
+    cube = Cube()
+    cube.shuffle(["R", "U'", "F"])
+    result = solve(cube, stages=["white_cross"], eval_method="correct_tiles", seed=1)
+    assert result["done"] and result["solved"] and result["reason"] == "solved"
+
+    cube.shuffle(result["solution"])
+    target = STAGES_TILES["white_cross"]
+    assert all(t is None or t == tile
+               for face, grid in target.items()
+               for target_row, row in zip(grid, cube.faces[face])
+               for t, tile in zip(target_row, row))
+
+
+def test_optimized_solution_is_not_longer():
+    cube = Cube()
+    cube.shuffle(["R", "U'", "F"])
+    plain = solve(cube, stages=["white_cross"], eval_method="correct_tiles", seed=1)
+    optimized = solve(cube, stages=["white_cross"], eval_method="correct_tiles", seed=1, optimize=True)
+    assert len(optimized["solution"]) <= len(plain["solution"])
+
+    first, second = cube.copy(), cube.copy()
+    first.shuffle(plain["solution"])
+    second.shuffle(optimized["solution"])
+    assert first.faces == second.faces
+
+
+def test_intermediate_results_improve():
+    updates = list(iter_solve(_scrambled(), stages=["first_layer"], max_generations=30, seed=2))
+    fitness = [update["fitness"] for update in updates]
+    assert fitness == sorted(fitness)
+    assert [update["done"] for update in updates] == [False] * (len(updates) - 1) + [True]
+
+
+def test_deadline_bounds_latency():
+    result = solve(_scrambled(), deadline=0.3, stages=["full_cube"], seed=3)
+    assert result["reason"] == "deadline"
+    assert not result["solved"]
+    assert result["elapsed"] < 1.0
+    assert result["solution"]
+
+
+def test_cancel_from_another_thread():
+    cancel = threading.Event()
+    threading.Timer(0.2, cancel.set).start()
+    result = solve(_scrambled(), stages=["full_cube"], cancel=cancel, seed=4)
+    assert result["reason"] == "cancelled"
+    assert result["elapsed"] < 1.0
+
+
+def test_unknown_stage_raises():
+    with pytest.raises(ValueError):
+        solve(Cube(), stages=["no_such_stage"])
+    with pytest.raises(ValueError):
+        solve(Cube(), stages=[])
+
+
+def test_stopped_before_setting_up_a_stage():
+    cancel = threading.Event()
+    cancel.set()
+    result = solve(_scrambled(), stages=["white_cross", "full_cube"], cancel=cancel, seed=5)
+    assert result["reason"] == "cancelled"
+    assert result["stage"] == "white_cross" and result["solution"] == []
+
+    result = solve(_scrambled(), deadline=0.0, stages=["full_cube"], seed=5)
+    assert result["reason"] == "deadline" and result["generation"] == 0
+
+
+def test_stage_solution_is_applied_and_reoriented():
+    cube = Cube()
+    moves = apply_stage_solution(cube, ["M"])
+    assert moves[0] == "M" and len(moves) > 1
+    assert cube.faces["U"][1][1] == Cube().faces["U"][1][1]
+    replayed = Cube()
+    replayed.shuffle(moves)
+    assert replayed.faces == cube.faces
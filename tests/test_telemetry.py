@@ -0,0 +1,38 @@
+import pytest
+
+from rubiks_solver.telemetry import Telemetry, read_records
+from rubiks_solver.plot import render_fitness_plot
+
+
+@pytest.mark.parametrize("extension", ["csv", "jsonl"])
+def test_sampled_records_round_trip(tmp_path, extension):
+    path = str(tmp_path / f"telemetry.{extension}")
+    with Telemetry(path, sample_every=3, quiet=True, buffer_size=2) as telemetry:
+        for generation in range(8):
+            fitness = [generation / 10, 0.0]
+            telemetry.record(generation, fitness, {"unique_states": 2, "population": 2, "eval_time": 0.5},
+                             force=generation == 7, stage="white_cross")
+
+    records = read_records(path)
+    assert [record["generation"] for record in records] == [0, 3, 6, 7]
+    assert records[1] == {
+        "run": 0, "stage": "white_cross", "generation": 3, "best_fitness": 0.3, "avg_fitness": 0.15,
+        "diversity": pytest.approx(0.15), "unique_states": 2, "population": 2, "eval_time": 0.5,
+    }
+
+
+def test_quiet_mode_prints_nothing(capsys):
+    Telemetry(quiet=True).record(0, [0.5])
+    assert capsys.readouterr().out == ""
+    Telemetry().record(0, [0.5])
+    assert capsys.readouterr().out.startswith("Generation 0: Best fitness = 0.5000")
+
+
+def test_fitness_plot_is_rendered(tmp_path):
+    records = [
+        {"run": 0, "stage": "", "generation": g, "best_fitness": g / 10, "avg_fitness": g / 20}
+        for g in range(10)
+    ]
+    path = tmp_path / "plot.png"
+    render_fitness_plot(records, str(path), size=(400, 300))
+    assert path.read_bytes().startswith(b"\x89PNG")
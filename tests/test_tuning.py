@@ -0,0 +1,44 @@
+import pytest
+
+from rubiks_solver.tuning import sample_configs, run_trial, successive_halving
+from rubiks_solver.config import TUNING_SPACE
+
+
+@pytest.fixture
+def small_space():
+    return {
+        "pop_size": [10, 20],
+        "crossover_prob": [0.8],
+        "mutation_prob": [0.2, 0.5],
+        "elite_size": [2],
+        "chromosome_len": [(1, 3)],
+        "selection": ["roulette", "tournament"],
+    }
+
+
+def test_sample_configs_are_distinct_and_reproducible():
+    configs = sample_configs(TUNING_SPACE, 10, seed=1)
+    assert len(configs) == 10
+    assert len({tuple(c.values()) for c in configs}) == 10
+    assert configs == sample_configs(TUNING_SPACE, 10, seed=1)
+
+
+def test_sample_configs_capped_by_space_size(small_space):
+    assert len(sample_configs(small_space, 100, seed=0)) == 8
+
+
+def test_run_trial_solves_trivial_scramble(small_space):
+    config = sample_configs(small_space, 1, seed=0)[0]
+    result = run_trial(config, ["F"], "white_cross", 200, seed=0)
+    assert result["solved"]
+    assert result["best_fitness"] == 1.0
+
+
+def test_successive_halving_ranks_all_configs(small_space):
+    configs = sample_configs(small_space, 4, seed=0)
+    summaries = successive_halving(
+        configs, ["F", "R"], ["white_cross"], min_generations=2, max_generations=4,
+        eta=2, repeats=1, workers=2, seed=0
+    )
+    assert len(summaries) == 4
+    assert summaries[0]["budget"] >= summaries[-1]["budget"]